@@ -1,9 +1,14 @@
 import bpy
 
+from .bake_library import PBAKER_OT_bake_library
 from .bakelist import *
 from .baker import PBAKER_OT_bake
+from .baker_modal import PBAKER_OT_bake_modal
+from .baker_no_undo import PBAKER_OT_bake_no_undo
 from .combinelist import *
+from .final_pass import PBAKER_OT_use_final_images
 from .panel import *
+from .plan import PBAKER_OT_plan
 from .prefs import PBAKER_prefs
 from .presets import *
 from .settings import PBAKER_settings
@@ -21,6 +26,11 @@ bl_info = {
 
 classes = (
     PBAKER_OT_bake,
+    PBAKER_OT_bake_modal,
+    PBAKER_OT_bake_no_undo,
+    PBAKER_OT_bake_library,
+    PBAKER_OT_use_final_images,
+    PBAKER_OT_plan,
     PBAKER_prefs,
     PBAKER_settings,
     PBAKER_UL_List,
@@ -55,6 +65,8 @@ classes = (
     PBAKER_PT_BakeList,
     PBAKER_PT_AdditionalBakeTypes,
     PBAKER_PT_OutputSettings,
+    PBAKER_PT_Draft,
+    PBAKER_PT_Performance,
     PBAKER_PT_SelectedToActiveSettings,
     PBAKER_PT_NewMaterial,
     PBAKER_PT_SelectUVMap,
@@ -63,6 +75,7 @@ classes = (
     PBAKER_PT_CombineChannels,
     PBAKER_PT_DuplicateObjects,
     PBAKER_PT_PrefixSuffixSettings,
+    PBAKER_PT_BackgroundWorkers,
     PBAKER_PT_Misc,
 )
 
@@ -0,0 +1,44 @@
+import os
+
+import bpy
+
+from .worker.library import bake_library
+from .worker.manifest import get_manifest_from_scene
+
+
+class PBAKER_OT_bake_library(bpy.types.Operator):
+    """Bake all blend files in library directory with background workers"""
+
+    bl_idname = "object.principled_baker_bake_library"
+    bl_label = "Bake Library"
+
+    def execute(self, context):
+        settings = context.scene.principled_baker_settings
+
+        directory = bpy.path.abspath(settings.library_path)
+        if not settings.library_path or not os.path.isdir(directory):
+            self.report({'ERROR'}, "No library directory.")
+            return {'CANCELLED'}
+
+        if not settings.library_collection and not settings.library_object_property:
+            self.report({'ERROR'}, "Set a collection or an object property.")
+            return {'CANCELLED'}
+
+        manifest = get_manifest_from_scene(context.scene)
+        manifest["settings"]["use_background_workers"] = False
+        if settings.library_collection:
+            manifest["collections"] = [settings.library_collection]
+        if settings.library_object_property:
+            manifest["object_property"] = settings.library_object_property
+
+        summary = bake_library(directory, manifest,
+                               worker_count=settings.worker_count,
+                               threads=settings.worker_threads,
+                               retries=settings.worker_retries)
+
+        self.report({'INFO'}, "Library: {0} baked, {1} skipped, {2} failed.".format(
+            len(summary["baked"]), len(summary["skipped"]), len(summary["failed"])))
+        for rel_path, error in summary["errors"].items():
+            self.report({'ERROR'}, "Failed: '{0}'\n{1}".format(rel_path, error))
+
+        return {'FINISHED'}
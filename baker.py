@@ -1,28 +1,49 @@
+import json
+import os
+import shutil
+import time
 from pathlib import Path
 
 import bpy
-
+import numpy as np
+from bpy.props import BoolProperty, StringProperty
+
+from .budget import degrade, get_budget_scale
+from .cache.fingerprint import (get_job_fingerprint, get_object_fingerprint,
+                                get_scene_fingerprint)
+from .cache.index import (add_to_cache, find_cached_file, read_cache,
+                          write_cache)
+from .cache.journal import (get_file_hash, get_journal_path, get_unit_key,
+                            is_unit_intact, new_journal, read_journal,
+                            remove_journal, write_journal)
 from .check_path_access import check_path_access
-from .const import (ALPHA_NODES, IMAGE_FILE_FORMAT_ENDINGS, MATERIAL_TAG,
-                    MATERIAL_TAG_VERTEX, NODE_INPUTS, NODE_INPUTS_SORTED,
-                    NODE_TAG, NORMAL_INPUTS)
+from .const import (ALPHA_NODES, DENOISE_JOBS, IMAGE_FILE_FORMAT_ENDINGS,
+                    LIT_JOBS, MATERIAL_TAG, MATERIAL_TAG_VERTEX, NODE_INPUTS,
+                    NODE_INPUTS_SORTED, NODE_TAG, NORMAL_INPUTS)
 from .duplicate import *
+from .final_pass import FINAL_MANIFEST_FILE_NAME, FINAL_RESULT_FILE_NAME
 from .functions import (get_bake_type_by, get_only_meshes, is_list_equal,
                         remove_not_allowed_signs)
 from .image.combine import combine_channels_to_image, get_combined_images
+from .image.compare import get_rmse
+from .image.denoise import denoise_pixels
 from .image.invert import get_invert_image
+from .image.margin import dilate
+from .image.memory import free_image, free_images_over_budget
+from .image.pixels import get_pixels, new_data_image, set_pixels
 from .image.prefix import get_image_prefix
 from .image.save import save_image
 from .image.save_as import save_image_as
 from .image.suffix import get_image_suffix
 from .joblist import (get_joblist_from_objects,
-                      get_vertex_colors_to_bake_from_objects)
+                      get_vertex_colors_to_bake_from_objects, split_job_key)
+from .linked_duplicates import group_linked_duplicates
 from .material.add_images import add_images_to_material
 from .material.add_temp_material import add_temp_material
 from .material.delete_tagged_materials import delete_tagged_materials
 from .material.has_material import has_material
 from .material.new import new_material
-from .nodes.delete_tagged import delete_tagged_nodes_in_object
+from .nodes.delete_tagged import delete_bake_image_nodes, delete_tagged_nodes_in_object
 from .nodes.find import find_node_by_type
 from .nodes.new import (create_bake_image_nodes, new_image_node,
                         new_mixrgb_node, new_pb_emission_node,
@@ -32,13 +53,80 @@ from .nodes.outputs import (deactivate_material_outputs, get_active_output,
                             get_active_outputs, get_all_material_outputs,
                             set_material_outputs_target_to_all)
 from .nodes.principled_node import get_principled_node_values
+from .nodes.stochastic import is_stochastic_node_tree
 from .prepare.objects import (prepare_objects_for_bake,
                               prepare_objects_for_bake_matid,
                               prepare_objects_for_bake_vertex_color,
                               prepare_objects_for_bake_wireframe)
-from .set_samples import set_samples
+from .prepare.freeze import (freeze_object, has_active_modifiers,
+                             unfreeze_object)
+from .prepare.partition import (get_face_regions, get_overlapping_objects,
+                                get_region_bounds, new_region_object,
+                                remove_region_object)
+from .prepare.scene import (get_occluders, new_isolated_scene,
+                            remove_isolated_scene, set_isolated_scene_objects,
+                            sync_isolated_scene_settings)
+from .pairs import get_pairs
+from .profiles import apply_profile, get_profile_name, restore_profile
+from .report import get_peak_memory, write_report
+from .scheduler import get_job_signature, schedule_jobs, schedule_objects
+from .set_samples import get_samples, set_samples
 from .uv.project import *
+from .uv.atlas import ATLAS_UV_MAP_NAME, new_atlas_uv_maps, remove_atlas_uv_maps
 from .uv.select import *
+from .uv.texel_density import get_auto_resolution
+from .uv.udim import (find_tile_files, get_tile_file_name, get_tile_number,
+                      get_tile_offset, get_udim_tiles, offset_uvs, parse_tiles)
+from .worker.job_queue import (connect, enqueue, get_queue_file, get_units,
+                               release_units, remove_queue_file)
+from .worker.shard import get_object_cost, split_into_shards
+from .worker.manifest import get_manifest_from_scene
+from .worker.spawn import (iter_workers, remove_worker_file, save_worker_file,
+                           start_worker)
+
+MIN_DRAFT_RESOLUTION = 16
+
+# bake cache entry of images degraded by the time budget
+DEGRADED_FINGERPRINT = "degraded"
+
+# settings changing baked images. part of the bake cache fingerprint
+FINGERPRINT_SETTINGS = (
+    "use_bake_profiles",
+    "auto_smooth",
+    "use_deterministic_samples", "deterministic_samples",
+    "use_denoise", "denoise_samples",
+    "use_convergence", "convergence_start_samples", "convergence_max_samples", "convergence_threshold",
+    "use_freeze_meshes",
+    "use_isolated_scene", "isolation_radius",
+    "use_partition", "partition_regions",
+)
+
+# settings for the final pass of a draft. new materials are made by the draft
+FINAL_PASS_SETTINGS = {
+    "use_background_workers": False,
+    "make_new_material": False,
+    "add_new_material": False,
+    "duplicate_objects": False,
+    "join_duplicate_objects": False,
+}
+
+# settings for background workers. new materials etc. are made by the caller
+WORKER_SETTINGS = {
+    "bake_mode": 'BATCH',
+    "use_background_workers": False,
+    "make_new_material": False,
+    "add_new_material": False,
+    "duplicate_objects": False,
+    "join_duplicate_objects": False,
+}
+
+# settings for background workers baking high/low pairs
+PAIR_WORKER_SETTINGS = dict(WORKER_SETTINGS, bake_mode='SELECTED_TO_ACTIVE',
+                            use_pairs=True, pair_output='PARTS')
+
+
+class BakeCancelled(Exception):
+    """Raised by bake steps, if baking is not possible. Errors are reported before."""
 
 
 class PBAKER_OT_bake(bpy.types.Operator):
@@ -47,6 +135,21 @@ class PBAKER_OT_bake(bpy.types.Operator):
     bl_description = "bake all inputs of a Principled BSDF to image textures"
     bl_options = {'REGISTER', 'UNDO'}
 
+    # background workers write baked image paths to this file
+    result_file: StringProperty(options={'HIDDEN', 'SKIP_SAVE'})
+
+    # bake only the units of a plan exported by the Bake Plan operator
+    plan_file: StringProperty(options={'HIDDEN', 'SKIP_SAVE'})
+
+    # journal of finished images to resume an interrupted bake
+    use_journal: BoolProperty(default=True, options={'HIDDEN', 'SKIP_SAVE'})
+
+    draft: BoolProperty(
+        name="Draft",
+        description="Bake a quick preview with lower resolution and samples into the draft folder",
+        default=False,
+        options={'SKIP_SAVE'})
+
     def load_image_by(self, image_file_name) -> bpy.types.Image:
         """:returns: Reference to image."""
 
@@ -54,41 +157,306 @@ class PBAKER_OT_bake(bpy.types.Operator):
         image = bpy.data.images.load(path)
         return image
 
-    def skip_job_if_file_exists(self, obj):
-        if self.settings.use_overwrite:
-            return False
+    def is_file_existing(self, obj):
+        """:returns: True, if image file of current job exists."""
 
         img_file_name = self.get_image_file_name(obj.name)
-        tex_dir = Path(self.texture_folder)
+        tex_dir = self.get_texture_dir()
         path = Path(bpy.path.abspath(self.settings.file_path)) / \
             tex_dir / img_file_name
+        if self.udim_tiles:
+            return all((path.parent / get_tile_file_name(path.name, tile)).is_file()
+                       for tile in self.udim_tiles)
+        return path.is_file()
+
+    def get_texture_dir(self):
+        """:returns: Texture folder (in draft folder for drafts) relative to file path."""
+
+        if self.draft:
+            return Path(self.settings.draft_folder) / self.texture_folder
+        return Path(self.texture_folder)
+
+    def skip_job_if_not_planned(self, obj):
+        """Skip job, if there is a bake plan without it.
+        Planned jobs marked "load" were baked elsewhere. Their images are loaded.
+        """
+
+        if self.planned_units is None:
+            return False
+
+        key = (obj.name, self.jobname, self.suffix_extension)
+        if key not in self.planned_units:
+            return True
+        if self.planned_units[key]:
+            self.load_existing_image(obj)
+            return True
+        return False
+
+    def load_existing_image(self, obj):
+        """Load image of current job for new material."""
+
+        img_file_name = self.get_image_file_name(obj.name)
+        image = self.load_image_by(img_file_name)
+        if not self.jobname in {'Color', 'Diffuse'}:
+            image.colorspace_settings.name = 'Non-Color'
+        self.new_images[self.jobname + self.suffix_extension] = image
+
+    def get_abs_image_file_path(self, obj):
+        return bpy.path.abspath(self.get_image_file_path(self.get_image_file_name(obj.name)))
+
+    def skip_job_if_file_exists(self, obj):
+        # drafts are always overwritten
+        if self.draft:
+            return False
 
-        if path.is_file():
+        path = self.get_abs_image_file_path(obj)
+
+        if self.settings.use_bake_cache:
+            if self.skip_job_if_cached(obj):
+                return True
+            # outdated images of earlier bakes are always re-baked
+            if os.path.relpath(path, self.cache_dir) in self.bake_cache:
+                return False
+
+        # image of an interrupted bake may be half-written
+        if path == self.unfinished_path:
+            return False
+
+        if self.settings.use_overwrite:
+            return False
+
+        if self.is_file_existing(obj):
             self.report({'INFO'}, "baking skipped for '{0}'. File exists.".format(
                 self.get_image_file_name(obj.name)))
+            self.load_existing_image(obj)
+            return True
+        return False
 
-            # load image for new material
-            image = self.load_image_by(img_file_name)
-            if not self.jobname in {'Color', 'Diffuse'}:
-                image.colorspace_settings.name = 'Non-Color'
-            self.new_images[self.jobname] = image
+    # -------------------------------------------------------------------------
+    # BAKE CACHE
+    # -------------------------------------------------------------------------
+    def get_fingerprint(self, bake_objects):
+        """:returns: Hash of current job by materials, meshes, UVs and settings.
+        Lit jobs include lights, world and all render visible objects.
+        """
 
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        for obj in bake_objects:
+            if obj.name not in self.object_fingerprints:
+                self.object_fingerprints[obj.name] = get_object_fingerprint(
+                    obj, depsgraph)
+
+        job_settings = {
+            "job": self.jobname,
+            "subjob": self.suffix_extension,
+            "bake_type": get_bake_type_by(self.jobname),
+            "bake_mode": self.settings.bake_mode,
+            "resolution": self.get_resolution(),
+            "samples": get_samples(self.jobname),
+            "file_format": self.settings.file_format,
+            "color_mode": self.get_color_mode(self.jobname),
+            "color_depth": self.settings.color_depth,
+            "margin": self.render_settings.margin,
+            "normal_space": self.render_settings.normal_space,
+            "normal_swizzle": [self.render_settings.normal_r,
+                               self.render_settings.normal_g,
+                               self.render_settings.normal_b],
+            "pass_filter": [self.render_settings.use_pass_direct,
+                            self.render_settings.use_pass_indirect,
+                            self.render_settings.use_pass_color],
+        }
+        if self.settings.bake_mode == 'SELECTED_TO_ACTIVE':
+            cage_object = self.render_settings.cage_object
+            job_settings["cage"] = [self.render_settings.use_cage,
+                                    self.render_settings.cage_extrusion,
+                                    cage_object.name if cage_object else ""]
+        if self.udim_tiles:
+            job_settings["udim_tiles"] = self.udim_tiles
+        for name in FINGERPRINT_SETTINGS:
+            job_settings[name] = getattr(self.settings, name)
+
+        # lights, world and surrounding objects. the same for all jobs of a run
+        if self.jobname in LIT_JOBS:
+            if not self.scene_fingerprint:
+                self.scene_fingerprint = get_scene_fingerprint(
+                    bpy.context.view_layer, bpy.context.scene.world, depsgraph)
+            job_settings["scene"] = self.scene_fingerprint
+
+        return get_job_fingerprint(
+            [self.object_fingerprints[obj.name] for obj in bake_objects], job_settings)
+
+    def skip_job_if_cached(self, obj):
+        """Skip job, if an intact image was baked with the same fingerprint.
+        An image of a renamed object is copied to the new file name.
+        """
+
+        path = self.get_abs_image_file_path(obj)
+
+        # first UDIM tile has the job fingerprint. see add_to_bake_cache()
+        copies = []
+        for tile in self.udim_tiles[1:] + [None]:
+            tile_path = get_tile_file_name(path, tile) if tile else path
+            fingerprint = self.get_tile_fingerprint(tile)
+            rel_path = find_cached_file(self.cache_dir, self.bake_cache, fingerprint, tile_path)
+            if rel_path is None:
+                return False
+            copies.append((os.path.join(self.cache_dir, rel_path), tile_path, fingerprint))
+
+        copies = [(src, dst, fingerprint) for src, dst, fingerprint in copies
+                  if not os.path.abspath(src) == os.path.abspath(dst)]
+        for cached_path, tile_path, fingerprint in copies:
+            os.makedirs(os.path.dirname(tile_path), exist_ok=True)
+            shutil.copyfile(cached_path, tile_path)
+            add_to_cache(self.cache_dir, self.bake_cache, tile_path, fingerprint)
+        if copies:
+            write_cache(self.cache_dir, self.bake_cache)
+
+        self.report({'INFO'}, "baking skipped for '{0}'. Unchanged since last bake.".format(
+            self.get_image_file_name(obj.name)))
+        self.load_existing_image(obj)
+        return True
+
+    def get_tile_fingerprint(self, tile) -> str:
+        """:returns: Fingerprint of UDIM tile of current job. Job fingerprint for None."""
+
+        return f"{self.fingerprint}.{tile}" if tile else self.fingerprint
+
+    def add_to_bake_cache(self, image):
+        if not self.settings.use_bake_cache:
+            return
+        # images degraded by the time budget match no job, so they are baked again next time
+        if self.job_degraded:
+            self.fingerprint = DEGRADED_FINGERPRINT
+        path = bpy.path.abspath(image.filepath)
+        for tile in self.udim_tiles[1:]:
+            add_to_cache(self.cache_dir, self.bake_cache,
+                         get_tile_file_name(path, tile), self.get_tile_fingerprint(tile))
+        add_to_cache(self.cache_dir, self.bake_cache, path, self.fingerprint)
+        write_cache(self.cache_dir, self.bake_cache)
+
+    # -------------------------------------------------------------------------
+    # TIME BUDGET
+    # -------------------------------------------------------------------------
+    def apply_time_budget(self, obj, bake_objects):
+        """Lower samples and resolution of current job to meet the time budget.
+        Must be called after set_samples()!
+        """
+
+        self.job_resolution = 0
+        self.job_degraded = False
+        if not self.settings.use_time_budget:
+            return
+
+        samples = bpy.context.scene.cycles.samples
+        resolution = self.get_resolution()
+        polycount = sum(len(o.data.polygons) for o in bake_objects)
+
+        seconds_per_cost = self.bake_seconds / self.bake_cost if self.bake_cost else None
+        self.budget_scale = get_budget_scale(
+            seconds_left=self.budget_deadline - time.time(),
+            seconds_per_cost=seconds_per_cost,
+            nominal_cost=polycount * resolution * resolution * samples,
+            units_left=self.units_count - self.units_passed + 1)
+
+        new_samples, new_resolution = degrade(samples, resolution, self.budget_scale)
+        if (new_samples, new_resolution) != (samples, resolution):
+            bpy.context.scene.cycles.samples = new_samples
+            self.job_resolution = new_resolution
+            self.job_degraded = True
+            self.degraded_objects.add(obj.name)
+            self.bake_report["Time Budget"].append("{0} '{1}{2}': samples {3} -> {4}, resolution {5} -> {6}".format(
+                obj.name, self.jobname, self.suffix_extension,
+                samples, new_samples, resolution, new_resolution))
+
+        self.job_cost = polycount * new_resolution * new_resolution * new_samples
+
+    def add_bake_time(self, seconds):
+        """Measure throughput for the time budget."""
+
+        self.bake_seconds += seconds
+        self.bake_cost += self.job_cost
+
+    def is_skipped_by_budget(self, obj_name, name):
+        """Optional jobs (Glossiness, Combine) are skipped, if the time budget is exceeded
+        or images of the object were degraded.
+        """
+
+        if not self.settings.use_time_budget:
+            return False
+        if self.budget_scale < 1 or obj_name in self.degraded_objects:
+            self.bake_report["Time Budget"].append(f"{obj_name}: {name} skipped")
             return True
         return False
 
-    def get_image_file_name(self, object_name):
-        prefix = get_image_prefix(object_name)
+    # -------------------------------------------------------------------------
+    # JOURNAL
+    # -------------------------------------------------------------------------
+    def skip_job_if_journaled(self, obj):
+        """Resume: skip job, if finished before an interruption and image is intact."""
+
+        if not self.settings.use_resume:
+            return False
+
+        key = get_unit_key(obj.name, self.jobname, self.suffix_extension)
+        if not is_unit_intact(self.journal, key):
+            self.journal["done"].pop(key, None)
+            return False
+
+        self.report({'INFO'}, "baking skipped for '{0}'. Finished before interruption.".format(
+            self.get_image_file_name(obj.name)))
+        self.load_existing_image(obj)
+        return True
+
+    def start_journal_unit(self, image):
+        if not self.use_journal:
+            return
+        self.journal["started"] = bpy.path.abspath(image.filepath)
+        write_journal(self.journal_path, self.journal)
+
+    def finish_journal_unit(self, obj, image):
+        if not self.use_journal:
+            return
+        path = bpy.path.abspath(image.filepath)
+        key = get_unit_key(obj.name, self.jobname, self.suffix_extension)
+        # images degraded by the time budget are baked again on resume
+        if not self.job_degraded:
+            self.journal["done"][key] = {"path": path, "hash": get_file_hash(path)}
+        self.journal["started"] = None
+        write_journal(self.journal_path, self.journal)
+
+    def clean_leftovers(self, objects):
+        """Remove temporary nodes and materials left behind by an interrupted bake."""
+
+        for obj in objects:
+            delete_tagged_materials(obj, MATERIAL_TAG_VERTEX)
+            delete_tagged_nodes_in_object(obj)
+
+    def get_image_file_name(self, object_name, prefix_object_name=None):
+        """prefix_object_name: Object for the image prefix (eg. of a texture set). Default: object_name"""
+
+        prefix = get_image_prefix(prefix_object_name or object_name)
         name = object_name if self.settings.use_object_name else ""
         suffix = get_image_suffix(self.jobname)
         if self.jobname == "Vertex Color":
             suffix += self.suffix_extension
         ending = IMAGE_FILE_FORMAT_ENDINGS[self.settings.file_format]
-        img_name = f"{prefix}{name}{suffix}.{ending}"
+        img_name = f"{prefix}{name}{suffix}.{self.get_udim_tile_name()}{ending}"
         return img_name
 
+    def get_combined_image_file_name(self, object_name, combi):
+        prefix = get_image_prefix(object_name)
+        name = object_name if self.settings.use_object_name else ""
+        ending = IMAGE_FILE_FORMAT_ENDINGS[self.settings.file_format]
+        return f"{prefix}{name}{combi.suffix}.{self.get_udim_tile_name()}{ending}"
+
+    def get_udim_tile_name(self) -> str:
+        """:returns: Tile number of current UDIM tile with dot, eg. "1002." Empty string without UDIM tiles."""
+
+        return f"{self.udim_tile}." if self.udim_tiles else ""
+
     def get_image_file_path(self, image_file_name):
         img_file_name = remove_not_allowed_signs(image_file_name)
-        tex_dir = Path(self.texture_folder)
+        tex_dir = self.get_texture_dir()
         if self.settings.file_path.startswith("//"):
             rel_path = bpy.path.relpath(self.settings.file_path)
             path = rel_path + str(tex_dir / img_file_name)
@@ -97,6 +465,33 @@ class PBAKER_OT_bake(bpy.types.Operator):
             path = Path(abs_path) / tex_dir / img_file_name
         return str(path)
 
+    def get_resolution(self) -> int:
+        # lowered by time budget
+        if self.job_resolution:
+            return self.job_resolution
+
+        if self.settings.resolution == 'AUTO':
+            resolution = self.object_resolution or int(self.settings.auto_resolution_max)
+        elif self.settings.resolution == 'CUSTOM':
+            resolution = int(self.settings.custom_resolution)
+        else:
+            resolution = int(self.settings.resolution)
+
+        if self.draft:
+            resolution = max(MIN_DRAFT_RESOLUTION, resolution // int(self.settings.draft_scale))
+        return resolution
+
+    def set_auto_resolution(self, object_name, objects):
+        """Resolution of images of object_name by texel density of objects."""
+
+        self.object_resolution = 0
+        if not self.settings.resolution == 'AUTO':
+            return
+
+        self.object_resolution, area, uv_area = get_auto_resolution(objects)
+        self.bake_report["Resolution"].append("{0}: {1} ({2:.3g} m², UV area {3:.0%})".format(
+            object_name, self.object_resolution, area, uv_area))
+
     def new_bake_image(self, object_name):
         img_name = self.get_image_file_name(object_name)
         path = self.get_image_file_path(img_name)
@@ -112,8 +507,7 @@ class PBAKER_OT_bake(bpy.types.Operator):
             color = (0.5, 0.5, 1.0, 1.0)
 
         # resolution
-        res = int(self.settings.custom_resolution) if self.settings.resolution == 'CUSTOM' else int(
-            self.settings.resolution)
+        res = self.get_resolution()
 
         is_float = False if self.settings.color_depth == '8' else True
 
@@ -131,20 +525,24 @@ class PBAKER_OT_bake(bpy.types.Operator):
 
     def create_gloss_image(self, obj_name):
         if "Roughness" in self.new_images:
+            if self.is_skipped_by_budget(obj_name, "Glossiness"):
+                return
             self.jobname = "Glossiness"  # for suffix
             gloss_image = self.new_bake_image(obj_name)
             gloss_img_name = self.get_image_file_name(obj_name)
             gloss_image.filepath = self.get_image_file_path(gloss_img_name)
             rough_img = self.new_images["Roughness"]
+            if not tuple(gloss_image.size) == tuple(rough_img.size):
+                gloss_image.scale(*rough_img.size)
             gloss_image.pixels = get_invert_image(rough_img)
             gloss_image.save()
-            save_image(gloss_image, self.get_color_mode(self.jobname))
+            save_image(gloss_image, self.jobname)
             gloss_image.reload()
             self.new_images[self.jobname] = gloss_image
 
     def check_texture_folder(self):
         abs_path = Path(bpy.path.abspath(self.settings.file_path))
-        path = str(abs_path / self.texture_folder)
+        path = str(abs_path / self.get_texture_dir())
         return check_path_access(path)
 
     def check_file_path(self):
@@ -163,6 +561,9 @@ class PBAKER_OT_bake(bpy.types.Operator):
         """Add an alpha channel to the Color image in the list of newly created images."""
 
         if "Color" in self.new_images.keys() and "Alpha" in self.new_images.keys():
+            if not tuple(self.new_images["Color"].size) == tuple(self.new_images["Alpha"].size):
+                self.report({'INFO'}, "Alpha to Color skipped. Image sizes differ.")
+                return
             img = get_combined_images(
                 self.new_images["Color"], self.new_images["Alpha"], 0, 3)
             self.new_images["Color"].pixels = img
@@ -174,6 +575,9 @@ class PBAKER_OT_bake(bpy.types.Operator):
         if len(bpy.context.scene.principled_baker_combinelist) == 0:
             return
 
+        if self.is_skipped_by_budget(obj.name, "Combine"):
+            return
+
         for combi in bpy.context.scene.principled_baker_combinelist:
             if not combi.do_combine:
                 continue
@@ -187,17 +591,11 @@ class PBAKER_OT_bake(bpy.types.Operator):
                 color_mode = 'RGB'
 
             # create new image
-            object_name = obj.name
-            prefix = get_image_prefix(object_name)
-            name = object_name if self.settings.use_object_name else ""
-            suffix = combi.suffix
-            ending = IMAGE_FILE_FORMAT_ENDINGS[self.settings.file_format]
-            img_name = f"{prefix}{name}{suffix}.{ending}"
+            img_name = self.get_combined_image_file_name(obj.name, combi)
             path = self.get_image_file_path(img_name)
 
             # resolution
-            res = int(self.settings.custom_resolution) if self.settings.resolution == 'CUSTOM' else int(
-                self.settings.resolution)
+            res = self.get_resolution()
 
             is_float = False if self.settings.color_depth == '8' else True
 
@@ -260,8 +658,10 @@ class PBAKER_OT_bake(bpy.types.Operator):
                           exr_codec=self.settings.exr_codec)
             image.reload()
 
-    def bake(self, bake_type):
-        """Wrapper for bpy.ops.object.bake() to get all parameters from settings"""
+    def bake(self, bake_type, **kwargs):
+        """Wrapper for bpy.ops.object.bake() to get all parameters from settings.
+        kwargs overwrite parameters (eg. pass_filter of guide passes).
+        """
 
         pass_filter = []
         if self.settings.use_Diffuse:
@@ -275,24 +675,432 @@ class PBAKER_OT_bake(bpy.types.Operator):
 
         selected_to_active = True if self.settings.bake_mode == 'SELECTED_TO_ACTIVE' else False
 
-        bpy.ops.object.bake(
-            type=bake_type,
-            pass_filter=pass_filter,
-            use_selected_to_active=selected_to_active,
-            normal_space=self.render_settings.normal_space,
-            normal_r=self.render_settings.normal_r,
-            normal_g=self.render_settings.normal_g,
-            normal_b=self.render_settings.normal_b, )
+        bake_args = {
+            "type": bake_type,
+            "pass_filter": pass_filter,
+            "use_selected_to_active": selected_to_active,
+            "normal_space": self.render_settings.normal_space,
+            "normal_r": self.render_settings.normal_r,
+            "normal_g": self.render_settings.normal_g,
+            "normal_b": self.render_settings.normal_b,
+        }
+        bake_args.update(kwargs)
+
+        # pairs and regions see only their own high poly objects
+        if not (self.settings.use_isolated_scene or self.is_pairs() or self.is_partitioned()):
+            bpy.ops.object.bake(**bake_args)
+            return
+
+        override = self.get_isolated_scene_override(bake_type)
+        if hasattr(bpy.context, "temp_override"):
+            with bpy.context.temp_override(**override):
+                bpy.ops.object.bake(**bake_args)
+        else:
+            bpy.ops.object.bake(override, **bake_args)
+
+    def is_partitioned(self) -> bool:
+        """:returns: True, if selected to active bakes region by region.
+        Regions have different topology than a cage object.
+        """
+
+        return (self.settings.bake_mode == 'SELECTED_TO_ACTIVE' and self.settings.use_partition
+                and self.settings.partition_regions > 1
+                and not (self.render_settings.use_cage and self.render_settings.cage_object))
+
+    def bake_image(self, image, bake_type):
+        """Bake image with all faces of the active object or region by region."""
+
+        if self.is_partitioned():
+            self.bake_regions(image, bake_type)
+        else:
+            self.bake(bake_type)
+
+    def get_partition(self, low, highs) -> list:
+        """:returns: List of (face indices, high poly objects near them) of low poly object."""
+
+        if low.name in self.partitions:
+            return self.partitions[low.name]
+
+        distance = self.render_settings.cage_extrusion + getattr(self.render_settings, "max_ray_distance", 0.0)
+        partition = []
+        for faces in get_face_regions(low, self.settings.partition_regions):
+            lo, hi = get_region_bounds(low, faces)
+            partition.append((faces, get_overlapping_objects(highs, lo, hi, distance)))
+        self.partitions[low.name] = partition
+
+        self.bake_report["Partition"].append("{0}: {1} regions, high poly objects per region {2} of {3}".format(
+            low.name, len(partition), [len(region_highs) for _, region_highs in partition], len(highs)))
+        return partition
+
+    def bake_regions(self, image, bake_type):
+        """Bake selected to active region by region into the same image.
+        Every region sees the high poly objects near it only (see isolated scene),
+        so memory and BVH build time scale with the region.
+        The margin is made from all regions afterwards.
+        """
+
+        context = bpy.context
+        low = context.active_object
+        selected_objects = list(context.selected_objects)
+        highs = [obj for obj in selected_objects if obj != low]
+
+        try:
+            for faces, region_highs in self.get_partition(low, highs):
+                if not region_highs:
+                    continue
+                region_obj = new_region_object(low, faces)
+                try:
+                    for obj in context.selected_objects:
+                        obj.select_set(False)
+                    for obj in region_highs + [region_obj]:
+                        obj.select_set(True)
+                    context.view_layer.objects.active = region_obj
+                    self.bake(bake_type, margin=0, use_clear=False)
+                finally:
+                    remove_region_object(region_obj)
+
+            # UV coverage does not change between passes and jobs
+            mask_key = (low.name, tuple(image.size), self.udim_tile)
+            if mask_key not in self.coverage_masks:
+                self.coverage_masks[mask_key] = self.get_uv_coverage(context, low, image)
+            mask = self.coverage_masks[mask_key]
+        finally:
+            for obj in context.selected_objects:
+                obj.select_set(False)
+            for obj in selected_objects:
+                obj.select_set(True)
+            context.view_layer.objects.active = low
+
+        pixels = get_pixels(image)
+        filled, filled_mask = dilate(pixels, mask, self.render_settings.margin)
+        margin = filled_mask & ~mask
+        pixels[margin] = filled[margin]
+        set_pixels(image, pixels)
+
+    def get_isolated_scene_override(self, bake_type) -> dict:
+        """Link only the objects needed for bake_type to the isolated scene.
+
+        Emission needs the bake objects only, lit bakes (AO, Diffuse) also
+        lights and occluders within isolation radius.
+
+        :returns: Context override to bake in isolated scene.
+        """
+
+        scene = bpy.context.scene
+        active_object = bpy.context.active_object
+        selected_objects = list(bpy.context.selected_objects)
+
+        objects = list(selected_objects)
+        if active_object and active_object not in objects:
+            objects.append(active_object)
+        cage_object = self.render_settings.cage_object
+        if self.render_settings.use_cage and cage_object and cage_object not in objects:
+            objects.append(cage_object)
+
+        if bake_type == 'DIFFUSE' or self.jobname == "Ambient Occlusion":
+            objects.extend(get_occluders(bpy.context.view_layer, objects, self.settings.isolation_radius))
+
+        if self.isolated_scene is None:
+            self.isolated_scene = new_isolated_scene(scene)
+        else:
+            sync_isolated_scene_settings(scene, self.isolated_scene)
+        set_isolated_scene_objects(self.isolated_scene, objects, selected_objects)
+
+        view_layer = self.isolated_scene.view_layers[0]
+        view_layer.objects.active = active_object
+
+        return {
+            "scene": self.isolated_scene,
+            "view_layer": view_layer,
+            "active_object": active_object,
+            "object": active_object,
+            "selected_objects": selected_objects,
+            "selected_editable_objects": selected_objects,
+        }
+
+    def bake_guide(self, objects, image, bake_type, **kwargs) -> np.ndarray:
+        """Bake a guide pass for the denoiser without margin.
+        Alpha of covered texels is 1.
+
+        :returns: Pixels (height, width, 4)
+        """
+
+        width, height = image.size
+        guide = new_data_image(f"{image.name} Guide", width, height)
+
+        # bake image nodes are reactivated after guide bake
+        materials = {mat_slot.material for obj in objects for mat_slot in obj.material_slots
+                     if mat_slot.material}
+        active_nodes = {mat: mat.node_tree.nodes.active for mat in materials}
+        create_bake_image_nodes(objects, guide)
+
+        margin = self.render_settings.margin
+        samples = bpy.context.scene.cycles.samples
+        self.render_settings.margin = 0
+        bpy.context.scene.cycles.samples = self.settings.deterministic_samples
+        try:
+            self.bake(bake_type, **kwargs)
+        finally:
+            self.render_settings.margin = margin
+            bpy.context.scene.cycles.samples = samples
+            delete_bake_image_nodes(objects, guide)
+            for mat, node in active_nodes.items():
+                mat.node_tree.nodes.active = node
+
+        pixels = get_pixels(guide)
+        bpy.data.images.remove(guide)
+        return pixels
+
+    def bake_to_convergence(self, image, bake_type, objects):
+        """Bake passes with other seeds and average them, until the error of the UV
+        covered texels to the previous average is below the threshold.
+        Every pass has as many samples as all passes before, so samples double
+        and no pass is wasted. Denoised jobs stop at the denoise samples.
+        With a time budget, passes stop at the share of the time left for this job.
+        """
+
+        mask = self.bake_guide(objects, image, 'NORMAL')[..., 3] > 0
+        cycles = bpy.context.scene.cycles
+
+        max_samples = self.settings.convergence_max_samples
+        if self.budget_scale < 1:
+            max_samples = min(max_samples, cycles.samples)
+        if self.settings.use_denoise and self.jobname in DENOISE_JOBS:
+            max_samples = min(max_samples, self.settings.denoise_samples)
+
+        # start at half of the samples of the last run
+        samples = self.settings.convergence_start_samples
+        bakelist = bpy.context.scene.principled_baker_bakelist
+        if self.settings.individual_samples and self.jobname in bakelist.keys():
+            samples = max(samples, bakelist[self.jobname].samples // 2)
+        samples = min(samples, max_samples)
+
+        seconds_share = None
+        if self.settings.use_time_budget:
+            units_left = max(1, self.units_count - self.units_passed + 1)
+            seconds_share = (self.budget_deadline - time.time()) / units_left
+
+        org_seed = cycles.seed
+        start = time.time()
+        average = None
+        total = 0
+        error = None
+        stop = ""
+        try:
+            while True:
+                cycles.samples = samples
+                cycles.seed = org_seed + total
+                self.bake_image(image, bake_type)
+                pixels = get_pixels(image)
+
+                if average is None:
+                    average = pixels
+                else:
+                    new_average = (average * total + pixels * samples) / (total + samples)
+                    error = get_rmse(average, new_average, mask)
+                    average = new_average
+                total += samples
+
+                if error is not None and error < self.settings.convergence_threshold:
+                    break
+                if total >= max_samples:
+                    stop = ", max samples"
+                    break
+
+                samples = min(total, max_samples - total)
+                if seconds_share is not None:
+                    seconds_per_sample = (time.time() - start) / total
+                    if time.time() - start + seconds_per_sample * samples > seconds_share:
+                        stop = ", time budget"
+                        break
+        finally:
+            cycles.seed = org_seed
+
+        set_pixels(image, average)
+
+        self.bake_report["Convergence"].append("{0} '{1}': {2} samples, error {3}{4}".format(
+            image.name, self.jobname, total, "-" if error is None else f"{error:.5f}", stop))
+
+        if self.settings.use_convergence_write_samples and self.jobname in bakelist.keys():
+            bakelist[self.jobname].samples = total
+
+    def denoise_image(self, image, objects, bake_type):
+        """Denoise baked image inside the UV islands and rebuild the margin.
+        Albedo and Normal guides keep edges sharp.
+        The margin is made by extending the denoised texels, whatever the margin type.
+        """
+
+        pixels = get_pixels(image)
+
+        normal = self.bake_guide(objects, image, 'NORMAL', normal_space='OBJECT',
+                                 normal_r='POS_X', normal_g='POS_Y', normal_b='POS_Z')
+        mask = normal[..., 3] > 0
+        normal[..., :3] = normal[..., :3] * 2 - 1
+
+        if bake_type == 'DIFFUSE':
+            albedo = self.bake_guide(objects, image, 'DIFFUSE', pass_filter={'COLOR'})
+        else:
+            albedo = np.ones_like(pixels)
+
+        denoised = denoise_pixels(pixels, normal, albedo, use_hdr=image.is_float)
+
+        result = pixels.copy()
+        result[mask, :3] = denoised[mask, :3]
+        filled, filled_mask = dilate(result, mask, self.render_settings.margin)
+        margin = filled_mask & ~mask
+        result[margin, :3] = filled[margin, :3]
+        set_pixels(image, result)
 
-    def bake_and_save(self, image, bake_type='EMIT'):
-        """Bake and save image."""
+    def bake_and_save(self, image, bake_type='EMIT', objects=None):
+        """Bake and save image. objects: objects with bake image nodes to bake guides for denoising."""
 
         image.save()
         self.report({'INFO'}, "baking '{0}'".format(image.name))
-        self.bake(bake_type)
-        save_image(image, self.get_color_mode(self.jobname))
+
+        profile_name = get_profile_name(self.jobname, bake_type)
+        if self.settings.use_bake_profiles:
+            apply_profile(profile_name, self.org_cycles_settings)
+
+        start = time.time()
+        if self.udim_tiles and objects:
+            self.bake_udim_tiles(image, bake_type, objects)
+        else:
+            self.bake_unit_image(image, bake_type, objects)
+        seconds = time.time() - start
+        self.add_bake_time(seconds)
+        self.add_profile_time(profile_name, seconds)
+        save_image(image, self.jobname)
         image.reload()
 
+        if self.settings.use_memory_budget:
+            self.baked_image_buffers.append(image)
+            freed = free_images_over_budget(self.baked_image_buffers, self.settings.memory_budget * 1024 * 1024)
+            self.images_freed += len(freed)
+            self.baked_image_buffers = [img for img in self.baked_image_buffers if img not in freed]
+
+    def bake_unit_image(self, image, bake_type, objects):
+        """Bake image (to convergence) and denoise it."""
+
+        if self.settings.use_convergence and not self.job_deterministic and not self.draft and objects:
+            self.bake_to_convergence(image, bake_type, objects)
+        else:
+            self.bake_image(image, bake_type)
+        if self.settings.use_denoise and self.jobname in DENOISE_JOBS and objects:
+            self.denoise_image(image, objects, bake_type)
+
+    def bake_udim_tiles(self, image, bake_type, objects):
+        """Bake UDIM tiles one by one. UV maps of objects are moved, so the tile lies in 0-1.
+        All tiles but the first are saved to their files here.
+        The file path of image is not changed (would reload it). The first tile stays in image.
+        """
+
+        background = get_pixels(image)
+        first_tile = self.udim_tiles[0]
+        first_pixels = None
+        try:
+            for tile in self.udim_tiles:
+                self.udim_tile = tile
+                set_pixels(image, background)
+                u, v = get_tile_offset(tile)
+                offset_uvs(objects, -u, -v)
+                try:
+                    self.bake_unit_image(image, bake_type, objects)
+                finally:
+                    offset_uvs(objects, u, v)
+                if tile == first_tile:
+                    first_pixels = get_pixels(image)
+                else:
+                    save_image(image, self.jobname, file_path=get_tile_file_name(image.filepath, tile))
+        finally:
+            self.udim_tile = first_tile
+        set_pixels(image, first_pixels)
+
+    def set_udim_tiles(self, object_name, objects) -> bool:
+        """Tiles to bake by active UV maps of objects. Tiles without faces are skipped.
+
+        :returns: False, if UDIM tiles are used and there is none to bake.
+        """
+
+        self.udim_tiles = []
+        if not self.settings.use_udim:
+            return True
+
+        tiles = self.get_udim_tiles(objects)
+        if not tiles:
+            self.report({'INFO'}, "No UDIM tiles to bake for '{0}'".format(object_name))
+            return False
+
+        self.udim_tiles = tiles
+        self.udim_tile = tiles[0]
+        self.bake_report["UDIM"].append("{0}: {1} tiles {2}".format(object_name, len(tiles), tiles))
+        return True
+
+    def get_udim_tiles(self, objects) -> list:
+        """:returns: Used UDIM tiles of objects, restricted by the tiles setting."""
+
+        tiles = get_udim_tiles(objects)
+        tile_filter = parse_tiles(self.settings.udim_tiles)
+        if tile_filter:
+            tiles = [tile for tile in tiles if tile in tile_filter]
+        return tiles
+
+    def for_each_udim_tile(self, func, *args):
+        """Call func for every UDIM tile, the first tile last.
+        New images are switched to the files of the tile before.
+        """
+
+        if not self.udim_tiles:
+            func(*args)
+            return
+
+        for tile in self.udim_tiles[1:] + self.udim_tiles[:1]:
+            self.udim_tile = tile
+            for image in self.new_images.values():
+                path = get_tile_file_name(image.filepath, tile)
+                if not path == image.filepath:
+                    image.filepath = path
+                    image.reload()
+            func(*args)
+
+    def post_process_images(self, object_name):
+        """Glossiness and alpha to color from new images."""
+
+        if self.settings.use_invert_roughness:
+            self.create_gloss_image(object_name)
+
+        if self.settings.use_alpha_to_color:
+            self.alpha_channel_to_color()
+
+    def set_udim_images(self, images):
+        """Make images tiled. Blender finds the other tiles by the tile number in the file name."""
+
+        if not self.settings.use_udim:
+            return
+        for image in images:
+            if not image.source == 'TILED':
+                image.source = 'TILED'
+                image.reload()
+
+    def free_object_images(self):
+        """Remove or unload saved images of the finished object (BATCH).
+        Materials reference them by file path.
+        """
+
+        if not self.settings.use_memory_budget:
+            return
+        for image in list(self.new_images.values()):
+            if image in self.baked_image_buffers:
+                self.baked_image_buffers.remove(image)
+            if free_image(image):
+                self.images_freed += 1
+        self.new_images.clear()
+
+    def add_profile_time(self, profile_name, seconds):
+        """Bake count and seconds by profile for the report."""
+
+        count, total = self.profile_times.get(profile_name, (0, 0.0))
+        self.profile_times[profile_name] = (count + 1, total + seconds)
+
     def get_color_mode(self, jobname):
         if jobname == 'Color' and self.settings.use_alpha_to_color:
             return 'RGBA'
@@ -310,6 +1118,18 @@ class PBAKER_OT_bake(bpy.types.Operator):
             for obj in self.auto_smooth_list:
                 obj.data.use_auto_smooth = self.auto_smooth_list[obj]
 
+        # Atlas UV maps - Clean up!
+        if not self.settings.atlas_keep_uv_map:
+            remove_atlas_uv_maps(self.atlas_objects)
+        for obj, index in self.atlas_objects.items():
+            obj.data.uv_layers.active_index = index
+        self.atlas_objects.clear()
+
+        # Frozen meshes - Clean up!
+        for obj, frozen in self.frozen_objects.items():
+            unfreeze_object(obj, frozen)
+        self.frozen_objects.clear()
+
         # Render Engine - Clean up!
         if self.prefs.switch_to_cycles:
             bpy.context.scene.render.engine = self.render_engine
@@ -318,6 +1138,14 @@ class PBAKER_OT_bake(bpy.types.Operator):
         # Samples
         bpy.context.scene.cycles.samples = self.org_samples
 
+        # Profiles
+        restore_profile(self.org_cycles_settings)
+
+        # Isolated Scene - Clean up!
+        if self.isolated_scene is not None:
+            remove_isolated_scene(self.isolated_scene)
+            self.isolated_scene = None
+
         # Restore orig selection
         for obj in bpy.context.selected_objects:
             obj.select_set(False)
@@ -325,6 +1153,28 @@ class PBAKER_OT_bake(bpy.types.Operator):
             obj.select_set(True)
         bpy.context.view_layer.objects.active = self.active_object
 
+    def freeze_meshes(self, context):
+        """Evaluate modifiers of bake objects once for all jobs.
+        Meshes are changed by Auto UV Project, Duplicate Objects, Add New Material
+        and Atlas (UV map), so they are not frozen then.
+        """
+
+        use_atlas = self.settings.bake_mode == 'BATCH' and self.settings.use_atlas
+        if (not self.settings.auto_uv_project == 'OFF' or self.settings.duplicate_objects
+                or self.settings.add_new_material or use_atlas):
+            self.report({'INFO'}, "Meshes not frozen. Auto UV Project, Duplicate Objects, "
+                                  "Add New Material and Atlas change the original mesh.")
+            return
+
+        depsgraph = context.evaluated_depsgraph_get()
+        for obj in self.bake_objects:
+            if not has_active_modifiers(obj):
+                continue
+            start = time.time()
+            self.frozen_objects[obj] = freeze_object(obj, depsgraph)
+            self.freeze_report.append("{0}: {1:.2f} s, {2} polygons".format(
+                obj.name, time.time() - start, len(obj.data.polygons)))
+
     def clean_after_bake(self, objects):
         for obj in objects:
             # delete temp materials
@@ -394,36 +1244,35 @@ class PBAKER_OT_bake(bpy.types.Operator):
         # all fine
         return True
 
-    def can_bake(self, objects):
-        """Test conditions and report errors.
+    def get_bake_errors(self, objects) -> list:
+        """Test conditions.
 
         Objects must:
         not be hidden,
         have a material (expect baking vertex color),
         have no empty material slots.
 
-        :returns: True, if baking is possible, else False.
+        :returns: List of (report type, message). Empty, if baking is possible.
         """
 
+        errors = []
+
         for obj in objects:
             # enabled for rendering?
             if obj.hide_render:
-                self.report(
-                    {'INFO'}, "baking cancelled. '{0}' not enabled for rendering.".format(obj.name))
-                return False
+                errors.append(({'INFO'}, "baking cancelled. '{0}' not enabled for rendering.".format(obj.name)))
+                continue
             # no material or missing output?
             if not has_material(obj):
                 if not self.settings.use_vertex_color:
-                    self.report(
-                        {'INFO'}, "baking cancelled. '{0}' Material missing, Material Output missing, or Material Output input missing.".format(obj.name))
-                    return False
+                    errors.append(({'INFO'}, "baking cancelled. '{0}' Material missing, Material Output missing, or Material Output input missing.".format(obj.name)))
+                    continue
 
             # empty material slots?
             for mat_slot in obj.material_slots:
                 if not mat_slot.material:
-                    self.report(
-                        {'INFO'}, "baking cancelled. '{0}' has empty Material Slots.".format(obj.name))
-                    return False
+                    errors.append(({'INFO'}, "baking cancelled. '{0}' has empty Material Slots.".format(obj.name)))
+                    break
 
         # has every object a UV map?
         if self.settings.auto_uv_project == 'OFF':
@@ -432,15 +1281,23 @@ class PBAKER_OT_bake(bpy.types.Operator):
                 if len(obj.data.uv_layers) == 0:
                     objs_with_missing_uv_map.append(obj.name)
             if len(objs_with_missing_uv_map) > 0:
-                self.report({'ERROR'},
-                            "UV map missing: '{0}'".format(objs_with_missing_uv_map))
-                return False
+                errors.append(({'ERROR'}, "UV map missing: '{0}'".format(objs_with_missing_uv_map)))
 
-        return True
+        return errors
+
+    def can_bake(self, objects):
+        """Test conditions and report errors.
+
+        :returns: True, if baking is possible, else False.
+        """
+
+        errors = self.get_bake_errors(objects)
+        for report_type, message in errors:
+            self.report(report_type, message)
+        return not errors
 
     def is_joblist_empty(self):
         if not self.joblist:
-            self.final_cleanup()
             self.report({'INFO'}, "Nothing to do.")
             return True
 
@@ -464,16 +1321,108 @@ class PBAKER_OT_bake(bpy.types.Operator):
         else:
             prepare_objects_for_bake(objects, jobname)
 
+    def get_joblist(self, bake_objects, object_name) -> list:
+        """:returns: Jobs for images of object_name.
+        With a bake plan (eg. of a draft) the resolved jobs of the plan are
+        reused, else jobs are detected.
+        """
+
+        if self.planned_units is None:
+            return get_joblist_from_objects(bake_objects)
+        return list(dict.fromkeys(jobname for name, jobname, _ in self.planned_units
+                                  if name == object_name))
+
+    def is_deterministic_job(self, bake_objects) -> bool:
+        """:returns: True, if prepared materials of current job give equal results per sample.
+        Must be called after materials are prepared!
+        """
+
+        bake_type = get_bake_type_by(self.jobname)
+        if bake_type == 'DIFFUSE':
+            return False
+
+        for obj in bake_objects:
+            for mat_slot in obj.material_slots:
+                if not mat_slot.material or not mat_slot.material.use_nodes:
+                    continue
+                output = get_active_output(mat_slot.material)
+                if output and is_stochastic_node_tree(output, lit=not bake_type == 'NORMAL'):
+                    return False
+        return True
+
+    def set_job_samples(self, obj, bake_objects):
+        """Set samples of current job. Deterministic jobs use deterministic samples,
+        denoised jobs denoise samples, unless samples are set individually.
+        Drafts use at most draft samples.
+
+        Must be restored afer baking!
+        """
+
+        set_samples(self.jobname)
+
+        individual_samples = self.settings.individual_samples and not self.settings.use_autodetect
+        self.job_deterministic = (self.settings.use_deterministic_samples and not individual_samples
+                                  and self.is_deterministic_job(bake_objects))
+        if self.job_deterministic:
+            samples = bpy.context.scene.cycles.samples
+            new_samples = min(samples, self.settings.deterministic_samples)
+            if not new_samples == samples:
+                bpy.context.scene.cycles.samples = new_samples
+                self.bake_report["Samples"].append("{0} '{1}{2}': {3} -> {4} (deterministic)".format(
+                    obj.name, self.jobname, self.suffix_extension, samples, new_samples))
+
+        if self.settings.use_denoise and self.jobname in DENOISE_JOBS and not individual_samples:
+            samples = min(bpy.context.scene.cycles.samples, self.settings.denoise_samples)
+            bpy.context.scene.cycles.samples = samples
+
+        if self.draft:
+            samples = min(bpy.context.scene.cycles.samples, self.settings.draft_samples)
+            bpy.context.scene.cycles.samples = samples
+
+    def is_pairs(self) -> bool:
+        """:returns: True, if high/low pairs are baked (Selected to Active)."""
+
+        return self.settings.bake_mode == 'SELECTED_TO_ACTIVE' and self.settings.use_pairs
+
+    def is_batch(self) -> bool:
+        """:returns: True, if objects are baked separately (Batch without atlas)."""
+
+        return self.settings.bake_mode == 'BATCH' and not self.settings.use_atlas
+
+    def get_job_queue(self, bake_objects) -> list:
+        """:returns: List of (jobname, subname) to bake.
+
+        subname is the vertex color name for "Vertex Color", else empty.
+        """
+
+        queue = []
+        for jobname in self.joblist:
+            # [""] <- empty string as the one object to iterate over for non-vertex-colors-jobs
+            subjobs = [""]
+            if jobname == "Vertex Color":
+                subjobs = get_vertex_colors_to_bake_from_objects(bake_objects)
+            queue.extend((jobname, subname) for subname in subjobs)
+        return queue
+
+    def set_progress(self, units_done, units_count):
+        """Progress (0..1) of all objects by done units of current object.
+        Called once per unit.
+        """
+
+        self.units_passed += 1
+        object_progress = units_done / units_count if units_count else 1
+        self.progress = (self.objects_done + object_progress) / self.objects_count
+
     # -------------------------------------------------------------------------
     # BAKE COMBINED:
     # -------------------------------------------------------------------------
     def bake_combined(self, context, bake_objects):
         if not self.can_bake(bake_objects):
-            self.final_cleanup()
-            return {'CANCELLED'}
+            raise BakeCancelled()
 
         # Populate joblist
-        self.joblist = get_joblist_from_objects(bake_objects)
+        object_name = bake_objects[0].name if self.is_batch() else self.active_object.name
+        self.joblist = self.get_joblist(bake_objects, object_name)
 
         # skip, if one object has no vertex color
         if self.settings.use_vertex_color:
@@ -484,36 +1433,43 @@ class PBAKER_OT_bake(bpy.types.Operator):
             if len(objects_without_vertex_color) > 0:
                 self.report(
                     {'INFO'}, f"Objects have no Vertex Color: '{objects_without_vertex_color}'")
-                return {'CANCELLED'}
+                return
 
         # empty joblist -> nothing to do
         if self.is_joblist_empty():
-            return {'CANCELLED'}
+            return
 
         # material outpus for later clean up
         self.active_outputs = set(get_active_outputs(bake_objects))
         self.all_material_outputs = get_all_material_outputs(bake_objects)
         set_material_outputs_target_to_all(bake_objects)
 
-        # Auto UV project
-        auto_uv_project(bake_objects)
+        # Auto UV project and UV Map selection. Atlas UV maps are made from them
+        if not self.atlas_objects:
+            auto_uv_project(bake_objects)
 
-        # UV Map selection
-        for obj in bake_objects:
-            self.orig_uv_layers_active_indices[obj] = obj.data.uv_layers.active_index
-            select_uv_map(obj)
+            for obj in bake_objects:
+                self.orig_uv_layers_active_indices[obj] = obj.data.uv_layers.active_index
+                select_uv_map(obj)
 
         active_object = self.active_object
-        if self.settings.bake_mode == "BATCH":
+        if self.is_batch():
             active_object = bake_objects[0]
 
+        # UDIM tiles
+        if not self.set_udim_tiles(active_object.name, bake_objects):
+            return
+
+        # resolution by texel density
+        self.set_auto_resolution(active_object.name, bake_objects)
+
         # (optional) new material
         self.new_pri_node_values = get_principled_node_values(bake_objects)
 
         new_mat_name = self.settings.new_material_prefix
         if self.settings.make_new_material or self.settings.duplicate_objects:
             if self.settings.new_material_prefix == "":
-                if self.settings.bake_mode == "BATCH":
+                if self.is_batch():
                     new_mat_name = bake_objects[0].name
                 else:
                     new_mat_name = active_object.name
@@ -521,7 +1477,7 @@ class PBAKER_OT_bake(bpy.types.Operator):
 
         # texture folder
         if self.settings.use_texture_folder:
-            if self.settings.bake_mode == "BATCH":
+            if self.is_batch():
                 tex_dir = bake_objects[0].name
             else:
                 tex_dir = active_object.name
@@ -529,59 +1485,80 @@ class PBAKER_OT_bake(bpy.types.Operator):
 
         if not self.check_texture_folder():
             self.report({'ERROR'}, 'Error: Texture Folder')
-            return {'CANCELLED'}
+            raise BakeCancelled()
+
+        # Go through job queue
+        fingerprint_objects = bake_objects
+        queue = self.scheduled_queues.get(active_object.name) or schedule_jobs(
+            self.get_job_queue(bake_objects))
+        if not self.is_batch():
+            self.units_count = len(queue)
+        for i, (self.jobname, subname) in enumerate(queue):
+            self.suffix_extension = subname
+            self.set_progress(i, len(queue))
+
+            # skip job, if not in bake plan
+            if self.skip_job_if_not_planned(active_object):
+                continue
+            self.resolved_units.append((active_object.name, self.jobname, self.suffix_extension))
 
-        # Go through joblist
-        for self.jobname in self.joblist:
+            # skip job, if finished before an interruption
+            if self.skip_job_if_journaled(active_object):
+                continue
 
-            # [""] <- empty string as the one object to iterate over for non-vertex-colors-jobs
-            subjobs = [""]
-            if self.jobname == "Vertex Color":
-                subjobs = get_vertex_colors_to_bake_from_objects(bake_objects)
+            # fingerprint of nominal resolution, not the degraded one of the last job
+            self.job_resolution = 0
+            self.job_degraded = False
+            if self.settings.use_bake_cache:
+                self.fingerprint = self.get_fingerprint(fingerprint_objects)
 
-            for subname in subjobs:
-                self.suffix_extension = subname
+            # skip job, if no overwrite and image exists. load existing image
+            if self.skip_job_if_file_exists(active_object):
+                continue
 
-                # skip job, if no overwrite and image exists. load existing image
-                if self.skip_job_if_file_exists(active_object):
-                    continue
+            self.bake_report["Bake Order"].append("{0} '{1}{2}' ({3}, {4} samples, {5} bit)".format(
+                active_object.name, self.jobname, self.suffix_extension,
+                *get_job_signature(self.jobname)[1:]))
 
-                # set individual samples
-                set_samples(self.jobname)
+            # Prepare materials
+            self.prepare_materials_of_objects_by_jobname(
+                bake_objects, self.jobname, subname)
 
-                # Prepare materials
-                self.prepare_materials_of_objects_by_jobname(
-                    bake_objects, self.jobname, subname)
+            # set individual samples
+            self.set_job_samples(active_object, bake_objects)
+            self.apply_time_budget(active_object, bake_objects)
 
-                # image to bake on
-                image = self.new_bake_image(active_object.name)
+            # image to bake on
+            image = self.new_bake_image(active_object.name)
 
-                # append image to image dict for new material
-                self.new_images[self.jobname + self.suffix_extension] = image
+            # append image to image dict for new material
+            self.new_images[self.jobname + self.suffix_extension] = image
 
-                # image nodes to bake
-                create_bake_image_nodes(bake_objects, image)
+            # image nodes to bake
+            create_bake_image_nodes(bake_objects, image)
 
-                # Bake and Save image!
-                self.bake_and_save(
-                    image,
-                    bake_type=get_bake_type_by(self.jobname))
+            # Bake and Save image!
+            self.start_journal_unit(image)
+            self.bake_and_save(
+                image,
+                bake_type=get_bake_type_by(self.jobname),
+                objects=bake_objects)
+            self.add_to_bake_cache(image)
+            self.finish_journal_unit(active_object, image)
 
-                self.clean_after_bake(bake_objects)
+            self.clean_after_bake(bake_objects)
 
-        # jobs DONE
+            yield
 
-        # Glossiness
-        if self.settings.use_invert_roughness:
-            self.create_gloss_image(obj.name)
+        # jobs DONE
+        self.job_resolution = 0
 
-        # Add alpha channel to color
-        if self.settings.use_alpha_to_color:
-            self.alpha_channel_to_color()
+        # Glossiness and alpha channel to color, tile by tile
+        self.for_each_udim_tile(self.post_process_images, active_object.name)
 
         # Duplicate objects
         if self.settings.duplicate_objects:
-            if self.settings.bake_mode == "BATCH":
+            if self.is_batch():
                 self.dup_objects.append(
                     duplicate_object(bake_objects[0], new_mat))
             else:
@@ -608,29 +1585,316 @@ class PBAKER_OT_bake(bpy.types.Operator):
                 del(new_mat[MATERIAL_TAG])
 
         # Combine channels
-        self.combine_channels(active_object)
+        self.for_each_udim_tile(self.combine_channels, active_object)
+
+        self.baked_images[active_object.name] = {
+            name: bpy.path.abspath(img.filepath) for name, img in self.new_images.items()}
+        self.set_udim_images(self.new_images.values())
 
     # -------------------------------------------------------------------------
     # BAKE BATCH:
     # -------------------------------------------------------------------------
     def bake_batch(self, context, bake_objects):
         if not self.can_bake(bake_objects):
-            self.final_cleanup()
-            return {'CANCELLED'}
+            raise BakeCancelled()
 
         # Deselect all
         context.view_layer.objects.active = None
         for obj in bake_objects:
             obj.select_set(False)
 
+        # bake one object of linked duplicates. Lit jobs depend on the surroundings.
+        # Duplicate Objects and new materials are made per object, so not grouped then
+        linked_duplicates = {}
+        if self.settings.use_linked_duplicates and (
+                self.settings.duplicate_objects or self.settings.make_new_material
+                or self.settings.add_new_material):
+            self.report({'INFO'}, "Linked duplicates not grouped. Duplicate Objects and "
+                                  "new materials are made per object.")
+        elif self.settings.use_linked_duplicates:
+            lit_objects = [obj for obj in bake_objects
+                           if LIT_JOBS & set(self.get_joblist([obj], obj.name))]
+            linked_duplicates = group_linked_duplicates(
+                [obj for obj in bake_objects if obj not in lit_objects])
+            bake_objects = list(linked_duplicates) + lit_objects
+
+        self.objects_count = len(bake_objects)
+
+        # group jobs across objects. see scheduler
+        queues = {}
         for obj in bake_objects:
+            self.joblist = self.get_joblist([obj], obj.name)
+            queues[obj] = self.get_job_queue([obj])
+        schedule = schedule_objects(queues)
+        self.scheduled_queues = {obj.name: queue for obj, queue in schedule}
+        self.units_count = sum(len(queue) for queue in self.scheduled_queues.values())
+
+        for self.objects_done, (obj, _) in enumerate(schedule):
             self.new_images.clear()
 
             obj.select_set(True)
             context.view_layer.objects.active = obj
-            self.bake_combined(context, [obj])
+            yield from self.bake_combined(context, [obj])
             obj.select_set(False)
 
+            if linked_duplicates.get(obj):
+                self.share_images_with_linked_duplicates(obj, linked_duplicates[obj])
+
+            self.free_object_images()
+
+    # -------------------------------------------------------------------------
+    # BAKE ATLAS:
+    # -------------------------------------------------------------------------
+    def bake_atlas(self, context, bake_objects):
+        """Bake all objects with one image per job into a shared UV layout."""
+
+        if not self.can_bake(bake_objects):
+            raise BakeCancelled()
+
+        # active object first. images are named by active object
+        bake_objects = [self.active_object] + [obj for obj in bake_objects
+                                               if obj != self.active_object]
+
+        auto_uv_project(bake_objects)
+        for obj in bake_objects:
+            self.atlas_objects[obj] = obj.data.uv_layers.active_index
+            select_uv_map(obj)
+
+        new_atlas_uv_maps(bake_objects, self.settings.atlas_margin)
+        self.bake_report["Atlas"].append("{0} objects in '{1}' UV map: {2}".format(
+            len(bake_objects), ATLAS_UV_MAP_NAME, [obj.name for obj in bake_objects]))
+
+        context.view_layer.objects.active = self.active_object
+        for obj in bake_objects:
+            obj.select_set(True)
+
+        yield from self.bake_combined(context, bake_objects)
+
+        # images of new material use atlas UV map
+        if self.settings.atlas_keep_uv_map and (self.settings.make_new_material or self.settings.duplicate_objects):
+            for obj in bake_objects:
+                obj.data.uv_layers[ATLAS_UV_MAP_NAME].active_render = True
+
+    def share_images_with_linked_duplicates(self, obj, duplicates):
+        """Linked duplicates get the images of obj, shared or as copies named by object."""
+
+        images = self.baked_images.get(obj.name, {})
+        self.bake_report["Linked Duplicates"].append("{0}: {1} bakes saved for {2}".format(
+            obj.name, len(images) * len(duplicates), [dup.name for dup in duplicates]))
+
+        if self.settings.linked_duplicates_output == 'SHARED':
+            for dup in duplicates:
+                self.baked_images[dup.name] = dict(images)
+            return
+
+        # copy images to file paths of duplicates
+        texture_folder = self.texture_folder
+        jobname, suffix_extension = self.jobname, self.suffix_extension
+        combinelist = [combi for combi in bpy.context.scene.principled_baker_combinelist
+                       if combi.do_combine]
+
+        def get_path(object_name, img_name):
+            if self.settings.use_texture_folder:
+                self.texture_folder = remove_not_allowed_signs(object_name)
+            return bpy.path.abspath(self.get_image_file_path(img_name))
+
+        for dup in duplicates:
+            copies = {}
+            for name in self.new_images:
+                self.jobname, self.suffix_extension = split_job_key(name)
+                copies[name] = (images[name], get_path(dup.name, self.get_image_file_name(dup.name)))
+            for combi in combinelist:
+                copies[combi.suffix] = (get_path(obj.name, self.get_combined_image_file_name(obj.name, combi)),
+                                        get_path(dup.name, self.get_combined_image_file_name(dup.name, combi)))
+
+            self.baked_images[dup.name] = {}
+            for name, (src, dst) in copies.items():
+                if not os.path.isfile(src):
+                    continue
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                for tile in self.udim_tiles[1:]:
+                    tile_src = get_tile_file_name(src, tile)
+                    if os.path.isfile(tile_src):
+                        shutil.copyfile(tile_src, get_tile_file_name(dst, tile))
+                shutil.copyfile(src, dst)
+                if name in images:
+                    self.baked_images[dup.name][name] = dst
+
+        self.texture_folder = texture_folder
+        self.jobname, self.suffix_extension = jobname, suffix_extension
+
+    # -------------------------------------------------------------------------
+    # BAKE BATCH IN BACKGROUND WORKERS:
+    # -------------------------------------------------------------------------
+    def run_workers(self, worker_file, jobs, module="worker.run"):
+        """Generator to run jobs in background workers. Progress by finished jobs.
+        Yields seconds to wait while workers are running. See iter_workers()
+
+        :returns: List of results in order of jobs.
+        """
+
+        finished = set()
+
+        def on_result(index, result):
+            finished.add(index)
+            self.progress = len(finished) / len(jobs)
+
+        return (yield from iter_workers(worker_file, jobs,
+                                        worker_count=self.settings.worker_count,
+                                        threads=self.settings.worker_threads,
+                                        retries=self.settings.worker_retries,
+                                        module=module,
+                                        on_result=on_result))
+
+    def bake_batch_in_workers(self, context, bake_objects):
+        if not self.can_bake(bake_objects):
+            raise BakeCancelled()
+
+        if self.settings.use_udim:
+            jobs = self.get_udim_worker_jobs(bake_objects)
+        else:
+            shards = split_into_shards(bake_objects, self.settings.worker_count)
+            jobs = [{"objects": [obj.name for obj in shard],
+                     "settings": WORKER_SETTINGS,
+                     "draft": self.draft} for shard in shards]
+
+        worker_file = save_worker_file()
+        try:
+            results = yield from self.run_workers(worker_file, jobs)
+        finally:
+            remove_worker_file(worker_file)
+
+        # tiles of an object come from several workers. images are loaded once
+        merged = {}  # object name: {job: [image paths]}
+        baked_tiles = {}
+        for job, result in zip(jobs, results):
+            if "error" in result:
+                self.report({'ERROR'}, "Worker failed: '{0}'\n{1}".format(job["objects"], result["error"]))
+                continue
+            for obj_name, image_paths in result["objects"].items():
+                for name, path in image_paths.items():
+                    merged.setdefault(obj_name, {}).setdefault(name, []).append(path)
+            if "udim_tiles" in job["settings"]:
+                baked_tiles.setdefault(job["objects"][0], set()).update(
+                    parse_tiles(job["settings"]["udim_tiles"]))
+
+        for obj_name, tiles in baked_tiles.items():
+            self.bake_report["UDIM"].append("{0}: {1} tiles {2}".format(obj_name, len(tiles), sorted(tiles)))
+
+        # tiled images are loaded by their lowest tile
+        for obj_name, image_paths in merged.items():
+            self.merge_worker_images(bpy.data.objects[obj_name], {
+                name: min(paths, key=get_tile_number) for name, paths in image_paths.items()})
+
+    def get_udim_worker_jobs(self, bake_objects) -> list:
+        """:returns: Worker jobs with the UDIM tiles of every object spread over the workers.
+        Tiles are independent, so one object with many tiles keeps all workers busy.
+        """
+
+        jobs = []
+        for obj in bake_objects:
+            active_index = obj.data.uv_layers.active_index
+            select_uv_map(obj)
+            tiles = self.get_udim_tiles([obj])
+            obj.data.uv_layers.active_index = active_index
+            if not tiles:
+                self.report({'INFO'}, "No UDIM tiles to bake for '{0}'".format(obj.name))
+                continue
+
+            for i in range(min(self.settings.worker_count, len(tiles))):
+                chunk = tiles[i::self.settings.worker_count]
+                jobs.append({"objects": [obj.name],
+                             "settings": dict(WORKER_SETTINGS, udim_tiles=",".join(map(str, chunk))),
+                             "draft": self.draft})
+        return jobs
+
+    # -------------------------------------------------------------------------
+    # BAKE BATCH WITH A JOB QUEUE:
+    # -------------------------------------------------------------------------
+    def bake_batch_in_queue(self, context, bake_objects):
+        """Background workers pull single jobs from a queue.
+        Baked images are loaded afterwards to make new materials etc.
+        """
+
+        if not self.can_bake(bake_objects):
+            raise BakeCancelled()
+
+        units = []
+        for obj in bake_objects:
+            self.joblist = self.get_joblist([obj], obj.name)
+            units.extend({"objects": [obj.name], "job": jobname, "subjob": subname}
+                         for jobname, subname in self.get_job_queue([obj]))
+
+        worker_file = save_worker_file()
+        queue_file = get_queue_file(worker_file)
+        remove_queue_file(queue_file)
+        try:
+            conn = connect(queue_file)
+            enqueue(conn, worker_file, units,
+                    manifest={"settings": WORKER_SETTINGS, "combine": [], "draft": self.draft},
+                    max_attempts=self.settings.worker_retries + 1)
+
+            jobs = [{"queue": queue_file, "worker_id": f"worker_{i}"}
+                    for i in range(self.settings.worker_count)]
+            yield from self.run_workers(worker_file, jobs, module="worker.queue_run")
+
+            # units of workers which did not come back
+            release_units(conn, error="Worker failed")
+            done = get_units(conn, 'DONE')
+            failed = get_units(conn, 'FAILED') + get_units(conn, 'PENDING')
+            conn.close()
+        finally:
+            remove_worker_file(worker_file)
+            remove_queue_file(queue_file)
+
+        times = [unit["finished"] - unit["started"] for unit in done]
+        self.report({'INFO'}, "Job Queue: {0} jobs baked in {1:.1f}s (mean {2:.1f}s), {3} failed.".format(
+            len(done), sum(times), sum(times) / len(times) if times else 0, len(failed)))
+        for unit in failed:
+            self.report({'ERROR'}, "Job failed: '{0}' {1}{2}".format(
+                unit["objects"][0], unit["job"], unit["subjob"]))
+
+        # load baked images, make new materials, combine channels etc.
+        planned_units = self.planned_units
+        self.planned_units = {(unit["objects"][0], unit["job"], unit["subjob"]): True
+                              for unit in done}
+        yield from self.bake_batch(context, bake_objects)
+        self.planned_units = planned_units
+
+    def merge_worker_images(self, obj, image_paths):
+        """Load images baked by a worker and make new material for object."""
+
+        self.new_images.clear()
+        for jobname, path in image_paths.items():
+            if self.settings.file_path.startswith("//"):
+                path = bpy.path.relpath(path)
+            image = bpy.data.images.load(path, check_existing=True)
+            image.reload()
+            if not jobname in {'Color', 'Diffuse'}:
+                image.colorspace_settings.name = 'Non-Color'
+            self.new_images[jobname] = image
+        self.baked_images[obj.name] = image_paths
+        self.set_udim_images(self.new_images.values())
+
+        if not (self.settings.make_new_material or self.settings.duplicate_objects):
+            return
+
+        new_mat_name = self.settings.new_material_prefix
+        if new_mat_name == "":
+            new_mat_name = obj.name
+        new_mat = new_material(new_mat_name, get_principled_node_values([obj]))
+        add_images_to_material(self.new_images, new_mat)
+        self.report({'INFO'}, "Mew Material created. '{0}'".format(new_mat.name))
+
+        if self.settings.duplicate_objects:
+            self.dup_objects.append(duplicate_object(obj, new_mat))
+
+        if self.settings.add_new_material:
+            obj.data.materials.append(new_mat)
+
+        if MATERIAL_TAG in new_mat:
+            del(new_mat[MATERIAL_TAG])
+
     # -------------------------------------------------------------------------
     # BAKE SELECTED TO ACTIVE:
     # -------------------------------------------------------------------------
@@ -643,8 +1907,7 @@ class PBAKER_OT_bake(bpy.types.Operator):
                 bake_objects.remove(active_object)
 
         if not self.can_bake(bake_objects):
-            self.final_cleanup()
-            return {'CANCELLED'}
+            raise BakeCancelled()
 
         for mat_slot in active_object.material_slots:
             if not mat_slot.material:
@@ -657,8 +1920,7 @@ class PBAKER_OT_bake(bpy.types.Operator):
             if len(active_object.data.uv_layers) == 0:
                 self.report(
                     {'INFO'}, "baking cancelled. '{0}' UV map missing.".format(active_object.name))
-                self.final_cleanup()
-                return {'CANCELLED'}
+                raise BakeCancelled()
 
         # Can bake?
         for obj in bake_objects:
@@ -666,15 +1928,14 @@ class PBAKER_OT_bake(bpy.types.Operator):
             if obj.hide_render:
                 self.report(
                     {'INFO'}, "baking cancelled. '{0}' not enabled for rendering.".format(obj.name))
-                self.final_cleanup()
-                return {'CANCELLED'}
+                raise BakeCancelled()
 
         # Populate joblist
-        self.joblist = get_joblist_from_objects(bake_objects)
+        self.joblist = self.get_joblist(bake_objects, active_object.name)
 
         # empty joblist -> nothing to do
         if self.is_joblist_empty():
-            return {'CANCELLED'}
+            return
 
         # material outpus for later clean up
         self.active_outputs = set(get_active_outputs(bake_objects))
@@ -689,6 +1950,13 @@ class PBAKER_OT_bake(bpy.types.Operator):
         self.orig_uv_layers_active_indices[active_object] = active_object.data.uv_layers.active_index
         select_uv_map(active_object)
 
+        # UDIM tiles
+        if not self.set_udim_tiles(active_object.name, [active_object]):
+            return
+
+        # resolution by texel density
+        self.set_auto_resolution(active_object.name, [active_object])
+
         # new material
         self.new_pri_node_values = get_principled_node_values(bake_objects)
         new_mat_name = self.settings.new_material_prefix
@@ -702,68 +1970,93 @@ class PBAKER_OT_bake(bpy.types.Operator):
             tex_dir = active_object.name
             self.texture_folder = remove_not_allowed_signs(tex_dir)
 
-        # Go through joblist
-        for self.jobname in self.joblist:
+        if not self.check_texture_folder():
+            self.report({'ERROR'}, 'Error: Texture Folder')
+            raise BakeCancelled()
 
-            # skip, if job is not "Vertex Color" and has no material
-            if not self.jobname == "Vertex Color":
-                skip = any(not has_material(obj) for obj in bake_objects)
-                if skip:
-                    self.report(
-                        {'INFO'}, "{0} baking skipped for '{1}'".format(self.jobname, obj.name))
-                    continue
+        # skip, if job is not "Vertex Color" and has no material
+        for obj in bake_objects:
+            if not has_material(obj):
+                for jobname in self.joblist:
+                    if not jobname == "Vertex Color":
+                        self.report(
+                            {'INFO'}, "{0} baking skipped for '{1}'".format(jobname, obj.name))
+                self.joblist = [j for j in self.joblist if j == "Vertex Color"]
+                break
+
+        # Go through job queue
+        fingerprint_objects = [active_object] + bake_objects
+        queue = schedule_jobs(self.get_job_queue(bake_objects))
+        self.units_count = len(queue)
+        for i, (self.jobname, subname) in enumerate(queue):
+            self.suffix_extension = subname
+            self.set_progress(i, len(queue))
+
+            # skip job, if not in bake plan
+            if self.skip_job_if_not_planned(active_object):
+                continue
+            self.resolved_units.append((active_object.name, self.jobname, self.suffix_extension))
 
-            # [""] <- empty string as the one object to iterate over for non-vertex-colors-jobs
-            subjobs = [""]
-            if self.jobname == "Vertex Color":
-                subjobs = get_vertex_colors_to_bake_from_objects(bake_objects)
+            # skip job, if finished before an interruption
+            if self.skip_job_if_journaled(active_object):
+                continue
 
-            for subname in subjobs:
-                self.suffix_extension = subname
+            # fingerprint of nominal resolution, not the degraded one of the last job
+            self.job_resolution = 0
+            self.job_degraded = False
+            if self.settings.use_bake_cache:
+                self.fingerprint = self.get_fingerprint(fingerprint_objects)
 
-                # skip job, if no overwrite and image exists. load existing image
-                if self.skip_job_if_file_exists(active_object):
-                    continue
+            # skip job, if no overwrite and image exists. load existing image
+            if self.skip_job_if_file_exists(active_object):
+                continue
 
-                # set individual samples
-                set_samples(self.jobname)
+            self.bake_report["Bake Order"].append("{0} '{1}{2}' ({3}, {4} samples, {5} bit)".format(
+                active_object.name, self.jobname, self.suffix_extension,
+                *get_job_signature(self.jobname)[1:]))
 
-                # temp material for vertex color or wireframe
-                if self.settings.use_vertex_color or self.settings.use_wireframe:
-                    for obj in bake_objects:
-                        if not has_material(obj):
-                            add_temp_material(obj)
+            # temp material for vertex color or wireframe
+            if self.settings.use_vertex_color or self.settings.use_wireframe:
+                for obj in bake_objects:
+                    if not has_material(obj):
+                        add_temp_material(obj)
 
-                # Prepare materials
-                self.prepare_materials_of_objects_by_jobname(
-                    bake_objects, self.jobname, subname)
+            # Prepare materials
+            self.prepare_materials_of_objects_by_jobname(
+                bake_objects, self.jobname, subname)
 
-                # image to bake on
-                image = self.new_bake_image(active_object.name)
+            # set individual samples
+            self.set_job_samples(active_object, bake_objects)
+            self.apply_time_budget(active_object, bake_objects)
 
-                # append image to image dict for new material
-                self.new_images[self.jobname + self.suffix_extension] = image
+            # image to bake on
+            image = self.new_bake_image(active_object.name)
 
-                # image nodes to bake
-                create_bake_image_nodes([active_object], image)
+            # append image to image dict for new material
+            self.new_images[self.jobname + self.suffix_extension] = image
 
-                # Bake and Save image!
-                self.bake_and_save(
-                    image,
-                    bake_type=get_bake_type_by(self.jobname))
+            # image nodes to bake
+            create_bake_image_nodes([active_object], image)
 
-                self.clean_after_bake(bake_objects)
-                self.clean_after_bake([active_object])
+            # Bake and Save image!
+            self.start_journal_unit(image)
+            self.bake_and_save(
+                image,
+                bake_type=get_bake_type_by(self.jobname),
+                objects=[active_object])
+            self.add_to_bake_cache(image)
+            self.finish_journal_unit(active_object, image)
 
-        # jobs DONE
+            self.clean_after_bake(bake_objects)
+            self.clean_after_bake([active_object])
 
-        # Glossiness
-        if self.settings.use_invert_roughness:
-            self.create_gloss_image(obj.name)
+            yield
 
-        # Add alpha channel to color
-        if self.settings.use_alpha_to_color:
-            self.alpha_channel_to_color()
+        # jobs DONE
+        self.job_resolution = 0
+
+        # Glossiness and alpha channel to color, tile by tile
+        self.for_each_udim_tile(self.post_process_images, active_object.name)
 
         # add new images to new material
         if self.settings.make_new_material or self.settings.duplicate_objects:
@@ -785,12 +2078,189 @@ class PBAKER_OT_bake(bpy.types.Operator):
                 del(new_mat[MATERIAL_TAG])
 
         # Combine channels
-        self.combine_channels(active_object)
+        self.for_each_udim_tile(self.combine_channels, active_object)
+
+        self.baked_images[active_object.name] = {
+            name: bpy.path.abspath(img.filepath) for name, img in self.new_images.items()}
+        self.set_udim_images(self.new_images.values())
+
+    # -------------------------------------------------------------------------
+    # BAKE HIGH/LOW PAIRS:
+    # -------------------------------------------------------------------------
+    def get_pairs(self, bake_objects) -> list:
+        pairs = get_pairs(bake_objects,
+                          self.settings.pair_low_suffix,
+                          self.settings.pair_high_suffix,
+                          by_collection=self.settings.pair_by == 'COLLECTION')
+        paired = {obj for low, highs in pairs for obj in [low] + highs}
+        unpaired = [obj.name for obj in bake_objects if obj not in paired]
+        if unpaired:
+            self.report({'INFO'}, f"Objects without pair: {unpaired}")
+        return pairs
+
+    def bake_pairs(self, context, bake_objects):
+        """Selected to Active for every low poly object with its high poly objects."""
+
+        pairs = self.get_pairs(bake_objects)
+        if not pairs:
+            self.report({'INFO'}, "baking cancelled. No high/low pairs found.")
+            raise BakeCancelled()
+
+        self.bake_report["Pairs"].extend("{0}: {1}".format(low.name, [obj.name for obj in highs])
+                                         for low, highs in pairs)
+
+        if self.settings.use_background_workers:
+            yield from self.bake_pairs_in_workers(pairs)
+        else:
+            active_object = self.active_object
+            self.objects_count = len(pairs)
+            try:
+                for self.objects_done, (low, highs) in enumerate(pairs):
+                    self.new_images.clear()
+
+                    for obj in bake_objects:
+                        obj.select_set(False)
+                    for obj in [low] + highs:
+                        obj.select_set(True)
+                    context.view_layer.objects.active = low
+                    self.active_object = low
+
+                    yield from self.bake_selected_to_active(context, [low] + highs)
+            finally:
+                self.active_object = active_object
+
+        if self.settings.pair_output == 'MERGED':
+            self.merge_pair_images(context, [low for low, _ in pairs])
+
+    def bake_pairs_in_workers(self, pairs):
+        """Bake independent pairs in parallel background workers."""
+
+        pair_objects = {low: [low] + highs for low, highs in pairs}
+
+        def get_pair_cost(low):
+            return sum(get_object_cost(obj) for obj in pair_objects[low])
+
+        shards = split_into_shards(list(pair_objects), self.settings.worker_count, get_cost=get_pair_cost)
+        jobs = [{"objects": [obj.name for low in shard for obj in pair_objects[low]],
+                 "settings": PAIR_WORKER_SETTINGS,
+                 "draft": self.draft} for shard in shards]
+
+        worker_file = save_worker_file()
+        try:
+            results = yield from self.run_workers(worker_file, jobs)
+        finally:
+            remove_worker_file(worker_file)
+
+        for shard, result in zip(shards, results):
+            if "error" in result:
+                self.report({'ERROR'}, "Worker failed: '{0}'\n{1}".format(
+                    [low.name for low in shard], result["error"]))
+                continue
+            for obj_name, image_paths in result["objects"].items():
+                self.merge_worker_images(bpy.data.objects[obj_name], image_paths)
+
+    def get_uv_coverage(self, context, obj, image) -> np.ndarray:
+        """:returns: Mask (height, width) of texels in UV islands of obj.
+        Bake image nodes of obj are kept, only the guide node is deleted.
+        """
+
+        for o in context.selected_objects:
+            o.select_set(False)
+        obj.select_set(True)
+        context.view_layer.objects.active = obj
+
+        return self.bake_guide([obj], image, 'NORMAL', use_selected_to_active=False)[..., 3] > 0
+
+    def merge_pair_images(self, context, lows):
+        """Merge images of all low poly objects into one texture set.
+        UV islands of the low poly objects must not overlap.
+        UDIM tiles are merged tile by tile.
+        """
+
+        set_name = self.settings.pair_set_name
+        keys = list(dict.fromkeys(key for low in lows for key in self.baked_images.get(low.name, {})))
+        masks = {}
+        self.baked_images[set_name] = {}
+
+        if self.settings.use_texture_folder:
+            self.texture_folder = remove_not_allowed_signs(set_name)
+        if not self.check_texture_folder():
+            self.report({'ERROR'}, 'Error: Texture Folder')
+            return
+
+        for key in keys:
+            # tile number: [(low poly object, path)]. 0 without UDIM tiles
+            tile_parts = {}
+            for low in lows:
+                path = self.baked_images.get(low.name, {}).get(key)
+                if not path:
+                    continue
+                files = find_tile_files(path) if self.settings.use_udim else {0: path}
+                for tile, tile_path in files.items():
+                    tile_parts.setdefault(tile, []).append((low, tile_path))
+
+            self.jobname, self.suffix_extension = split_job_key(key)
+            self.udim_tiles = sorted(tile for tile in tile_parts if tile)
+            for tile, parts in sorted(tile_parts.items(), reverse=True):
+                self.udim_tile = tile
+                path = self.merge_pair_tile(context, key, parts, tile, masks)
+                if path:
+                    self.baked_images[set_name][key] = path  # lowest tile last
+
+        self.bake_report["Pairs"].append("{0}: {1} images merged from {2} pairs".format(
+            set_name, len(self.baked_images[set_name]), len(lows)))
+
+    def merge_pair_tile(self, context, key, parts, tile, masks):
+        """Merge one image (UDIM tile) of parts into the texture set.
+
+        :returns: Path of merged image. None, if not merged.
+        """
+
+        images = [bpy.data.images.load(path, check_existing=True) for _, path in parts]
+        size = tuple(images[0].size)
+        if any(not tuple(image.size) == size for image in images):
+            self.report({'ERROR'}, f"'{key}' not merged. Resolutions of pairs differ.")
+            return None
+
+        result = get_pixels(images[0])
+        covered = np.zeros(result.shape[:2], dtype=bool)
+        for (low, _), image in zip(parts, images):
+            if (low.name, size, tile) not in masks:
+                u, v = get_tile_offset(tile) if tile else (0, 0)
+                offset_uvs([low], -u, -v)
+                try:
+                    masks[(low.name, size, tile)] = self.get_uv_coverage(context, low, image)
+                finally:
+                    offset_uvs([low], u, v)
+            mask = masks[(low.name, size, tile)] & ~covered
+            result[mask] = get_pixels(image)[mask]
+            covered |= mask
+
+        filled, filled_mask = dilate(result, covered, self.render_settings.margin)
+        margin = filled_mask & ~covered
+        result[margin] = filled[margin]
+
+        # texture set image, named like images of its first low poly object
+        img_name = self.get_image_file_name(self.settings.pair_set_name, parts[0][0].name)
+        width, height = size
+        image = bpy.data.images.new(img_name, width, height, alpha=True,
+                                    float_buffer=images[0].is_float)
+        image.colorspace_settings.name = images[0].colorspace_settings.name
+        image.filepath = self.get_image_file_path(img_name)
+        set_pixels(image, result)
+        image.save()
+        save_image(image, self.jobname)
+        image.reload()
+        return bpy.path.abspath(image.filepath)
 
     # -------------------------------------------------------------------------
     # EXECUTE
     # -------------------------------------------------------------------------
-    def execute(self, context):
+    def init_bake(self, context):
+        """Test conditions and init everything to bake.
+
+        :returns: True, if baking is possible, else False.
+        """
 
         self.prefs = context.preferences.addons[__package__].preferences
 
@@ -798,7 +2268,19 @@ class PBAKER_OT_bake(bpy.types.Operator):
         self.render_settings = context.scene.render.bake
 
         if not self.can_execute(context):
-            return {'CANCELLED'}
+            return False
+
+        # units of bake plan. None bakes all
+        self.planned_units = None
+        if self.plan_file:
+            with open(bpy.path.abspath(self.plan_file)) as f:
+                plan = json.load(f)
+            if plan["errors"]:
+                for message in plan["errors"]:
+                    self.report({'ERROR'}, message)
+                return False
+            self.planned_units = {(unit["object"], unit["job"], unit["subjob"]): unit.get("load", False)
+                                  for unit in plan["units"]}
 
         self.active_object = context.active_object
         if not self.active_object:
@@ -807,7 +2289,7 @@ class PBAKER_OT_bake(bpy.types.Operator):
         if not self.active_object.type == 'MESH':
             self.report({'ERROR'}, '{0} is not a mesh object'.format(
                 self.active_object.name))
-            return {'CANCELLED'}
+            return False
 
         self.selected_objects = context.selected_objects
         for obj in self.selected_objects:
@@ -836,6 +2318,15 @@ class PBAKER_OT_bake(bpy.types.Operator):
         if not len(context.scene.principled_baker_suffixlist):
             bpy.ops.principled_baker_suffixlist.init()
 
+        # objects with atlas UV map and their active UV map - See clean up!
+        self.atlas_objects = {}
+
+        # Frozen meshes - See clean up!
+        self.frozen_objects = {}
+        self.freeze_report = []
+        if self.settings.use_freeze_meshes:
+            self.freeze_meshes(context)
+
         # Auto Smooth - See clean up!
         self.auto_smooth_list = {}
         if not self.settings.auto_smooth == 'OBJECT':
@@ -851,6 +2342,10 @@ class PBAKER_OT_bake(bpy.types.Operator):
         # Samples to restore - See clean up!
         self.org_samples = context.scene.cycles.samples
 
+        # Cycles settings changed by profiles. see apply_profile()
+        self.org_cycles_settings = {}
+        self.profile_times = {}
+
         # images for new material. "name":image
         self.new_images = {}
 
@@ -868,13 +2363,101 @@ class PBAKER_OT_bake(bpy.types.Operator):
         self.orig_uv_layers_active_indices = {}
         self.active_outputs = []
 
+        self.all_material_outputs = {}
+
+        # baked images by object name. "object name":{"name":path}
+        self.baked_images = {}
+
+        # job queues by object name ordered by scheduler (BATCH)
+        self.scheduled_queues = {}
+
+        # all (object name, jobname, subname) of this bake. see final pass
+        self.resolved_units = []
+
+        # run report. "section":[lines]
+        self.bake_report = {"Bake Order": [], "Resolution": [], "Samples": [],
+                            "Convergence": [], "Time Budget": [], "Profiles": [], "Run": [],
+                            "Frozen Meshes": self.freeze_report, "Linked Duplicates": [],
+                            "Atlas": [], "Pairs": [], "Partition": [],
+                            "UDIM": []}
+        self.run_start = time.time()
+        self.run_memory = get_peak_memory()
+
+        # loaded buffers of baked images. see memory budget
+        self.baked_image_buffers = []
+        self.images_freed = 0
+
+        # time budget. see apply_time_budget()
+        self.budget_deadline = time.time() + self.settings.time_budget * 60
+        self.budget_scale = 1.0
+        self.job_deterministic = False
+        self.bake_seconds = 0.0
+        self.bake_cost = 0
+        self.job_cost = 0
+        self.job_resolution = 0
+        self.job_degraded = False
+        self.object_resolution = 0
+        self.units_count = 0
+        self.units_passed = 0
+        self.degraded_objects = set()
+
+        # bake cache of output directory. see get_fingerprint()
+        self.cache_dir = bpy.path.abspath(self.settings.file_path)
+        self.bake_cache = read_cache(self.cache_dir) if self.settings.use_bake_cache else {}
+        self.object_fingerprints = {}
+        self.scene_fingerprint = ""
+        self.fingerprint = ""
+
+        # Isolated scene is created with the first bake
+        self.isolated_scene = None
+
+        # regions of selected to active objects. see get_partition()
+        self.partitions = {}
+        # UV coverage of low poly objects by (name, size, tile). see bake_regions()
+        self.coverage_masks = {}
+
+        # UDIM tiles of current objects. see set_udim_tiles()
+        self.udim_tiles = []
+        self.udim_tile = 0
+
+        # journal of this bake. see clean up!
+        self.journal_path = get_journal_path(self.cache_dir, bpy.data.filepath)
+        last_journal = read_journal(self.journal_path) if self.use_journal else new_journal()
+        self.unfinished_path = last_journal["started"]
+        self.journal = new_journal()
+        if self.settings.use_resume:
+            self.journal["done"] = last_journal["done"]
+            self.clean_leftovers(self.bake_objects)
+
+        # progress of all bake objects (0..1)
+        self.progress = 0.0
+        self.objects_done = 0
+        self.objects_count = 1
+
+        return True
+
+    def bake_steps(self, context):
+        """Generator for all bake modes. Yields after every baked image.
+        While background workers run, yields seconds to wait before the next poll.
+        Raises BakeCancelled, if baking is not possible. See cancel_bake()
+        """
+
         # deligate bake modes
         if self.settings.bake_mode == 'COMBINED':
-            self.bake_combined(context, self.bake_objects)
+            yield from self.bake_combined(context, self.bake_objects)
         elif self.settings.bake_mode == 'BATCH':
-            self.bake_batch(context, self.bake_objects)
+            if self.settings.use_atlas:
+                yield from self.bake_atlas(context, self.bake_objects)
+            elif self.settings.use_background_workers and self.settings.use_worker_queue:
+                yield from self.bake_batch_in_queue(context, self.bake_objects)
+            elif self.settings.use_background_workers:
+                yield from self.bake_batch_in_workers(context, self.bake_objects)
+            else:
+                yield from self.bake_batch(context, self.bake_objects)
+        elif self.is_pairs():
+            yield from self.bake_pairs(context, self.bake_objects)
         elif self.settings.bake_mode == 'SELECTED_TO_ACTIVE':
-            self.bake_selected_to_active(context, self.bake_objects)
+            yield from self.bake_selected_to_active(context, self.bake_objects)
 
         # join duplicate objects
         if self.settings.join_duplicate_objects and len(self.dup_objects) > 1:
@@ -889,6 +2472,104 @@ class PBAKER_OT_bake(bpy.types.Operator):
                 bpy.context.view_layer.objects.active = self.active_object
                 bpy.ops.object.make_links_data(type='MODIFIERS')
 
+        self.progress = 1.0
+
+    def finish_bake(self, context):
+        self.final_cleanup()
+
+        # all done. nothing to resume
+        if self.use_journal:
+            remove_journal(self.journal_path)
+
+        for profile_name, (count, seconds) in self.profile_times.items():
+            self.bake_report["Profiles"].append(
+                f"{profile_name}: {count} images, {seconds:.1f} s, {seconds / count:.2f} s per image")
+
+        # undo push is done after the run. Compare runs with and without undo
+        self.bake_report["Run"].append("{0}: {1:.1f} s, peak memory {2:.0f} MB ({3:+.0f} MB)".format(
+            self.bl_label, time.time() - self.run_start, get_peak_memory(),
+            get_peak_memory() - self.run_memory))
+        if self.settings.use_memory_budget:
+            self.bake_report["Run"].append("Memory Budget: {0} MB, {1} image buffers freed".format(
+                self.settings.memory_budget, self.images_freed))
+
+        write_report(self.bake_report)
+
+        if self.draft and not self.settings.draft_final_pass == 'NONE':
+            self.queue_final_pass(context)
+
+        if self.result_file:
+            with open(self.result_file, 'w') as f:
+                json.dump({"objects": self.baked_images,
+                           "report": self.bake_report}, f)
+
+    def queue_final_pass(self, context):
+        """Write manifest and plan for the full quality pass of a draft.
+        The plan reuses the jobs resolved by the draft.
+        Optionally start it in a background worker.
+        New materials are made by the draft. Use Final Images switches them
+        to the final images, see PBAKER_OT_use_final_images.
+        """
+
+        draft_dir = Path(bpy.path.abspath(self.settings.file_path)) / self.settings.draft_folder
+        plan_file = draft_dir / "final_plan.json"
+        manifest_file = draft_dir / FINAL_MANIFEST_FILE_NAME
+
+        manifest = get_manifest_from_scene(context.scene)
+        manifest["objects"] = [self.active_object.name]
+        manifest["objects"].extend(obj.name for obj in self.bake_objects
+                                   if not obj == self.active_object)
+
+        # units are not known for shards of background workers
+        if self.resolved_units:
+            with open(plan_file, 'w') as f:
+                json.dump({"errors": [],
+                           "units": [{"object": name, "job": jobname, "subjob": subname}
+                                     for name, jobname, subname in self.resolved_units]}, f, indent=2)
+            manifest["plan_file"] = str(plan_file)
+
+        manifest["result_file"] = str(draft_dir / FINAL_RESULT_FILE_NAME)
+        manifest["settings"].update(FINAL_PASS_SETTINGS)
+        # draft images to switch to the final images
+        manifest["draft_images"] = self.baked_images
+
+        if self.settings.draft_final_pass == 'BACKGROUND':
+            manifest["blend_file"] = save_worker_file(suffix="final")
+            manifest["remove_blend_file"] = True
+
+        with open(manifest_file, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        if self.settings.draft_final_pass == 'BACKGROUND':
+            start_worker(manifest["blend_file"], str(manifest_file),
+                         log_file=str(draft_dir / "final_log.txt"),
+                         threads=self.settings.worker_threads)
+            self.report({'INFO'}, "Final pass started in background. "
+                                  "Use Final Images, when it is finished.")
+        else:
+            self.report({'INFO'}, "Final pass queued: '{0}'. "
+                                  "Use Final Images, when it is finished.".format(manifest_file))
+
+    def cancel_bake(self, context):
+        """Clean up after cancelled bake steps."""
+
+        self.clean_after_bake(self.bake_objects)
+        for mat_output, target in self.all_material_outputs.items():
+            mat_output.target = target
         self.final_cleanup()
 
+    def execute(self, context):
+        if not self.init_bake(context):
+            return {'CANCELLED'}
+
+        try:
+            for wait in self.bake_steps(context):
+                if wait:
+                    time.sleep(wait)
+        except BakeCancelled:
+            self.cancel_bake(context)
+            return {'CANCELLED'}
+
+        self.finish_bake(context)
+
         return {'FINISHED'}
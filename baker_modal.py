@@ -0,0 +1,130 @@
+import time
+
+from .baker import BakeCancelled, PBAKER_OT_bake
+
+TIMER_INTERVAL = 0.1
+
+
+def format_time(seconds) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    return f"{minutes}m {seconds:02d}s"
+
+
+class PBAKER_OT_bake_modal(PBAKER_OT_bake):
+    """Bake without blocking Blender. Press Esc to cancel"""
+
+    bl_idname = "object.principled_baker_bake_modal"
+    bl_label = "Bake (Non-Blocking)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def start(self, context):
+        if not self.init_bake(context):
+            return {'CANCELLED'}
+
+        self.scene = context.scene
+        self.view_layer = context.view_layer
+        self.steps = self.bake_steps(context)
+        self.start_time = time.time()
+        self.store_selection()
+
+        wm = context.window_manager
+        self.timer = wm.event_timer_add(TIMER_INTERVAL, window=context.window)
+        wm.progress_begin(0, 100)
+        wm.modal_handler_add(self)
+        self.update_status(context)
+
+        return {'RUNNING_MODAL'}
+
+    def invoke(self, context, event):
+        return self.start(context)
+
+    def execute(self, context):
+        return self.start(context)
+
+    def cancel(self, context):
+        """Blender cancels the modal operator (eg. file loaded or window closed)."""
+
+        self.steps.close()
+        self.cancel_bake(context)
+        self.end_status(context)
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.cancel(context)
+            self.report({'INFO'}, "Baking cancelled.")
+            return {'CANCELLED'}
+
+        if not event.type == 'TIMER':
+            return {'PASS_THROUGH'}
+
+        try:
+            self.next_step(context)
+        except StopIteration:
+            self.finish_bake(context)
+            self.end_status(context)
+            self.report({'INFO'}, "Baking finished in {0}.".format(
+                format_time(time.time() - self.start_time)))
+            return {'FINISHED'}
+        except BakeCancelled:
+            self.cancel(context)
+            return {'CANCELLED'}
+        except Exception:
+            self.cancel(context)
+            raise
+
+        self.update_status(context)
+        return {'PASS_THROUGH'}
+
+    def next_step(self, context):
+        """Bake next image in the scene the bake was started in."""
+
+        if hasattr(context, "temp_override"):
+            with context.temp_override(scene=self.scene, view_layer=self.view_layer):
+                self.next_step_in_selection()
+        elif context.scene == self.scene:
+            self.next_step_in_selection()
+        # else: wait until the user is back in the bake scene
+
+    def next_step_in_selection(self):
+        """Selection changes of the user between steps are undone."""
+
+        self.restore_selection()
+        try:
+            next(self.steps)
+        finally:
+            self.store_selection()
+
+    def store_selection(self):
+        """Keep names of selected and active object of the bake steps."""
+
+        view_layer = self.view_layer
+        self.selected_names = {obj.name for obj in view_layer.objects
+                               if obj.select_get(view_layer=view_layer)}
+        self.active_name = view_layer.objects.active.name if view_layer.objects.active else ""
+
+    def restore_selection(self):
+        for obj in self.view_layer.objects:
+            obj.select_set(obj.name in self.selected_names, view_layer=self.view_layer)
+        self.view_layer.objects.active = self.view_layer.objects.get(self.active_name)
+
+    def update_status(self, context):
+        elapsed = time.time() - self.start_time
+        text = "Principled Baker: {0:.0f}%".format(self.progress * 100)
+        if self.jobname:
+            text += " '{0}'".format(self.jobname)
+        if self.progress > 0:
+            eta = elapsed / self.progress * (1 - self.progress)
+            text += " - ETA {0}".format(format_time(eta))
+        text += " (Esc to cancel)"
+
+        context.workspace.status_text_set(text)
+        context.window_manager.progress_update(int(self.progress * 100))
+
+    def end_status(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self.timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
@@ -0,0 +1,40 @@
+import time
+import traceback
+
+from .baker import BakeCancelled, PBAKER_OT_bake
+from .material.snapshot import get_material_snapshot, restore_material_snapshot
+
+
+class PBAKER_OT_bake_no_undo(PBAKER_OT_bake):
+    """Bake without an undo step. Saves the time and memory of the undo push.
+    Materials are restored, if baking fails"""
+
+    bl_idname = "object.principled_baker_bake_no_undo"
+    bl_label = "Bake (No Undo)"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        snapshot = get_material_snapshot(context.selected_objects)
+
+        if not self.init_bake(context):
+            return {'CANCELLED'}
+
+        try:
+            for wait in self.bake_steps(context):
+                if wait:
+                    time.sleep(wait)
+        except BakeCancelled:
+            self.cancel_bake(context)
+            return {'CANCELLED'}
+        except Exception:
+            traceback.print_exc()
+            try:
+                self.cancel_bake(context)
+            finally:
+                restore_material_snapshot(snapshot)
+            self.report({'ERROR'}, "Baking failed. Materials restored. See console.")
+            return {'CANCELLED'}
+
+        self.finish_bake(context)
+
+        return {'FINISHED'}
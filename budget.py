@@ -0,0 +1,39 @@
+import math
+
+MIN_BUDGET_RESOLUTION = 128
+
+
+def get_budget_scale(seconds_left, seconds_per_cost, nominal_cost, units_left) -> float:
+    """:returns: Factor (0..1] for the cost of remaining units to meet the budget.
+    1 without measurement yet. 0, if the budget is used up.
+    """
+
+    if seconds_per_cost is None or units_left <= 0:
+        return 1.0
+    if seconds_left <= 0:
+        return 0.0
+    seconds_needed = seconds_per_cost * nominal_cost * units_left
+    if seconds_needed <= seconds_left:
+        return 1.0
+    return seconds_left / seconds_needed
+
+
+def degrade(samples, resolution, scale) -> tuple:
+    """Scale the cost (resolution^2 * samples) of a unit.
+    Samples are lowered first, then resolution is halved.
+
+    :returns: (samples, resolution)
+    """
+
+    if scale >= 1:
+        return samples, resolution
+
+    new_samples = max(1, math.floor(samples * scale))
+
+    # cost still to drop by resolution
+    rest = scale * samples / new_samples
+    new_resolution = resolution
+    while new_resolution > MIN_BUDGET_RESOLUTION and rest < 1:
+        new_resolution //= 2
+        rest *= 4
+    return new_samples, max(new_resolution, min(resolution, MIN_BUDGET_RESOLUTION))
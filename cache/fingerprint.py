@@ -0,0 +1,218 @@
+import hashlib
+import os
+
+import bpy
+import numpy as np
+
+from ..nodes.outputs import get_active_output
+
+# properties every node has. only values which change the shading are hashed
+NODE_BASE_PROPERTIES = {prop.identifier for prop in bpy.types.Node.bl_rna.properties}
+
+SIMPLE_PROPERTY_TYPES = {'BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM'}
+
+# objects casting shadows or bouncing light
+GEOMETRY_TYPES = {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT'}
+
+
+def update_value(h, value):
+    if hasattr(value, "__len__") and not isinstance(value, str):
+        value = tuple(value)
+    h.update(repr(value).encode('utf-8'))
+
+
+def update_image(h, image):
+    h.update(image.name.encode('utf-8'))
+    update_value(h, image.source)
+    path = bpy.path.abspath(image.filepath)
+    update_value(h, path)
+    if os.path.isfile(path):
+        update_value(h, os.path.getmtime(path))
+    update_value(h, image.colorspace_settings.name)
+
+
+def update_color_ramp(h, color_ramp):
+    update_value(h, color_ramp.interpolation)
+    for element in color_ramp.elements:
+        update_value(h, element.position)
+        update_value(h, element.color)
+
+
+def update_curve_mapping(h, mapping):
+    for curve in mapping.curves:
+        for point in curve.points:
+            update_value(h, point.location)
+
+
+def update_node(h, node, visited_trees):
+    h.update(node.bl_idname.encode('utf-8'))
+
+    for prop in node.bl_rna.properties:
+        if prop.identifier in NODE_BASE_PROPERTIES:
+            continue
+        value = getattr(node, prop.identifier, None)
+        if prop.type in SIMPLE_PROPERTY_TYPES:
+            update_value(h, value)
+        elif isinstance(value, bpy.types.Image):
+            update_image(h, value)
+        elif isinstance(value, bpy.types.ColorRamp):
+            update_color_ramp(h, value)
+        elif isinstance(value, bpy.types.CurveMapping):
+            update_curve_mapping(h, value)
+        elif isinstance(value, bpy.types.ShaderNodeTree):
+            update_node_tree(h, value, visited_trees=visited_trees)
+
+    for socket in node.inputs:
+        if not socket.is_linked and hasattr(socket, "default_value"):
+            update_value(h, socket.default_value)
+
+
+def get_upstream_nodes(node) -> list:
+    """:returns: All nodes feeding node (including node) in stable order."""
+
+    nodes = []
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if n in nodes:
+            continue
+        nodes.append(n)
+        for socket in n.inputs:
+            for link in socket.links:
+                stack.append(link.from_node)
+    return nodes
+
+
+def update_node_tree(h, node_tree, output_node=None, visited_trees=None):
+    """Hash all nodes and links feeding output_node.
+    Without output_node (node groups) the Group Output is used.
+    """
+
+    if visited_trees is None:
+        visited_trees = set()
+    if node_tree.name in visited_trees:
+        return
+    visited_trees.add(node_tree.name)
+
+    if not output_node:
+        output_node = next((n for n in node_tree.nodes if n.type == 'GROUP_OUTPUT'), None)
+    if not output_node:
+        return
+
+    for node in get_upstream_nodes(output_node):
+        update_node(h, node, visited_trees)
+        for socket in node.inputs:
+            for link in socket.links:
+                update_value(h, (link.from_node.name, link.from_socket.identifier,
+                                 node.name, socket.identifier))
+
+
+def update_color_layers(h, mesh):
+    """Hash all vertex colors (color attributes since Blender 3.2) of mesh."""
+
+    if hasattr(mesh, "color_attributes"):
+        layers = mesh.color_attributes
+    else:
+        layers = mesh.vertex_colors
+    for layer in layers:
+        h.update(layer.name.encode('utf-8'))
+        colors = np.empty(len(layer.data) * 4, dtype=np.float32)
+        layer.data.foreach_get("color", colors)
+        h.update(colors.tobytes())
+
+
+def update_mesh(h, obj, depsgraph):
+    """Hash evaluated vertices, faces, material indices, normals, vertex colors
+    and active UV map of object.
+    """
+
+    eval_obj = obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    h.update(co.tobytes())
+
+    loops = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loops)
+    h.update(loops.tobytes())
+
+    material_indices = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_indices)
+    h.update(material_indices.tobytes())
+
+    # loop normals include smooth shading, auto smooth and custom split normals
+    if hasattr(mesh, "calc_normals_split"):
+        mesh.calc_normals_split()
+    normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    mesh.loops.foreach_get("normal", normals)
+    h.update(normals.tobytes())
+
+    update_color_layers(h, mesh)
+
+    if mesh.uv_layers.active:
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        mesh.uv_layers.active.data.foreach_get("uv", uvs)
+        h.update(uvs.tobytes())
+
+    update_value(h, [v for row in obj.matrix_world for v in row])
+
+    eval_obj.to_mesh_clear()
+
+
+def get_object_fingerprint(obj, depsgraph) -> str:
+    """:returns: Hash of evaluated mesh, UVs and material node trees of object."""
+
+    h = hashlib.sha1()
+    update_mesh(h, obj, depsgraph)
+    for mat_slot in obj.material_slots:
+        mat = mat_slot.material
+        if mat and mat.use_nodes:
+            output_node = get_active_output(mat)
+            if output_node:
+                update_node_tree(h, mat.node_tree, output_node)
+    return h.hexdigest()
+
+
+def update_simple_properties(h, data):
+    for prop in data.bl_rna.properties:
+        if prop.type in SIMPLE_PROPERTY_TYPES and not prop.identifier == 'name':
+            update_value(h, getattr(data, prop.identifier, None))
+
+
+def get_scene_fingerprint(view_layer, world, depsgraph) -> str:
+    """:returns: Hash of world, lights and render visible objects.
+    Lit jobs (eg. Diffuse, Ambient Occlusion) change with them.
+    """
+
+    h = hashlib.sha1()
+
+    if world and world.use_nodes:
+        output_node = next((n for n in world.node_tree.nodes
+                            if n.type == 'OUTPUT_WORLD' and n.is_active_output), None)
+        if output_node:
+            update_node_tree(h, world.node_tree, output_node)
+    elif world:
+        update_value(h, world.color)
+
+    for obj in sorted(view_layer.objects, key=lambda o: o.name):
+        if obj.hide_render:
+            continue
+        if obj.type == 'LIGHT':
+            h.update(obj.name.encode('utf-8'))
+            update_simple_properties(h, obj.data)
+            update_value(h, [v for row in obj.matrix_world for v in row])
+        elif obj.type in GEOMETRY_TYPES:
+            h.update(obj.name.encode('utf-8'))
+            h.update(get_object_fingerprint(obj, depsgraph).encode('utf-8'))
+    return h.hexdigest()
+
+
+def get_job_fingerprint(object_fingerprints, job_settings) -> str:
+    """:returns: Hash of object fingerprints and settings of one bake job."""
+
+    h = hashlib.sha1()
+    for fingerprint in object_fingerprints:
+        h.update(fingerprint.encode('utf-8'))
+    update_value(h, sorted(job_settings.items()))
+    return h.hexdigest()
@@ -0,0 +1,65 @@
+import json
+import os
+from pathlib import Path
+
+CACHE_FILE_NAME = ".pbaker_cache.json"
+
+
+def read_cache(directory) -> dict:
+    """:returns: Bake cache of output directory. "relative image path":entry"""
+
+    path = Path(directory) / CACHE_FILE_NAME
+    if not path.is_file():
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except ValueError:
+        return {}
+
+
+def write_cache(directory, cache):
+    """Merge cache into cache file. Background workers share one cache file."""
+
+    path = Path(directory) / CACHE_FILE_NAME
+    merged = read_cache(directory)
+    merged.update(cache)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(merged, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def get_file_stamp(path) -> list:
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime]
+
+
+def is_entry_intact(directory, rel_path, entry) -> bool:
+    """:returns: True, if the image file was not changed since it was baked."""
+
+    path = os.path.join(directory, rel_path)
+    return os.path.isfile(path) and get_file_stamp(path) == entry["stamp"]
+
+
+def find_cached_file(directory, cache, fingerprint, path):
+    """:returns: Relative path of an intact image baked with fingerprint.
+    path is preferred (eg. renamed objects find their old images). None, if
+    there is none.
+    """
+
+    rel_path = os.path.relpath(path, directory)
+    entry = cache.get(rel_path)
+    if entry and entry["fingerprint"] == fingerprint and is_entry_intact(directory, rel_path, entry):
+        return rel_path
+
+    for rel_path, entry in cache.items():
+        if entry["fingerprint"] == fingerprint and is_entry_intact(directory, rel_path, entry):
+            return rel_path
+    return None
+
+
+def add_to_cache(directory, cache, path, fingerprint):
+    rel_path = os.path.relpath(path, directory)
+    cache[rel_path] = {"fingerprint": fingerprint,
+                       "stamp": get_file_stamp(path)}
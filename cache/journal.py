@@ -0,0 +1,66 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_journal_path(directory, blend_file) -> str:
+    """:returns: Path of journal for blend file in output directory."""
+
+    stem = Path(blend_file).stem
+    return str(Path(directory) / f".{stem}.pbaker_journal.json")
+
+
+def new_journal() -> dict:
+    """Journal of a bake session.
+
+    "done": finished units. "unit key":{"path":path, "hash":hash}
+    "started": path of the image being baked. Not trusted after a crash.
+    """
+
+    return {"done": {}, "started": None}
+
+
+def read_journal(path) -> dict:
+    if not os.path.isfile(path):
+        return new_journal()
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except ValueError:
+        return new_journal()
+
+
+def write_journal(path, journal):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(journal, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def remove_journal(path):
+    if os.path.isfile(path):
+        os.remove(path)
+
+
+def get_unit_key(object_name, jobname, subname) -> str:
+    return json.dumps([object_name, jobname, subname])
+
+
+def get_file_hash(path) -> str:
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def is_unit_intact(journal, key) -> bool:
+    """:returns: True, if unit is done and its image was not changed since."""
+
+    entry = journal["done"].get(key)
+    if not entry or not os.path.isfile(entry["path"]):
+        return False
+    return get_file_hash(entry["path"]) == entry["hash"]
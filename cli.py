@@ -0,0 +1,89 @@
+import json
+import os
+import sys
+import tempfile
+import time
+import traceback
+
+import bpy
+
+from .worker.manifest import (apply_manifest, get_manifest_objects,
+                              read_manifest, select_objects)
+from .worker.run import get_job_file
+
+STATUS_PREFIX = "PRINCIPLED_BAKER_STATUS"
+
+EXIT_CODES = {
+    'FINISHED': 0,
+    'ERROR': 1,
+    'CANCELLED': 2,
+}
+
+
+def bake_manifest(manifest) -> dict:
+    """Bake objects of current blend file by manifest.
+
+    :returns: Status dictionary.
+    """
+
+    status = {"status": 'ERROR', "objects": {}}
+    start = time.time()
+    result_file = manifest.get("result_file") or os.path.join(
+        tempfile.gettempdir(), f"pbaker_result_{os.getpid()}.json")
+
+    try:
+        scene = bpy.context.scene
+        apply_manifest(scene, manifest)
+
+        objects = get_manifest_objects(manifest)
+        if not objects:
+            raise ValueError("No objects to bake in manifest")
+        select_objects(objects)
+
+        ret = bpy.ops.object.principled_baker_bake(
+            result_file=result_file, plan_file=manifest.get("plan_file", ""),
+            draft=manifest.get("draft", False))
+        if 'CANCELLED' in ret:
+            status["status"] = 'CANCELLED'
+            status["error"] = "Baking cancelled. See log for reports."
+        elif not os.path.isfile(result_file):
+            raise RuntimeError(f"No result written: {ret}")
+        else:
+            status["status"] = 'FINISHED'
+            status["objects"] = read_manifest(result_file)["objects"]
+    except Exception as e:
+        status["error"] = str(e)
+        status["traceback"] = traceback.format_exc()
+
+    status["time"] = time.time() - start
+    return status
+
+
+def main():
+    """Headless entry point.
+
+    blender -b scene.blend --python-expr "import addon_utils, importlib;
+    addon_utils.enable('<addon>'); importlib.import_module('<addon>.cli').main()"
+    -- manifest.json
+
+    Prints the status as one JSON line, writes it to "status_file" (if in
+    manifest) and exits with 0 (finished), 1 (error) or 2 (cancelled).
+    """
+
+    try:
+        manifest = read_manifest(get_job_file())
+    except Exception as e:
+        manifest = {}
+        status = {"status": 'ERROR', "error": f"Manifest: {e}"}
+    else:
+        status = bake_manifest(manifest)
+
+    print(STATUS_PREFIX, json.dumps(status))
+
+    if manifest.get("status_file"):
+        with open(manifest["status_file"], 'w') as f:
+            json.dump(status, f, indent=2)
+
+    sys.stdout.flush()
+    sys.exit(EXIT_CODES[status["status"]])
+
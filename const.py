@@ -92,3 +92,29 @@ IMAGE_FILE_FORMAT_ENDINGS = {
 
 # signs not allowed in file names or paths
 NOT_ALLOWED_SIGNS = ['\\', '/', ':', '*', '?', '"', '<', '>', '|']
+
+# nodes with different results per sample
+STOCHASTIC_NODES = {
+    'AMBIENT_OCCLUSION',
+    'BEVEL',
+    'LIGHT_PATH',
+    'LIGHT_FALLOFF',
+    'SHADER_TO_RGB',
+}
+
+# outputs with random values per UV island
+STOCHASTIC_OUTPUTS = {"Random Per Island"}
+
+# jobs depending on lights and surrounding objects
+LIT_JOBS = {"Ambient Occlusion", "Diffuse"}
+
+# jobs to bake with few samples and denoise
+DENOISE_JOBS = LIT_JOBS
+
+# nodes with different results per object (eg. of linked duplicates)
+OBJECT_DEPENDENT_NODES = {
+    'OBJECT_INFO',
+    'PARTICLE_INFO',
+    'NEW_GEOMETRY',
+    'TEX_POINTDENSITY',
+}
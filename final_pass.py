@@ -0,0 +1,62 @@
+import os
+from pathlib import Path
+
+import bpy
+
+from .worker.manifest import read_manifest
+
+FINAL_MANIFEST_FILE_NAME = "final_manifest.json"
+FINAL_RESULT_FILE_NAME = "final_result.json"
+
+
+def relink_final_images(draft_images, final_images, relative=False) -> int:
+    """Switch images loaded from draft files to the files of the final pass.
+    Materials made by the draft keep their image nodes.
+
+    :param draft_images: Draft image paths by object name and job.
+    :param final_images: Final image paths by object name and job.
+    :returns: Count of switched images.
+    """
+
+    final_paths = {}  # draft path: final path
+    for obj_name, paths in draft_images.items():
+        for key, path in paths.items():
+            final_path = final_images.get(obj_name, {}).get(key)
+            if final_path and os.path.isfile(final_path):
+                final_paths[os.path.normpath(bpy.path.abspath(path))] = final_path
+
+    count = 0
+    for image in bpy.data.images:
+        final_path = final_paths.get(os.path.normpath(bpy.path.abspath(image.filepath)))
+        if not final_path:
+            continue
+        image.filepath = bpy.path.relpath(final_path) if relative else final_path
+        image.reload()
+        count += 1
+    return count
+
+
+class PBAKER_OT_use_final_images(bpy.types.Operator):
+    """Switch images of the draft to the images of the finished final pass"""
+
+    bl_idname = "object.principled_baker_use_final_images"
+    bl_label = "Use Final Images"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.principled_baker_settings
+
+        draft_dir = Path(bpy.path.abspath(settings.file_path)) / settings.draft_folder
+        manifest_file = draft_dir / FINAL_MANIFEST_FILE_NAME
+        result_file = draft_dir / FINAL_RESULT_FILE_NAME
+        if not manifest_file.is_file() or not result_file.is_file():
+            self.report({'ERROR'}, "No final result in '{0}'. Final pass not finished yet?".format(draft_dir))
+            return {'CANCELLED'}
+
+        manifest = read_manifest(manifest_file)
+        result = read_manifest(result_file)
+        count = relink_final_images(manifest.get("draft_images", {}), result["objects"],
+                                    relative=settings.file_path.startswith("//"))
+
+        self.report({'INFO'}, "{0} draft images switched to final images.".format(count))
+        return {'FINISHED'}
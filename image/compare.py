@@ -0,0 +1,12 @@
+import numpy as np
+
+
+def get_rmse(a, b, mask) -> float:
+    """:returns: Root mean square error of RGB between pixels (height, width, 4)
+    of masked texels. 0, if mask is empty.
+    """
+
+    if not mask.any():
+        return 0.0
+    diff = a[mask, :3] - b[mask, :3]
+    return float(np.sqrt(np.mean(diff * diff)))
@@ -0,0 +1,100 @@
+import os
+import tempfile
+
+import bpy
+import numpy as np
+
+from ..image.pixels import get_pixels, new_data_image, set_pixels
+
+DENOISE_SCENE_NAME = "Principled Baker Denoise"
+
+RENDER_RESULT_NAME = "Render Result"
+
+
+def new_render_slot() -> tuple:
+    """Render into a new slot of the Render Result, so the render of the user is kept.
+
+    Must be removed after rendering! See remove_render_slot()
+
+    :returns: (render slot, original active slot index). (None, 0) without Render Result.
+    """
+
+    render_result = bpy.data.images.get(RENDER_RESULT_NAME)
+    if not render_result or not hasattr(render_result.render_slots, "new"):
+        return None, 0
+
+    slots = render_result.render_slots
+    active_index = slots.active_index
+    slot = slots.new(name=DENOISE_SCENE_NAME)
+    slots.active_index = len(slots) - 1
+    return slot, active_index
+
+
+def remove_render_slot(slot, active_index):
+    if slot is None:
+        return
+    slots = bpy.data.images[RENDER_RESULT_NAME].render_slots
+    slots.remove(slot)
+    slots.active_index = active_index
+
+
+def denoise_pixels(pixels, normal, albedo, use_hdr=False) -> np.ndarray:
+    """Denoise with the Denoise node of the compositor (Open Image Denoise, CPU).
+    Nothing is rendered, the compositor runs on the given pixels only.
+    The result goes to a temporary slot of the Render Result.
+
+    :param pixels, normal, albedo: (height, width, 4) arrays
+    :returns: Denoised (height, width, 4) array
+    """
+
+    height, width = pixels.shape[:2]
+    scene = bpy.data.scenes.new(DENOISE_SCENE_NAME)
+    images = []
+    fd, tmp_file = tempfile.mkstemp(prefix="pbaker_denoise_", suffix=".exr")
+    os.close(fd)
+
+    try:
+        scene.use_nodes = True
+        tree = scene.node_tree
+        tree.nodes.clear()
+
+        denoise_node = tree.nodes.new('CompositorNodeDenoise')
+        denoise_node.use_hdr = use_hdr
+        composite_node = tree.nodes.new('CompositorNodeComposite')
+        tree.links.new(denoise_node.outputs['Image'], composite_node.inputs['Image'])
+
+        for socket_name, data in (("Image", pixels), ("Normal", normal), ("Albedo", albedo)):
+            image = new_data_image(f"{DENOISE_SCENE_NAME} {socket_name}", width, height)
+            set_pixels(image, data)
+            images.append(image)
+            image_node = tree.nodes.new('CompositorNodeImage')
+            image_node.image = image
+            tree.links.new(image_node.outputs['Image'], denoise_node.inputs[socket_name])
+
+        render = scene.render
+        render.resolution_x = width
+        render.resolution_y = height
+        render.resolution_percentage = 100
+        render.image_settings.file_format = 'OPEN_EXR'
+        render.image_settings.color_depth = '32'
+        scene.view_settings.view_transform = 'Raw'
+        scene.view_settings.look = 'None'
+
+        slot, active_index = new_render_slot()
+        try:
+            bpy.ops.render.render(scene=scene.name)
+            bpy.data.images[RENDER_RESULT_NAME].save_render(tmp_file, scene=scene)
+        finally:
+            remove_render_slot(slot, active_index)
+
+        result = bpy.data.images.load(tmp_file)
+        result.colorspace_settings.name = 'Non-Color'
+        images.append(result)
+        denoised = get_pixels(result)
+    finally:
+        for image in images:
+            bpy.data.images.remove(image)
+        bpy.data.scenes.remove(scene)
+        os.remove(tmp_file)
+
+    return denoised
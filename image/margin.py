@@ -0,0 +1,35 @@
+import numpy as np
+
+NEIGHBOURS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def dilate(pixels, mask, margin) -> tuple:
+    """Extend masked pixels by margin texels, like the bake margin.
+    Every new texel is the mean of its filled neighbours.
+
+    :param pixels: (height, width, channels) array
+    :param mask: (height, width) bool array of valid texels
+    :returns: (pixels, mask) with filled margin
+    """
+
+    pixels = pixels.copy()
+    mask = mask.copy()
+    height, width = mask.shape
+
+    for _ in range(margin):
+        padded_pixels = np.pad(pixels * mask[..., None], ((1, 1), (1, 1), (0, 0)))
+        padded_mask = np.pad(mask, 1).astype(np.float32)
+
+        total = np.zeros_like(pixels)
+        count = np.zeros(mask.shape, dtype=np.float32)
+        for dy, dx in NEIGHBOURS:
+            total += padded_pixels[1 + dy:height + 1 + dy, 1 + dx:width + 1 + dx]
+            count += padded_mask[1 + dy:height + 1 + dy, 1 + dx:width + 1 + dx]
+
+        fill = ~mask & (count > 0)
+        if not fill.any():
+            break
+        pixels[fill] = total[fill] / count[fill, None]
+        mask |= fill
+
+    return pixels, mask
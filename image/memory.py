@@ -0,0 +1,52 @@
+import os
+
+import bpy
+
+
+def get_image_bytes(image) -> int:
+    """:returns: Estimated size of the loaded pixel buffer of image."""
+
+    if not image.has_data:
+        return 0
+    width, height = image.size
+    return width * height * image.channels * (4 if image.is_float else 1)
+
+
+def is_saved(image) -> bool:
+    return bool(image.filepath) and os.path.isfile(bpy.path.abspath(image.filepath)) and not image.is_dirty
+
+
+def free_image(image) -> bool:
+    """Remove saved image without users. Free the buffer of saved images in use.
+    Materials reload it from the file path, when needed.
+
+    :returns: True, if memory was freed
+    """
+
+    if not is_saved(image):
+        return False
+    if image.users == 0:
+        bpy.data.images.remove(image)
+    else:
+        image.buffers_free()
+    return True
+
+
+def free_images_over_budget(images, budget_bytes) -> list:
+    """Free buffers of images (first ones first), until the loaded images fit into budget.
+
+    :returns: Freed images
+    """
+
+    loaded = [image for image in images if get_image_bytes(image)]
+    total = sum(get_image_bytes(image) for image in loaded)
+    freed = []
+    for image in loaded:
+        if total <= budget_bytes:
+            break
+        size = get_image_bytes(image)
+        if is_saved(image):
+            image.buffers_free()
+            total -= size
+            freed.append(image)
+    return freed
@@ -0,0 +1,24 @@
+import bpy
+import numpy as np
+
+
+def get_pixels(image) -> np.ndarray:
+    """:returns: Pixels of image as (height, width, 4) array."""
+
+    width, height = image.size
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, 4)
+
+
+def set_pixels(image, pixels):
+    image.pixels.foreach_set(np.ascontiguousarray(pixels, dtype=np.float32).ravel())
+
+
+def new_data_image(name, width, height) -> bpy.types.Image:
+    """Float image for data (no color management), all pixels (0, 0, 0, 0)."""
+
+    image = bpy.data.images.new(name, width, height, alpha=True, float_buffer=True)
+    image.colorspace_settings.name = 'Non-Color'
+    image.generated_color = (0, 0, 0, 0)
+    return image
@@ -3,17 +3,11 @@ import bpy
 from ..image.save_as import save_image_as
 
 
-def save_image(image, jobname):
-    """Wrapper for save_image_as() to get all parameters from settings."""
+def get_color_depth(jobname) -> str:
+    """:returns: Color depth for job by user settings."""
 
     settings = bpy.context.scene.principled_baker_settings
 
-    if jobname == 'Color' and settings.use_alpha_to_color:
-        color_mode = 'RGBA'
-    else:
-        color_mode = settings.color_mode
-
-    # color depth
     color_depth = settings.color_depth
     if color_depth == 'INDIVIDUAL':
         bakelist = bpy.context.scene.principled_baker_bakelist
@@ -30,12 +24,32 @@ def save_image(image, jobname):
                 color_depth = settings.color_depth_material_id
             elif jobname == "Wireframe":
                 color_depth = settings.color_depth_wireframe
+            elif jobname == "Glossiness" and "Roughness" in bakelist.keys():
+                color_depth = bakelist["Roughness"].color_depth
+
+    # no individual color depth for job
+    if color_depth == 'INDIVIDUAL':
+        color_depth = '16' if settings.file_format == 'OPEN_EXR' else '8'
+    return color_depth
+
+
+def save_image(image, jobname, file_path=None):
+    """Wrapper for save_image_as() to get all parameters from settings.
+    file_path: Save to other file than image file path (eg. UDIM tiles).
+    """
+
+    settings = bpy.context.scene.principled_baker_settings
+
+    if jobname == 'Color' and settings.use_alpha_to_color:
+        color_mode = 'RGBA'
+    else:
+        color_mode = settings.color_mode
 
     save_image_as(image,
-                  file_path=image.filepath,
+                  file_path=file_path or image.filepath,
                   file_format=settings.file_format,
                   color_mode=color_mode,
-                  color_depth=color_depth,
+                  color_depth=get_color_depth(jobname),
                   compression=settings.compression,
                   quality=settings.quality,
                   tiff_codec=settings.tiff_codec,
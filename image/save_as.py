@@ -3,24 +3,31 @@ import bpy
 
 def save_image_as(image, file_path, file_format, color_mode='RGB', color_depth='8', compression=15, quality=90, tiff_codec='DEFLATE', exr_codec='ZIP'):
     s = bpy.context.scene.render.image_settings
-    fm = s.file_format
-    cm = s.color_mode
-    cd = s.color_depth
-    c = s.compression
-    q = s.quality
-    tc = s.tiff_codec
-    ec = s.exr_codec
-    vt = bpy.context.scene.view_settings.view_transform
-
-    s.file_format = file_format
-    s.color_mode = color_mode
-    s.color_depth = color_depth
-    s.compression = compression
-    s.quality = quality
-    s.tiff_codec = tiff_codec
-    s.exr_codec = exr_codec
+    view_settings = bpy.context.scene.view_settings
+
+    # in order: file format first, it defines the other options
+    new_settings = {
+        "file_format": file_format,
+        "color_mode": color_mode,
+        "color_depth": color_depth,
+        "compression": compression,
+        "quality": quality,
+        "tiff_codec": tiff_codec,
+        "exr_codec": exr_codec,
+    }
+
+    # all originals first. changing the file format adjusts the other options. see restore!
+    org_settings = {name: getattr(s, name) for name in new_settings}
+
+    # change only settings, which differ
+    for name, value in new_settings.items():
+        if not getattr(s, name) == value:
+            setattr(s, name, value)
+
     defalut_vt = 'Standard'
-    bpy.context.scene.view_settings.view_transform = defalut_vt
+    vt = view_settings.view_transform
+    if not vt == defalut_vt:
+        view_settings.view_transform = defalut_vt
 
     image.use_view_as_render = False
 
@@ -28,11 +35,9 @@ def save_image_as(image, file_path, file_format, color_mode='RGB', color_depth='
 
     image.save_render(abs_path)
 
-    s.file_format = fm
-    s.color_mode = cm
-    s.color_depth = cd
-    s.compression = c
-    s.quality = q
-    s.tiff_codec = tc
-    s.exr_codec = ec
-    bpy.context.scene.view_settings.view_transform = vt
+    # restore. in order: file format first
+    for name, value in org_settings.items():
+        if not getattr(s, name) == value:
+            setattr(s, name, value)
+    if not vt == defalut_vt:
+        view_settings.view_transform = vt
@@ -233,3 +233,11 @@ def get_joblist_from_objects(objs) -> list:
     joblist = list(set(joblist))
 
     return joblist
+
+
+def split_job_key(key) -> tuple:
+    """:returns: (jobname, vertex color name) of key in new images."""
+
+    if key.startswith("Vertex Color"):
+        return "Vertex Color", key[len("Vertex Color"):]
+    return key, ""
@@ -0,0 +1,51 @@
+from .const import OBJECT_DEPENDENT_NODES
+from .prepare.freeze import has_active_modifiers
+
+
+def is_object_dependent_node_tree(node_tree) -> bool:
+    for node in node_tree.nodes:
+        if node.type in OBJECT_DEPENDENT_NODES:
+            return True
+        if node.type == 'ATTRIBUTE' and not getattr(node, "attribute_type", 'GEOMETRY') == 'GEOMETRY':
+            return True
+        if node.type == 'GROUP' and node.node_tree and is_object_dependent_node_tree(node.node_tree):
+            return True
+    return False
+
+
+def get_linked_duplicate_key(obj):
+    """:returns: Key of objects with equal bake results (mesh data, materials, UV map, scale).
+    None, if results depend on the object (modifiers, object info etc.).
+    """
+
+    if has_active_modifiers(obj):
+        return None
+
+    materials = []
+    for mat_slot in obj.material_slots:
+        mat = mat_slot.material
+        if mat and mat.use_nodes and is_object_dependent_node_tree(mat.node_tree):
+            return None
+        materials.append(mat.name if mat else "")
+
+    uv_layer = obj.data.uv_layers.active
+    scale = tuple(round(s, 4) for s in obj.matrix_world.to_scale())
+    return (obj.data.name, tuple(materials), uv_layer.name if uv_layer else "", scale)
+
+
+def group_linked_duplicates(objects) -> dict:
+    """:returns: Linked duplicates by first object (representative) in objects.
+    {representative: [other objects]}
+    """
+
+    groups = {}
+    representatives = {}
+    for obj in objects:
+        key = get_linked_duplicate_key(obj)
+        if key is None or key not in representatives:
+            groups[obj] = []
+            if key is not None:
+                representatives[key] = obj
+        else:
+            groups[representatives[key]].append(obj)
+    return groups
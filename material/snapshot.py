@@ -0,0 +1,91 @@
+import bpy
+
+from ..const import MATERIAL_TAG, MATERIAL_TAG_VERTEX
+
+
+def get_links(node_tree) -> set:
+    return {(link.from_node.name, link.from_socket.identifier,
+             link.to_node.name, link.to_socket.identifier)
+            for link in node_tree.links}
+
+
+def get_material_snapshot(objects) -> dict:
+    """Names of material slots, nodes, links and active outputs of objects.
+    See restore_material_snapshot()
+    """
+
+    snapshot = {"materials": set(bpy.data.materials.keys()),
+                "slots": {},
+                "node_trees": {}}
+
+    for obj in objects:
+        snapshot["slots"][obj.name] = [mat_slot.material.name if mat_slot.material else None
+                                       for mat_slot in obj.material_slots]
+        for mat_slot in obj.material_slots:
+            mat = mat_slot.material
+            if not mat or not mat.use_nodes or mat.name in snapshot["node_trees"]:
+                continue
+            nodes = mat.node_tree.nodes
+            snapshot["node_trees"][mat.name] = {
+                "nodes": set(nodes.keys()),
+                "links": get_links(mat.node_tree),
+                "active_outputs": {node.name: (node.is_active_output, node.target)
+                                   for node in nodes if node.type == 'OUTPUT_MATERIAL'},
+            }
+    return snapshot
+
+
+def restore_node_tree(node_tree, node_tree_snapshot):
+    nodes = node_tree.nodes
+    for node in list(nodes):
+        if node.name not in node_tree_snapshot["nodes"]:
+            nodes.remove(node)
+
+    links = node_tree_snapshot["links"]
+    for link in list(node_tree.links):
+        key = (link.from_node.name, link.from_socket.identifier,
+               link.to_node.name, link.to_socket.identifier)
+        if key not in links:
+            node_tree.links.remove(link)
+
+    existing_links = get_links(node_tree)
+    for key in links - existing_links:
+        from_node, from_socket, to_node, to_socket = key
+        outputs = {s.identifier: s for s in nodes[from_node].outputs}
+        inputs = {s.identifier: s for s in nodes[to_node].inputs}
+        node_tree.links.new(outputs[from_socket], inputs[to_socket])
+
+    for name, (is_active_output, target) in node_tree_snapshot["active_outputs"].items():
+        nodes[name].target = target
+        nodes[name].is_active_output = is_active_output
+
+
+def restore_material_snapshot(snapshot):
+    """Restore material slots and node trees of a failed bake.
+    Temporary materials are removed, new materials of the bake are kept.
+    """
+
+    for obj_name, slot_materials in snapshot["slots"].items():
+        obj = bpy.data.objects.get(obj_name)
+        if not obj:
+            continue
+        while len(obj.material_slots) > len(slot_materials):
+            obj.active_material_index = len(obj.material_slots) - 1
+            if hasattr(bpy.context, "temp_override"):
+                with bpy.context.temp_override(object=obj):
+                    bpy.ops.object.material_slot_remove()
+            else:
+                bpy.ops.object.material_slot_remove({'object': obj})
+        for mat_slot, mat_name in zip(obj.material_slots, slot_materials):
+            mat_slot.material = bpy.data.materials.get(mat_name) if mat_name else None
+
+    for mat_name, node_tree_snapshot in snapshot["node_trees"].items():
+        mat = bpy.data.materials.get(mat_name)
+        if mat:
+            restore_node_tree(mat.node_tree, node_tree_snapshot)
+
+    for mat in list(bpy.data.materials):
+        if mat.name in snapshot["materials"]:
+            continue
+        if MATERIAL_TAG_VERTEX in mat.keys() or (MATERIAL_TAG in mat.keys() and not mat.users):
+            bpy.data.materials.remove(mat)
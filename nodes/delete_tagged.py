@@ -11,3 +11,15 @@ def delete_tagged_nodes_in_object(obj):
     for mat_slot in obj.material_slots:
         if mat_slot.material:
             delete_tagged_nodes(mat_slot.material)
+
+
+def delete_bake_image_nodes(objects, image):
+    """Delete tagged image nodes of image only. Other bake image nodes are kept."""
+
+    for obj in objects:
+        for mat_slot in obj.material_slots:
+            if mat_slot.material:
+                nodes = mat_slot.material.node_tree.nodes
+                for node in list(nodes):
+                    if NODE_TAG in node.keys() and getattr(node, "image", None) == image:
+                        nodes.remove(node)
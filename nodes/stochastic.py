@@ -0,0 +1,55 @@
+from ..const import STOCHASTIC_NODES, STOCHASTIC_OUTPUTS
+
+
+def is_stochastic_node(node, lit) -> bool:
+    if node.type in STOCHASTIC_NODES:
+        return True
+    if lit and (node.type.startswith('BSDF_') or node.type in {'SUBSURFACE_SCATTERING', 'HOLDOUT'}):
+        return True
+    return any(output.is_linked and output.name in STOCHASTIC_OUTPUTS
+               for output in node.outputs)
+
+
+def is_stochastic_group(node_tree, lit, visited_trees) -> bool:
+    """Test all nodes of group node tree, nested groups included."""
+
+    if node_tree.name in visited_trees:
+        return False
+    visited_trees.add(node_tree.name)
+
+    for node in node_tree.nodes:
+        if is_stochastic_node(node, lit):
+            return True
+        if node.type == 'GROUP' and node.node_tree:
+            if is_stochastic_group(node.node_tree, lit, visited_trees):
+                return True
+    return False
+
+
+def is_stochastic_node_tree(node, lit=True) -> bool:
+    """Test all nodes linked to node (eg. the active Material Output).
+    Node groups are tested as a whole, nested groups included.
+
+    :param lit: Shaders are light dependent, False for Normal bakes.
+    :returns: True, if results differ per sample.
+    """
+
+    visited = set()
+    visited_trees = set()
+    nodes = [node]
+    while nodes:
+        node = nodes.pop()
+        if node is None or node.name in visited:
+            continue
+        visited.add(node.name)
+
+        if is_stochastic_node(node, lit):
+            return True
+        if node.type == 'GROUP' and node.node_tree:
+            if is_stochastic_group(node.node_tree, lit, visited_trees):
+                return True
+
+        for input_socket in node.inputs:
+            for link in input_socket.links:
+                nodes.append(link.from_node)
+    return False
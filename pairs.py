@@ -0,0 +1,36 @@
+import re
+
+
+def get_base_name(name, suffix) -> str:
+    """:returns: Name without suffix and number extension (eg. 'Arm_low.001' -> 'Arm').
+    Empty string, if name has no suffix.
+    """
+
+    name = re.sub(r"\.\d{3}$", "", name)
+    if not name.endswith(suffix):
+        return ""
+    return name[:-len(suffix)]
+
+
+def get_pairs(objects, low_suffix, high_suffix, by_collection=False) -> list:
+    """Pair low poly objects with their high poly objects.
+    By name: 'Arm_low' with 'Arm_high', 'Arm_high.001' ...
+    By collection: low poly object with all other objects of its collection.
+
+    :returns: List of (low poly object, [high poly objects])
+    """
+
+    lows = [obj for obj in objects if get_base_name(obj.name, low_suffix)]
+    pairs = []
+    for low in lows:
+        if by_collection:
+            collections = set(low.users_collection)
+            highs = [obj for obj in objects if obj not in lows
+                     and collections & set(obj.users_collection)]
+        else:
+            base_name = get_base_name(low.name, low_suffix)
+            highs = [obj for obj in objects if obj not in lows
+                     and get_base_name(obj.name, high_suffix) == base_name]
+        if highs:
+            pairs.append((low, highs))
+    return pairs
@@ -249,10 +249,21 @@ class PBAKER_PT_OutputSettings(PBAKER_PT_SubPanel):
         row.prop(self.settings, "resolution", expand=True)
         if self.settings.resolution == 'CUSTOM':
             col.prop(self.settings, "custom_resolution")
+        if self.settings.resolution == 'AUTO':
+            col.prop(self.settings, "texel_density")
+            row = col.row(align=True)
+            row.prop(self.settings, "auto_resolution_min")
+            row.prop(self.settings, "auto_resolution_max")
         col.separator()
         col.prop(self.settings, "file_path")
         col.prop(self.settings, "use_overwrite")
+        col.prop(self.settings, "use_bake_cache")
+        col.prop(self.settings, "use_resume")
         col.prop(self.settings, "use_texture_folder")
+        col.prop(self.settings, "use_udim")
+        row = col.row()
+        row.prop(self.settings, "udim_tiles")
+        row.active = self.settings.use_udim
 
         col.separator()
 
@@ -287,10 +298,85 @@ class PBAKER_PT_OutputSettings(PBAKER_PT_SubPanel):
         row_indi_samples.prop(self.settings, "individual_samples")
         if self.settings.individual_samples:
             row_samples.active = False
+        row = col.row(align=True)
+        row.prop(self.settings, "use_deterministic_samples", text="")
+        row_deterministic = row.row(align=True)
+        row_deterministic.prop(self.settings, "deterministic_samples")
+        row_deterministic.active = self.settings.use_deterministic_samples
+        row = col.row(align=True)
+        row.prop(self.settings, "use_denoise", text="")
+        row_denoise = row.row(align=True)
+        row_denoise.prop(self.settings, "denoise_samples")
+        row_denoise.active = self.settings.use_denoise
+
+        # Convergence
+        col.separator()
+        col.prop(self.settings, "use_convergence")
+        col_convergence = col.column(align=True)
+        col_convergence.prop(self.settings, "convergence_start_samples")
+        col_convergence.prop(self.settings, "convergence_max_samples")
+        col_convergence.prop(self.settings, "convergence_threshold")
+        col_convergence.prop(self.settings, "use_convergence_write_samples")
+        col_convergence.active = self.settings.use_convergence
 
         col.separator()
         col.prop(self.render_settings, "margin")
 
+        # Time Budget
+        col.separator()
+        row = col.row(align=True)
+        row.prop(self.settings, "use_time_budget")
+        row_budget = row.row(align=True)
+        row_budget.prop(self.settings, "time_budget")
+        row_budget.active = self.settings.use_time_budget
+
+
+class PBAKER_PT_Draft(PBAKER_PT_SubPanel):
+    bl_parent_id = "PBAKER_PT_Main"
+    bl_label = "Draft"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        col = self.layout.column(align=True)
+        row = col.row()
+        row.prop(self.settings, "draft_scale", expand=True)
+        col.prop(self.settings, "draft_samples")
+        col.prop(self.settings, "draft_folder")
+        col.separator()
+        col.prop(self.settings, "draft_final_pass")
+        col.operator('object.principled_baker_use_final_images', icon='FILE_REFRESH')
+        col.separator()
+        op = col.operator('object.principled_baker_bake',
+                          text='Bake Draft', icon='RENDER_STILL')
+        op.draft = True
+
+
+class PBAKER_PT_Performance(PBAKER_PT_SubPanel):
+    bl_parent_id = "PBAKER_PT_Main"
+    bl_label = "Performance"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        col = self.layout.column(align=True)
+        col.prop(self.settings, "use_isolated_scene")
+        row = col.row()
+        row.prop(self.settings, "isolation_radius")
+        row.active = self.settings.use_isolated_scene
+        col.separator()
+        col.prop(self.settings, "use_bake_profiles")
+        col.prop(self.settings, "use_freeze_meshes")
+        col.separator()
+        col.prop(self.settings, "use_linked_duplicates")
+        row = col.row()
+        row.prop(self.settings, "linked_duplicates_output", expand=True)
+        row.active = self.settings.use_linked_duplicates and self.settings.bake_mode == 'BATCH'
+        col.prop(self.settings, "use_undo")
+        row = col.row(align=True)
+        row.prop(self.settings, "use_memory_budget")
+        row_memory = row.row(align=True)
+        row_memory.prop(self.settings, "memory_budget")
+        row_memory.active = self.settings.use_memory_budget
+
 
 class PBAKER_PT_NewMaterial(PBAKER_PT_SubPanel):
     bl_parent_id = "PBAKER_PT_Main"
@@ -320,6 +406,28 @@ class PBAKER_PT_SelectedToActiveSettings(PBAKER_PT_SubPanel):
             sub.prop(self.render_settings,
                      "cage_extrusion", text="Ray Distance")
 
+        # Spatial Partition
+        col2.separator()
+        row = col2.row(align=True)
+        row.prop(self.settings, "use_partition")
+        row_partition = row.row(align=True)
+        row_partition.prop(self.settings, "partition_regions")
+        row_partition.active = self.settings.use_partition
+
+        # High/Low Pairs
+        col2.separator()
+        col2.prop(self.settings, "use_pairs")
+        col_pairs = col2.column(align=True)
+        row = col_pairs.row()
+        row.prop(self.settings, "pair_by", expand=True)
+        col_pairs.prop(self.settings, "pair_low_suffix")
+        col_pairs.prop(self.settings, "pair_high_suffix")
+        row = col_pairs.row()
+        row.prop(self.settings, "pair_output", expand=True)
+        if self.settings.pair_output == 'MERGED':
+            col_pairs.prop(self.settings, "pair_set_name")
+        col_pairs.active = self.settings.use_pairs
+
         if not self.settings.bake_mode == 'SELECTED_TO_ACTIVE':
             col2.active = False
 
@@ -501,6 +609,42 @@ class PBAKER_PT_DuplicateObjects(PBAKER_PT_SubPanel):
             col.active = False
 
 
+class PBAKER_PT_BackgroundWorkers(PBAKER_PT_SubPanel):
+    bl_parent_id = "PBAKER_PT_Main"
+    bl_label = "Background Workers"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        col = self.layout
+        col.prop(self.settings, "use_background_workers")
+        col2 = col.column(align=True)
+        col2.prop(self.settings, "worker_count")
+        row_queue = col2.row(align=True)
+        row_queue.prop(self.settings, "use_worker_queue")
+        col2.prop(self.settings, "worker_threads")
+        col2.prop(self.settings, "worker_retries")
+
+        if not self.settings.use_background_workers:
+            col2.active = False
+
+        # high/low pairs of Selected to Active are baked in workers, too. Not by a queue
+        is_pairs = self.settings.bake_mode == 'SELECTED_TO_ACTIVE' and self.settings.use_pairs
+        if not self.settings.bake_mode == 'BATCH' and not is_pairs:
+            col2.active = False
+        if is_pairs:
+            row_queue.active = False
+
+        # Library
+        col.separator()
+        col.label(text="Library:")
+        col3 = col.column(align=True)
+        col3.prop(self.settings, "library_path", text="")
+        col3.prop(self.settings, "library_collection")
+        col3.prop(self.settings, "library_object_property")
+        col.operator('object.principled_baker_bake_library',
+                     text='Bake Library', icon='RENDER_STILL')
+
+
 class PBAKER_PT_Misc(PBAKER_PT_SubPanel):
     bl_parent_id = "PBAKER_PT_Main"
     bl_label = "Misc Settings"
@@ -541,9 +685,27 @@ class PBAKER_PT_Main(Panel):
             can_bake = False
 
         if can_bake:
-            layout.operator('object.principled_baker_bake',
-                            text='Bake', icon='RENDER_STILL')
+            row = layout.row(align=True)
+            if self.settings.use_undo:
+                row.operator('object.principled_baker_bake',
+                             text='Bake', icon='RENDER_STILL')
+            else:
+                row.operator('object.principled_baker_bake_no_undo',
+                             text='Bake', icon='RENDER_STILL')
+            row.operator('object.principled_baker_bake_modal',
+                         text='', icon='TIME')
+            row.operator('object.principled_baker_plan',
+                         text='', icon='TEXT')
 
         # bake mode
         layout.prop(self.settings, "bake_mode",
                     text="Bake Mode", expand=True)
+
+        # atlas
+        if self.settings.bake_mode == 'BATCH':
+            row = layout.row(align=True)
+            row.prop(self.settings, "use_atlas")
+            row_atlas = row.row(align=True)
+            row_atlas.prop(self.settings, "atlas_margin", text="Margin")
+            row_atlas.prop(self.settings, "atlas_keep_uv_map", text="", icon='UV')
+            row_atlas.active = self.settings.use_atlas
@@ -0,0 +1,171 @@
+import json
+from pathlib import Path
+
+import bpy
+from bpy.props import StringProperty
+from bpy_extras.io_utils import ExportHelper
+
+from .baker import PBAKER_OT_bake
+from .functions import get_only_meshes, remove_not_allowed_signs
+from .joblist import get_joblist_from_objects
+from .material.has_material import has_material
+from .scheduler import schedule_jobs
+from .set_samples import get_samples
+from .uv.texel_density import get_auto_resolution
+
+
+class PBAKER_OT_plan(PBAKER_OT_bake, ExportHelper):
+    """Resolve all bake jobs without baking and export the plan as JSON.
+    The plan file can be passed to the Bake operator as 'plan_file'"""
+
+    bl_idname = "object.principled_baker_plan"
+    bl_label = "Export Bake Plan"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".json"
+    filter_glob: StringProperty(default="*.json", options={'HIDDEN'})
+
+    def get_bake_groups(self, context) -> list:
+        """:returns: List of (target object, objects to bake) as the bake mode would bake them."""
+
+        active_object = context.active_object
+        selected_objects = get_only_meshes(context.selected_objects)
+        if not active_object or not active_object.type == 'MESH':
+            active_object = selected_objects[0] if selected_objects else None
+        if not active_object:
+            return []
+
+        bake_objects = [active_object]
+        bake_objects.extend(obj for obj in selected_objects if obj not in bake_objects)
+
+        if self.is_batch():
+            return [(obj, [obj]) for obj in bake_objects]
+        if self.settings.bake_mode == 'SELECTED_TO_ACTIVE':
+            return [(active_object, bake_objects[1:])]
+        return [(active_object, bake_objects)]
+
+    def get_group_errors(self, target, objects) -> list:
+        """:returns: List of (report type, message) the bake mode reports for one group."""
+
+        errors = self.get_bake_errors(objects)
+
+        if self.settings.bake_mode == 'SELECTED_TO_ACTIVE':
+            for mat_slot in target.material_slots:
+                if not mat_slot.material:
+                    errors.append(({'INFO'}, "baking cancelled. '{0}' has empty Material Slots.".format(target.name)))
+                    break
+            if self.settings.auto_uv_project == 'OFF' and len(target.data.uv_layers) == 0:
+                errors.append(({'INFO'}, "baking cancelled. '{0}' UV map missing.".format(target.name)))
+        elif self.settings.use_vertex_color:
+            objects_without_vertex_color = [obj.name for obj in objects
+                                            if len(obj.data.vertex_colors) == 0]
+            if objects_without_vertex_color:
+                errors.append(({'INFO'}, f"Objects have no Vertex Color: '{objects_without_vertex_color}'"))
+
+        return errors
+
+    def get_bake_plan(self, context) -> dict:
+        """Resolve every (object, job, subjob) unit to bake.
+
+        Nothing is baked, materials and render settings are left untouched.
+        Cost of a unit is texels * samples * polycount * UDIM tiles.
+
+        :returns: Plan dictionary with "units", "errors" and "cost".
+        """
+
+        self.texture_folder = ""
+        self.job_resolution = 0
+        self.object_resolution = 0
+        self.jobname = ""
+        self.suffix_extension = ""
+        self.udim_tiles = []
+
+        plan = {"bake_mode": self.settings.bake_mode,
+                "units": [],
+                "errors": [],
+                "cost": 0}
+
+        groups = self.get_bake_groups(context)
+        if not groups:
+            plan["errors"].append("Nothing selected.")
+
+        for target, objects in groups:
+            errors = self.get_group_errors(target, objects)
+            plan["errors"].extend(message for _, message in errors)
+            if errors:
+                continue
+
+            self.joblist = get_joblist_from_objects(objects)
+            if self.settings.bake_mode == 'SELECTED_TO_ACTIVE':
+                if not all(has_material(obj) for obj in objects):
+                    self.joblist = [j for j in self.joblist if j == "Vertex Color"]
+
+            if self.settings.use_texture_folder:
+                self.texture_folder = remove_not_allowed_signs(target.name)
+
+            polycount = sum(len(obj.data.polygons) for obj in set(objects + [target]))
+            if self.settings.resolution == 'AUTO':
+                auto_objects = [target] if self.settings.bake_mode == 'SELECTED_TO_ACTIVE' else objects
+                self.object_resolution = get_auto_resolution(auto_objects)[0]
+            resolution = self.get_resolution()
+
+            # every UDIM tile is baked at full resolution
+            tile_count = 1
+            if self.settings.use_udim:
+                tile_objects = [target] if self.settings.bake_mode == 'SELECTED_TO_ACTIVE' else objects
+                self.udim_tiles = self.get_udim_tiles(tile_objects)
+                if not self.udim_tiles:
+                    continue
+                self.udim_tile = self.udim_tiles[0]
+                tile_count = len(self.udim_tiles)
+
+            for self.jobname, self.suffix_extension in schedule_jobs(self.get_job_queue(objects)):
+                img_file_name = self.get_image_file_name(target.name)
+                skip = not self.settings.use_overwrite and self.is_file_existing(target)
+                samples = get_samples(self.jobname)
+                cost = 0 if skip else resolution * resolution * samples * polycount * tile_count
+
+                plan["units"].append({
+                    "object": target.name,
+                    "objects": [obj.name for obj in objects],
+                    "job": self.jobname,
+                    "subjob": self.suffix_extension,
+                    "path": bpy.path.abspath(self.get_image_file_path(img_file_name)),
+                    "resolution": resolution,
+                    "tiles": self.udim_tiles,
+                    "samples": samples,
+                    "polycount": polycount,
+                    "skip": skip,
+                    "cost": cost,
+                })
+                plan["cost"] += cost
+
+        return plan
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = str(Path(bpy.path.abspath(
+                context.scene.principled_baker_settings.file_path)) / "bake_plan.json")
+        return ExportHelper.invoke(self, context, event)
+
+    def execute(self, context):
+        self.prefs = context.preferences.addons[__package__].preferences
+        self.settings = context.scene.principled_baker_settings
+        self.render_settings = context.scene.render.bake
+
+        if not self.can_execute(context):
+            return {'CANCELLED'}
+
+        plan = self.get_bake_plan(context)
+
+        with open(self.filepath, 'w') as f:
+            json.dump(plan, f, indent=2)
+
+        for message in plan["errors"]:
+            self.report({'ERROR'}, message)
+
+        units_to_bake = [unit for unit in plan["units"] if not unit["skip"]]
+        self.report({'INFO'}, "Bake Plan: {0} images to bake, {1} skipped, cost {2:.3g}. '{3}'".format(
+            len(units_to_bake), len(plan["units"]) - len(units_to_bake), plan["cost"], self.filepath))
+
+        return {'FINISHED'}
@@ -0,0 +1,50 @@
+import bpy
+
+
+def has_active_modifiers(obj) -> bool:
+    """:returns: True, if obj has modifiers enabled for rendering."""
+
+    return any(mod.show_render for mod in obj.modifiers)
+
+
+def freeze_object(obj, depsgraph) -> dict:
+    """Swap mesh of obj for a copy of its evaluated mesh and disable modifiers.
+    Later bakes skip the evaluation of the modifiers.
+    The mesh is evaluated with render settings of the modifiers, like Cycles does.
+
+    Must be restored after baking! See unfreeze_object()
+    """
+
+    frozen = {"data": obj.data,
+              "modifiers": {mod.name: (mod.show_viewport, mod.show_render) for mod in obj.modifiers}}
+
+    # render levels (eg. Subdivision Surface, Multiresolution)
+    viewport_levels = {}
+    for mod in obj.modifiers:
+        mod.show_viewport = mod.show_render
+        if hasattr(mod, "render_levels") and hasattr(mod, "levels"):
+            viewport_levels[mod.name] = mod.levels
+            mod.levels = mod.render_levels
+    depsgraph.update()
+
+    mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph),
+                                           preserve_all_data_layers=True,
+                                           depsgraph=depsgraph)
+    for name, levels in viewport_levels.items():
+        obj.modifiers[name].levels = levels
+    mesh.name = f"{obj.data.name}_PRINCIPLED_BAKER_FROZEN"
+    obj.data = mesh
+    for mod in obj.modifiers:
+        mod.show_viewport = False
+        mod.show_render = False
+    return frozen
+
+
+def unfreeze_object(obj, frozen):
+    mesh = obj.data
+    obj.data = frozen["data"]
+    for mod in obj.modifiers:
+        if mod.name in frozen["modifiers"]:
+            mod.show_viewport, mod.show_render = frozen["modifiers"][mod.name]
+    if mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
@@ -0,0 +1,93 @@
+import bmesh
+import bpy
+import numpy as np
+from mathutils import Vector
+
+from ..prepare.scene import get_world_bounds
+
+
+def get_face_centers(obj) -> np.ndarray:
+    """:returns: World space centers (n, 3) of all faces of obj."""
+
+    mesh = obj.data
+    centers = np.empty(len(mesh.polygons) * 3, dtype=np.float64)
+    mesh.polygons.foreach_get("center", centers)
+    centers = centers.reshape(-1, 3)
+    matrix = np.array(obj.matrix_world)
+    return centers @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def get_face_regions(obj, region_count) -> list:
+    """Split faces of obj into about region_count regions of equal face count.
+    Regions are split at the median of the longest axis.
+
+    :returns: List of arrays of face indices
+    """
+
+    centers = get_face_centers(obj)
+    regions = [np.arange(len(centers))]
+    while len(regions) < region_count:
+        regions.sort(key=len)
+        faces = regions.pop()
+        if len(faces) < 2:
+            regions.append(faces)
+            break
+        points = centers[faces]
+        axis = np.argmax(points.max(axis=0) - points.min(axis=0))
+        order = np.argsort(points[:, axis], kind='stable')
+        half = len(faces) // 2
+        regions.extend((faces[order[:half]], faces[order[half:]]))
+    return regions
+
+
+def get_region_bounds(obj, faces) -> tuple:
+    """:returns: (min, max) corners of world space bounding box of faces."""
+
+    mesh = obj.data
+    verts = {v for i in faces for v in mesh.polygons[i].vertices}
+    co = [obj.matrix_world @ mesh.vertices[v].co for v in verts]
+    lo = Vector((min(c.x for c in co), min(c.y for c in co), min(c.z for c in co)))
+    hi = Vector((max(c.x for c in co), max(c.y for c in co), max(c.z for c in co)))
+    return lo, hi
+
+
+def get_overlapping_objects(objects, lo, hi, distance) -> list:
+    """:returns: Objects with bounding boxes within distance to box (lo, hi)."""
+
+    lo = lo - Vector((distance, distance, distance))
+    hi = hi + Vector((distance, distance, distance))
+    overlapping = []
+    for obj in objects:
+        obj_lo, obj_hi = get_world_bounds([obj])
+        if all(obj_lo[i] <= hi[i] and obj_hi[i] >= lo[i] for i in range(3)):
+            overlapping.append(obj)
+    return overlapping
+
+
+def new_region_object(obj, faces) -> bpy.types.Object:
+    """Temporary copy of obj with faces only. Materials and UV maps are kept.
+
+    Must be removed after baking! See remove_region_object()
+    """
+
+    mesh = obj.data.copy()
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bm.faces.ensure_lookup_table()
+    keep = set(int(i) for i in faces)
+    bmesh.ops.delete(bm, geom=[f for f in bm.faces if f.index not in keep], context='FACES')
+    bm.to_mesh(mesh)
+    bm.free()
+
+    region_obj = obj.copy()
+    region_obj.data = mesh
+    region_obj.name = f"{obj.name}_PRINCIPLED_BAKER_REGION"
+    bpy.context.scene.collection.objects.link(region_obj)
+    return region_obj
+
+
+def remove_region_object(region_obj):
+    mesh = region_obj.data
+    bpy.data.objects.remove(region_obj)
+    if mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
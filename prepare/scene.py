@@ -0,0 +1,100 @@
+import bpy
+from mathutils import Vector
+
+ISOLATED_SCENE_NAME = "Principled Baker Isolated Scene"
+
+OCCLUDER_TYPES = {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT'}
+
+
+def copy_properties(src, dst):
+    """Copy all simple properties (eg. of cycles or bake settings)."""
+
+    for prop in src.bl_rna.properties:
+        if prop.is_readonly or prop.identifier == 'rna_type':
+            continue
+        if prop.type in {'POINTER', 'COLLECTION'}:
+            continue
+        try:
+            setattr(dst, prop.identifier, getattr(src, prop.identifier))
+        except (AttributeError, TypeError, ValueError):
+            pass
+
+
+def sync_isolated_scene_settings(scene, isolated_scene):
+    """Render settings and current frame of isolated scene must follow the bake scene.
+    Animated objects (eg. shape keys, drivers, Geometry Nodes) are evaluated at the frame.
+    """
+
+    isolated_scene.render.engine = scene.render.engine
+    isolated_scene.render.fps = scene.render.fps
+    isolated_scene.render.fps_base = scene.render.fps_base
+    if (not isolated_scene.frame_current == scene.frame_current
+            or not isolated_scene.frame_subframe == scene.frame_subframe):
+        isolated_scene.frame_set(scene.frame_current, subframe=scene.frame_subframe)
+    copy_properties(scene.cycles, isolated_scene.cycles)
+    copy_properties(scene.render.bake, isolated_scene.render.bake)
+    isolated_scene.render.bake.cage_object = scene.render.bake.cage_object
+    isolated_scene.world = scene.world
+
+
+def new_isolated_scene(scene) -> bpy.types.Scene:
+    """New empty scene with render settings of scene.
+
+    Must be removed after baking!
+    """
+
+    isolated_scene = bpy.data.scenes.new(ISOLATED_SCENE_NAME)
+    sync_isolated_scene_settings(scene, isolated_scene)
+    return isolated_scene
+
+
+def set_isolated_scene_objects(isolated_scene, objects, selected_objects):
+    """Link exactly objects to isolated scene. Unlink all others."""
+
+    collection = isolated_scene.collection
+    for obj in list(collection.objects):
+        if obj not in objects:
+            collection.objects.unlink(obj)
+    for obj in objects:
+        if obj.name not in collection.objects:
+            collection.objects.link(obj)
+
+    view_layer = isolated_scene.view_layers[0]
+    for obj in objects:
+        obj.select_set(obj in selected_objects, view_layer=view_layer)
+
+
+def get_world_bounds(objects) -> tuple:
+    """:returns: (min, max) corners of world space bounding box of objects."""
+
+    corners = [obj.matrix_world @ Vector(corner)
+               for obj in objects for corner in obj.bound_box]
+    lo = Vector((min(c.x for c in corners), min(c.y for c in corners), min(c.z for c in corners)))
+    hi = Vector((max(c.x for c in corners), max(c.y for c in corners), max(c.z for c in corners)))
+    return lo, hi
+
+
+def get_occluders(view_layer, objects, radius) -> list:
+    """:returns: Lights and render visible objects with bounding boxes
+    within radius around objects.
+    """
+
+    lo, hi = get_world_bounds(objects)
+    lo -= Vector((radius, radius, radius))
+    hi += Vector((radius, radius, radius))
+
+    occluders = []
+    for obj in view_layer.objects:
+        if obj in objects or obj.hide_render:
+            continue
+        if obj.type == 'LIGHT':
+            occluders.append(obj)
+        elif obj.type in OCCLUDER_TYPES:
+            obj_lo, obj_hi = get_world_bounds([obj])
+            if all(obj_lo[i] <= hi[i] and obj_hi[i] >= lo[i] for i in range(3)):
+                occluders.append(obj)
+    return occluders
+
+
+def remove_isolated_scene(isolated_scene):
+    bpy.data.scenes.remove(isolated_scene)
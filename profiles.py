@@ -0,0 +1,73 @@
+import bpy
+
+# Emission and normal bakes trace no bounces
+MINIMAL_PROFILE = {
+    "max_bounces": 0,
+    "diffuse_bounces": 0,
+    "glossy_bounces": 0,
+    "transmission_bounces": 0,
+    "volume_bounces": 0,
+    "transparent_max_bounces": 0,
+    "caustics_reflective": False,
+    "caustics_refractive": False,
+    "volume_max_steps": 1,
+    "use_light_tree": False,
+}
+
+# Cycles settings by profile. Missing settings (eg. of other Blender versions) are ignored.
+# Only settings used by bakes (eg. no adaptive sampling or denoising).
+PROFILES = {
+    'EMIT': MINIMAL_PROFILE,
+    'NORMAL': MINIMAL_PROFILE,
+    'DIFFUSE': {
+        "max_bounces": 4,
+        "diffuse_bounces": 4,
+        "glossy_bounces": 0,
+        "transmission_bounces": 0,
+        "volume_bounces": 0,
+        "caustics_reflective": False,
+        "caustics_refractive": False,
+        "volume_max_steps": 64,
+    },
+}
+
+
+def get_profile_name(jobname, bake_type) -> str:
+    """:returns: Name of profile for job. Ambient Occlusion and Diffuse trace rays."""
+
+    if bake_type == 'DIFFUSE' or jobname == "Ambient Occlusion":
+        return 'DIFFUSE'
+    if bake_type == 'NORMAL':
+        return 'NORMAL'
+    return 'EMIT'
+
+
+def apply_profile(profile_name, org_settings):
+    """Set Cycles settings of profile.
+    Original values are stored once in org_settings. Settings of a profile
+    before, which are not in this profile, are set back to their original values,
+    so results do not depend on the order of jobs.
+
+    Must be restored afer baking!
+    """
+
+    cycles = bpy.context.scene.cycles
+    profile = PROFILES[profile_name]
+    for prop, value in org_settings.items():
+        if prop not in profile and not getattr(cycles, prop) == value:
+            setattr(cycles, prop, value)
+
+    for prop, value in profile.items():
+        if not hasattr(cycles, prop):
+            continue
+        if prop not in org_settings:
+            org_settings[prop] = getattr(cycles, prop)
+        if not getattr(cycles, prop) == value:
+            setattr(cycles, prop, value)
+
+
+def restore_profile(org_settings):
+    cycles = bpy.context.scene.cycles
+    for prop, value in org_settings.items():
+        setattr(cycles, prop, value)
+    org_settings.clear()
@@ -0,0 +1,43 @@
+import sys
+
+import bpy
+
+REPORT_TEXT_NAME = "Principled Baker Report"
+
+
+def format_report(sections) -> str:
+    """:returns: Report text. sections: {"title": [lines]}"""
+
+    lines = [REPORT_TEXT_NAME, "=" * len(REPORT_TEXT_NAME)]
+    for title, section_lines in sections.items():
+        if not section_lines:
+            continue
+        lines.append("")
+        lines.append(f"{title}:")
+        lines.extend(f"  {line}" for line in section_lines)
+    return "\n".join(lines) + "\n"
+
+
+def write_report(sections) -> bpy.types.Text:
+    """Write report to text data block (see Text Editor)."""
+
+    text = bpy.data.texts.get(REPORT_TEXT_NAME)
+    if not text:
+        text = bpy.data.texts.new(REPORT_TEXT_NAME)
+    text.clear()
+    text.write(format_report(sections))
+    return text
+
+
+def get_peak_memory() -> float:
+    """:returns: Peak resident memory of Blender in MB. 0, if unknown (eg. Windows)."""
+
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return rss / 1024 / 1024  # bytes
+    return rss / 1024  # kilobytes
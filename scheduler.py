@@ -0,0 +1,53 @@
+from .functions import get_bake_type_by
+from .image.save import get_color_depth
+from .set_samples import get_samples
+
+# material preparation by job. see prepare_materials_of_objects_by_jobname()
+PREPARATION_STATES = {
+    "Diffuse": 0,  # prepare nothing
+    "Material ID": 2,
+    "Vertex Color": 3,
+    "Wireframe": 4,
+}
+
+
+def get_preparation_state(jobname) -> int:
+    return PREPARATION_STATES.get(jobname, 1)
+
+
+def get_job_signature(jobname) -> tuple:
+    """:returns: Everything, which needs a change of settings between jobs."""
+
+    return (get_preparation_state(jobname),
+            get_bake_type_by(jobname),
+            get_samples(jobname),
+            get_color_depth(jobname))
+
+
+def schedule_jobs(queue) -> list:
+    """:returns: Job queue [(jobname, subname)] ordered, so jobs with equal
+    signature are baked back to back.
+    """
+
+    return sorted(queue, key=lambda job: (get_job_signature(job[0]), job))
+
+
+def schedule_objects(queues) -> list:
+    """Order objects for BATCH. Objects with equal jobs are grouped.
+    Queues of every other object are reversed, so the settings of the last
+    job of an object carry over to the first job of the next object.
+
+    :returns: List of (object, queue).
+    """
+
+    def object_key(obj):
+        return ([get_job_signature(jobname) for jobname, _ in schedule_jobs(queues[obj])],
+                obj.name)
+
+    schedule = []
+    for i, obj in enumerate(sorted(queues, key=object_key)):
+        queue = schedule_jobs(queues[obj])
+        if i % 2:
+            queue.reverse()
+        schedule.append((obj, queue))
+    return schedule
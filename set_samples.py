@@ -1,12 +1,9 @@
 import bpy
 
 
-def set_samples(jobname):
-    """Set samples by user settings.
+def get_samples(jobname) -> int:
+    """:returns: Samples for job by user settings."""
 
-    Must be restored afer baking!
-    """
-    
     settings = bpy.context.scene.principled_baker_settings
     samples = settings.samples
     if settings.individual_samples and not settings.use_autodetect:
@@ -24,4 +21,15 @@ def set_samples(jobname):
                 samples = settings.samples_material_id
             elif jobname == "Wireframe":
                 samples = settings.samples_wireframe
-    bpy.context.scene.cycles.samples = samples
+    return samples
+
+
+def set_samples(jobname):
+    """Set samples by user settings.
+
+    Must be restored afer baking!
+    """
+
+    samples = get_samples(jobname)
+    if not bpy.context.scene.cycles.samples == samples:
+        bpy.context.scene.cycles.samples = samples
@@ -4,6 +4,9 @@ from bpy.props import (BoolProperty, EnumProperty, FloatProperty, IntProperty,
 from bpy.types import PropertyGroup
 
 
+AUTO_RESOLUTION_ITEMS = [(str(2 ** i), str(2 ** i), "") for i in range(4, 14)]
+
+
 def color_mode_items(scene, context):
     if scene.file_format in ['PNG', 'TARGA', 'TIFF', 'OPEN_EXR']:
         items = [
@@ -158,6 +161,7 @@ class PBAKER_settings(PropertyGroup):
     resolution: EnumProperty(
         name="Resolution",
         items=(
+            ('AUTO', 'Auto', 'Resolution per image by texel density'),
             ('CUSTOM', 'Custom', ''),
             ('512', '512', ''),
             ('1024', '1024', ''),
@@ -167,6 +171,26 @@ class PBAKER_settings(PropertyGroup):
         default='1024'
     )
 
+    texel_density: FloatProperty(
+        name="Texels per Meter",
+        description="Auto Resolution: Target texel density on the world space surface",
+        default=1024.0,
+        min=1.0,
+        soft_max=16 * 1024.0
+    )
+
+    auto_resolution_min: EnumProperty(
+        name="Min",
+        items=AUTO_RESOLUTION_ITEMS,
+        default='256'
+    )
+
+    auto_resolution_max: EnumProperty(
+        name="Max",
+        items=AUTO_RESOLUTION_ITEMS,
+        default='4096'
+    )
+
     margin: IntProperty(
         name="Margin",
         default=0,
@@ -191,6 +215,194 @@ class PBAKER_settings(PropertyGroup):
         default=False
     )
 
+    use_bake_cache: BoolProperty(
+        name="Bake Cache",
+        description="Skip jobs with unchanged materials, meshes, UV maps and settings since the last bake.\n\nImages of earlier bakes are re-baked on changes, even without Overwrite",
+        default=False
+    )
+
+    use_resume: BoolProperty(
+        name="Resume",
+        description="Continue an interrupted bake. Images finished before the interruption are kept, if intact.\n\nTemporary nodes and materials left behind are removed",
+        default=False
+    )
+
+    use_deterministic_samples: BoolProperty(
+        name="Deterministic Samples",
+        description="Bake jobs without noise (no Ambient Occlusion, Bevel, light dependent or random per island nodes) with Deterministic Samples only.\n\nIndividual Samples are not changed",
+        default=True
+    )
+
+    deterministic_samples: IntProperty(
+        name="Deterministic Samples",
+        description="Samples for jobs without noise. More than 1 sample gives anti-aliasing",
+        default=1,
+        min=1,
+        soft_max=16
+    )
+
+    use_denoise: BoolProperty(
+        name="Denoise",
+        description="Bake Ambient Occlusion and Diffuse with Denoise Samples and denoise inside the UV islands (Open Image Denoise). The margin is rebuilt by extending the denoised texels (Margin Type is not used).\n\nIndividual Samples are not changed",
+        default=False
+    )
+
+    denoise_samples: IntProperty(
+        name="Denoise Samples",
+        description="Samples for denoised jobs",
+        default=16,
+        min=1,
+        soft_max=128
+    )
+
+    use_convergence: BoolProperty(
+        name="Convergence",
+        description="Bake passes with doubled samples and average them, until the image stops changing (error of UV covered texels below threshold). Samples are ignored, deterministic jobs and drafts bake once. Denoised jobs stop at Denoise Samples. With Time Budget, passes stop at the share of the time left.\n\nSee report in Text Editor",
+        default=False
+    )
+
+    convergence_start_samples: IntProperty(
+        name="Start Samples",
+        default=8,
+        min=1,
+        soft_max=256
+    )
+
+    convergence_max_samples: IntProperty(
+        name="Max Samples",
+        default=1024,
+        min=1,
+        soft_max=4096
+    )
+
+    convergence_threshold: FloatProperty(
+        name="Threshold",
+        description="Root mean square error to the previous bake to stop at",
+        default=0.005,
+        min=0.0,
+        soft_max=0.1,
+        precision=4
+    )
+
+    use_convergence_write_samples: BoolProperty(
+        name="Write Samples to Bake List",
+        description="Write the final samples to the samples of the bake list. With Individual Samples the next bake starts at half of them",
+        default=False
+    )
+
+    use_time_budget: BoolProperty(
+        name="Time Budget",
+        description="Lower samples and resolution of remaining jobs to finish in time. Glossiness and combined channels are skipped, if the budget is exceeded.\n\nSee report in Text Editor",
+        default=False
+    )
+
+    time_budget: IntProperty(
+        name="Minutes",
+        default=30,
+        min=1,
+        soft_max=24 * 60
+    )
+
+    use_isolated_scene: BoolProperty(
+        name="Isolated Scene",
+        description="Bake in a temporary scene with only the objects needed. Emission bakes see the bake objects only, Diffuse and Ambient Occlusion also lights and objects within Isolation Radius.\n\nSpeeds up baking in large scenes",
+        default=False
+    )
+
+    use_bake_profiles: BoolProperty(
+        name="Bake Profiles",
+        description="Bake with minimal Cycles settings (bounces, caustics, volume steps, light tree) by bake type. Emission and Normal bakes trace no bounces.\n\nRender settings are restored after baking",
+        default=False
+    )
+
+    use_undo: BoolProperty(
+        name="Undo",
+        description="Bake with an undo step. Without, the undo push after baking is skipped (time and memory of a copy of the scene data). Materials are restored, if baking fails.\n\nCompare runs in the report in Text Editor",
+        default=True
+    )
+
+    use_linked_duplicates: BoolProperty(
+        name="Bake Linked Duplicates Once",
+        description="Batch: bake one object of objects with equal mesh data, materials, UV map and scale. The others get its images.\n\nNot for Ambient Occlusion, Diffuse, modifiers and object dependent nodes (Object Info, Geometry ...). Not with Duplicate Objects, Create New Material and Add New Material",
+        default=False
+    )
+
+    linked_duplicates_output: EnumProperty(
+        name="Linked Duplicates",
+        description="Images of linked duplicates",
+        items=(
+            ('SHARED', 'Shared', 'Use the images of the baked object'),
+            ('COPY', 'Copy', 'Copy images to file names of each object'),
+        ),
+        default='SHARED'
+    )
+
+    use_freeze_meshes: BoolProperty(
+        name="Freeze Modifiers",
+        description="Evaluate modifiers (Subdivision, Displace, Geometry Nodes ...) of bake objects once for all jobs. Original meshes and modifiers are restored after baking.\n\nNot with Auto UV Project, Duplicate Objects, Add New Material and Atlas",
+        default=False
+    )
+
+    use_memory_budget: BoolProperty(
+        name="Memory Budget",
+        description="Unload buffers of saved images, if baked images need more memory than the budget. In Batch mode images of finished objects are unloaded or removed. Materials reload them from file",
+        default=False
+    )
+
+    memory_budget: IntProperty(
+        name="MB",
+        default=2048,
+        min=64,
+        soft_max=64 * 1024
+    )
+
+    isolation_radius: FloatProperty(
+        name="Isolation Radius",
+        description="Objects within this distance to the bounding box of the bake objects occlude Diffuse and Ambient Occlusion bakes",
+        default=5.0,
+        min=0.0,
+        soft_max=100.0,
+        subtype='DISTANCE',
+        unit='LENGTH'
+    )
+
+    draft_scale: EnumProperty(
+        name="Draft Resolution",
+        description="Draft resolution is the resolution divided by this",
+        items=(
+            ('2', '1/2', ''),
+            ('4', '1/4', ''),
+            ('8', '1/8', ''),
+        ),
+        default='4'
+    )
+
+    draft_samples: IntProperty(
+        name="Draft Samples",
+        description="Maximum samples for drafts",
+        default=1,
+        min=1,
+        soft_max=64
+    )
+
+    draft_folder: StringProperty(
+        name="Draft Folder",
+        description="Folder for drafts in the output path. Drafts do not overwrite final images",
+        default="draft",
+        maxlen=1024,
+    )
+
+    draft_final_pass: EnumProperty(
+        name="Final Pass",
+        description="Full quality pass after a draft. It reuses the jobs resolved by the draft.\n\nMaterials of the draft keep the draft images, until Use Final Images",
+        items=(
+            ('NONE', 'None', 'No final pass'),
+            ('MANIFEST', 'Queue', 'Write a manifest for the command line bake to the draft folder'),
+            ('BACKGROUND', 'Background', 'Start the final pass in a background Blender process'),
+        ),
+        default='MANIFEST'
+    )
+
     use_alpha: BoolProperty(
         name="Image Alpha",
         default=False
@@ -330,6 +542,18 @@ class PBAKER_settings(PropertyGroup):
         default=False
     )
 
+    use_udim: BoolProperty(
+        name="UDIM Tiles",
+        description="Bake every used UDIM tile of the UV map to its own image, named by tile number (eg. 'Color.1002.png'). Tiles without faces are skipped.\n\nWith Background Workers (Single/Batch) tiles bake in parallel",
+        default=False
+    )
+
+    udim_tiles: StringProperty(
+        name="Tiles",
+        description="Comma separated tiles to bake, eg. '1001, 1002'. Empty: all used tiles",
+        default=""
+    )
+
     use_batch: BoolProperty(
         name="Single/Batch",
         default=False
@@ -350,6 +574,81 @@ class PBAKER_settings(PropertyGroup):
         default='COMBINED'
     )
 
+    use_partition: BoolProperty(
+        name="Spatial Partition",
+        description="Bake the active object region by region. Every region sees only the high poly objects near it (bounding boxes within Extrusion/Ray Distance), so memory and BVH build time scale with the region.\n\nNot with a Cage Object",
+        default=False
+    )
+
+    partition_regions: IntProperty(
+        name="Regions",
+        description="Number of regions of the active object. Faces are split at the median of the longest axis",
+        default=4,
+        min=1,
+        soft_max=64
+    )
+
+    use_pairs: BoolProperty(
+        name="High/Low Pairs",
+        description="Bake every low poly object with its own high poly objects only. Pairs are found by name suffix or by collection.\n\nWith Background Workers pairs bake in parallel",
+        default=False
+    )
+
+    pair_by: EnumProperty(
+        name="Pair by",
+        items=(
+            ('NAME', 'Name', "Low poly 'Arm_low' with high poly 'Arm_high', 'Arm_high.001' ..."),
+            ('COLLECTION', 'Collection', 'Low poly object with all selected objects of its collection'),
+        ),
+        default='NAME'
+    )
+
+    pair_low_suffix: StringProperty(
+        name="Low Suffix",
+        default="_low"
+    )
+
+    pair_high_suffix: StringProperty(
+        name="High Suffix",
+        default="_high"
+    )
+
+    pair_output: EnumProperty(
+        name="Texture Sets",
+        items=(
+            ('PARTS', 'Per Part', 'A texture set for every low poly object'),
+            ('MERGED', 'Merged', 'Merge all parts into one texture set. UV maps of the low poly objects must not overlap'),
+        ),
+        default='PARTS'
+    )
+
+    pair_set_name: StringProperty(
+        name="Set Name",
+        description="Name of the merged texture set",
+        default="Set"
+    )
+
+    use_atlas: BoolProperty(
+        name="Atlas",
+        description="Bake all objects into one image per job. UV islands of all objects are packed into a shared UV map, scaled by surface area",
+        default=False
+    )
+
+    atlas_margin: FloatProperty(
+        name="Atlas Margin",
+        description="Space between UV islands in the atlas",
+        default=0.005,
+        min=0.0,
+        max=1.0,
+        precision=3
+    )
+
+    atlas_keep_uv_map: BoolProperty(
+        name="Keep Atlas UV Map",
+        description="Keep the atlas UV map on the objects after baking. It is used for rendering by new materials",
+        default=True
+    )
+
     make_new_material: BoolProperty(
         name="Create New Material",
         description="Create new materials",
@@ -611,3 +910,59 @@ class PBAKER_settings(PropertyGroup):
         description='Detect connected inputs in shader nodes.\n\nThis setting is for Autodetect and for manual detection in the Bake List',
         default=True
     )
+
+    use_background_workers: BoolProperty(
+        name="Background Workers",
+        description="Single/Batch: Bake shards of the selected objects in parallel background Blender processes.\n\nThe blend file is saved as a temporary copy for the workers",
+        default=False
+    )
+
+    worker_count: IntProperty(
+        name="Workers",
+        default=4,
+        min=1,
+        soft_max=64
+    )
+
+    use_worker_queue: BoolProperty(
+        name="Job Queue",
+        description="Workers pull single bake jobs from a queue instead of baking fixed shards of objects. Balances uneven objects",
+        default=False
+    )
+
+    worker_threads: IntProperty(
+        name="Threads per Worker",
+        description="Render threads per worker. 0: split all cores between workers",
+        default=0,
+        min=0,
+        soft_max=256
+    )
+
+    worker_retries: IntProperty(
+        name="Retries",
+        description="Restart a crashed worker",
+        default=1,
+        min=0,
+        max=10
+    )
+
+    library_path: StringProperty(
+        name="Library",
+        description="Directory with blend files to bake",
+        default="",
+        subtype='DIR_PATH'
+    )
+
+    library_collection: StringProperty(
+        name="Collection",
+        description="Bake mesh objects in collections with this name",
+        default="",
+        maxlen=1024,
+    )
+
+    library_object_property: StringProperty(
+        name="Object Property",
+        description="Bake mesh objects with this custom property",
+        default="",
+        maxlen=1024,
+    )
@@ -0,0 +1,51 @@
+import bpy
+
+ATLAS_UV_MAP_NAME = "Principled Baker Atlas"
+
+
+def new_atlas_uv_maps(objects, margin):
+    """Copy the active UV map of every object into a new UV map and pack
+    the islands of all objects into one layout, scaled by surface area.
+
+    Must be removed afer baking! See remove_atlas_uv_maps()
+    """
+
+    for obj in objects:
+        uv_layers = obj.data.uv_layers
+        if ATLAS_UV_MAP_NAME in uv_layers:
+            uv_layers.remove(uv_layers[ATLAS_UV_MAP_NAME])
+        uv_layer = uv_layers.new(name=ATLAS_UV_MAP_NAME, do_init=True)
+        uv_layers.active = uv_layer
+
+    view_layer = bpy.context.view_layer
+    active_object = view_layer.objects.active
+    selected_objects = list(bpy.context.selected_objects)
+    for obj in selected_objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    view_layer.objects.active = objects[0]
+
+    tool_settings = bpy.context.scene.tool_settings
+    use_uv_select_sync = tool_settings.use_uv_select_sync
+    tool_settings.use_uv_select_sync = True
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.mesh.select_all(action='SELECT')
+    bpy.ops.uv.average_islands_scale()
+    bpy.ops.uv.pack_islands(rotate=True, margin=margin)
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    tool_settings.use_uv_select_sync = use_uv_select_sync
+    for obj in objects:
+        obj.select_set(False)
+    for obj in selected_objects:
+        obj.select_set(True)
+    view_layer.objects.active = active_object
+
+
+def remove_atlas_uv_maps(objects):
+    for obj in objects:
+        uv_layers = obj.data.uv_layers
+        if ATLAS_UV_MAP_NAME in uv_layers:
+            uv_layers.remove(uv_layers[ATLAS_UV_MAP_NAME])
@@ -0,0 +1,95 @@
+import math
+
+import bpy
+import numpy as np
+
+
+def get_fan_triangles(mesh) -> np.ndarray:
+    """:returns: Loop indices (n, 3) of all polygons split into fan triangles."""
+
+    count = len(mesh.polygons)
+    loop_starts = np.empty(count, dtype=np.int64)
+    loop_totals = np.empty(count, dtype=np.int64)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+
+    tris_per_poly = np.maximum(loop_totals - 2, 0)
+    first = np.repeat(loop_starts, tris_per_poly)
+    tri_starts = np.repeat(np.cumsum(tris_per_poly) - tris_per_poly, tris_per_poly)
+    k = np.arange(len(first)) - tri_starts
+    return np.stack((first, first + k + 1, first + k + 2), axis=1)
+
+
+def get_surface_areas(obj, depsgraph) -> tuple:
+    """:returns: (world space surface area, UV area of active UV map) of evaluated object."""
+
+    eval_obj = obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
+
+    try:
+        if not mesh.uv_layers.active or not len(mesh.polygons):
+            return 0.0, 0.0
+
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+        mesh.vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3)
+
+        # to world space
+        matrix = np.array(obj.matrix_world)
+        co = co @ matrix[:3, :3].T + matrix[:3, 3]
+
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int64)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float64)
+        mesh.uv_layers.active.data.foreach_get("uv", uvs)
+        uvs = uvs.reshape(-1, 2)
+
+        tris = get_fan_triangles(mesh)
+
+        a, b, c = (co[loop_verts[tris[:, i]]] for i in range(3))
+        area = 0.5 * np.linalg.norm(np.cross(b - a, c - a), axis=1).sum()
+
+        a, b, c = (uvs[tris[:, i]] for i in range(3))
+        ab, ac = b - a, c - a
+        uv_area = 0.5 * np.abs(ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0]).sum()
+    finally:
+        eval_obj.to_mesh_clear()
+
+    return float(area), float(uv_area)
+
+
+def get_resolution_by_texel_density(area, uv_area, texels_per_meter, min_resolution, max_resolution) -> int:
+    """:returns: Power of two resolution to get texels per meter on surface area,
+    clamped to min/max. min_resolution, if there is no UV area.
+    """
+
+    if area <= 0 or uv_area <= 0:
+        return min_resolution
+
+    resolution = texels_per_meter * math.sqrt(area / uv_area)
+    resolution = 2 ** math.ceil(math.log2(max(resolution, 1)))
+    return int(min(max(resolution, min_resolution), max_resolution))
+
+
+def get_auto_resolution(objects) -> tuple:
+    """Resolution of one image for objects by user settings.
+
+    :returns: (resolution, world space area, UV area)
+    """
+
+    settings = bpy.context.scene.principled_baker_settings
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+
+    area, uv_area = 0.0, 0.0
+    for obj in objects:
+        a, uv_a = get_surface_areas(obj, depsgraph)
+        area += a
+        uv_area += uv_a
+
+    resolution = get_resolution_by_texel_density(
+        area, uv_area,
+        settings.texel_density,
+        int(settings.auto_resolution_min),
+        int(settings.auto_resolution_max))
+    return resolution, area, uv_area
@@ -0,0 +1,96 @@
+import glob
+import re
+
+import numpy as np
+
+FIRST_TILE = 1001
+
+# tile number in file names, eg. "Color.1002.png"
+TILE_PATTERN = re.compile(r"\.(1\d{3})\.(\w+)$")
+
+
+def get_uvs(mesh) -> np.ndarray:
+    """:returns: Coordinates (n, 2) of active UV map per loop."""
+
+    uvs = np.empty(len(mesh.loops) * 2, dtype=np.float64)
+    mesh.uv_layers.active.data.foreach_get("uv", uvs)
+    return uvs.reshape(-1, 2)
+
+
+def get_udim_tiles(objects) -> list:
+    """:returns: Sorted UDIM tile numbers of active UV maps of objects.
+    A face belongs to the tile of its UV center. Tiles without faces are not returned.
+    """
+
+    tiles = set()
+    for obj in objects:
+        mesh = obj.data
+        if not mesh.uv_layers.active or not len(mesh.polygons):
+            continue
+
+        count = len(mesh.polygons)
+        loop_starts = np.empty(count, dtype=np.int64)
+        loop_totals = np.empty(count, dtype=np.int64)
+        mesh.polygons.foreach_get("loop_start", loop_starts)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+
+        # loops of a polygon are contiguous. order of polygons does not matter here
+        order = np.argsort(loop_starts)
+        centers = np.add.reduceat(get_uvs(mesh), loop_starts[order]) / loop_totals[order, None]
+
+        cols = np.floor(centers[:, 0]).astype(np.int64)
+        rows = np.floor(centers[:, 1]).astype(np.int64)
+        valid = (cols >= 0) & (cols < 10) & (rows >= 0) & (rows < 100)
+        tiles.update((FIRST_TILE + cols[valid] + 10 * rows[valid]).tolist())
+    return sorted(tiles)
+
+
+def get_tile_offset(tile) -> tuple:
+    """:returns: (u, v) of lower left corner of tile."""
+
+    index = tile - FIRST_TILE
+    return index % 10, index // 10
+
+
+def offset_uvs(objects, u, v):
+    """Move active UV maps of objects by (u, v). Shared meshes are moved once.
+
+    Must be moved back afer baking!
+    """
+
+    for mesh in {obj.data for obj in objects}:
+        if not mesh.uv_layers.active:
+            continue
+        uvs = get_uvs(mesh)
+        uvs += (u, v)
+        mesh.uv_layers.active.data.foreach_set("uv", uvs.ravel())
+        mesh.update()
+
+
+def get_tile_file_name(file_name, tile) -> str:
+    """:returns: File name with tile number before the file ending. "Color.png" -> "Color.1002.png" """
+
+    if TILE_PATTERN.search(file_name):
+        return TILE_PATTERN.sub(rf".{tile}.\2", file_name)
+    stem, dot, ending = file_name.rpartition(".")
+    return f"{stem}.{tile}.{ending}" if dot else f"{file_name}.{tile}"
+
+
+def find_tile_files(path) -> dict:
+    """:returns: Existing files of all tiles of UDIM image path. tile number: path"""
+
+    pattern = get_tile_file_name(glob.escape(path), "1[0-9][0-9][0-9]")
+    return {get_tile_number(tile_path): tile_path for tile_path in sorted(glob.glob(pattern))}
+
+
+def get_tile_number(file_name) -> int:
+    """:returns: Tile number in file name. 0 for file names without tile number."""
+
+    match = TILE_PATTERN.search(file_name)
+    return int(match.group(1)) if match else 0
+
+
+def parse_tiles(text) -> set:
+    """:returns: Tile numbers of comma separated text, eg. "1001, 1002". Empty set for empty text."""
+
+    return {int(tile) for tile in re.findall(r"\d+", text)}
@@ -0,0 +1,169 @@
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+# seconds to wait before the first retry of a failed unit. doubled every retry
+RETRY_BACKOFF = 2.0
+
+POLL_INTERVAL = 0.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS units (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    blend_file TEXT NOT NULL,
+    objects TEXT NOT NULL,
+    job TEXT NOT NULL,
+    subjob TEXT NOT NULL DEFAULT '',
+    manifest TEXT NOT NULL DEFAULT '{}',
+    status TEXT NOT NULL DEFAULT 'PENDING',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 1,
+    not_before REAL NOT NULL DEFAULT 0,
+    worker TEXT,
+    started REAL,
+    finished REAL,
+    result TEXT,
+    error TEXT
+)
+"""
+
+COLUMNS = ("id", "blend_file", "objects", "job", "subjob", "manifest",
+           "status", "attempts", "max_attempts", "not_before", "worker",
+           "started", "finished", "result", "error")
+
+
+def get_queue_file(blend_file) -> str:
+    """:returns: Path of queue database next to blend file."""
+
+    path = Path(blend_file)
+    return str(path.with_name(f".{path.stem}_pbaker_queue.sqlite"))
+
+
+def connect(queue_file) -> sqlite3.Connection:
+    """Open queue database. Transactions are started explicitly."""
+
+    conn = sqlite3.connect(queue_file, timeout=60, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(SCHEMA)
+    return conn
+
+
+def remove_queue_file(queue_file):
+    for path in (queue_file, queue_file + "-wal", queue_file + "-shm"):
+        if os.path.isfile(path):
+            os.remove(path)
+
+
+def to_unit(row) -> dict:
+    unit = dict(zip(COLUMNS, row))
+    unit["objects"] = json.loads(unit["objects"])
+    unit["manifest"] = json.loads(unit["manifest"])
+    if unit["result"]:
+        unit["result"] = json.loads(unit["result"])
+    return unit
+
+
+def enqueue(conn, blend_file, units, manifest=None, max_attempts=1):
+    """Add units to queue.
+
+    Unit: {"objects": [names, first is active], "job": jobname, "subjob": vertex color name}
+    manifest: Settings for all units (see apply_manifest()).
+    """
+
+    manifest = json.dumps(manifest or {})
+    conn.execute("BEGIN IMMEDIATE")
+    conn.executemany(
+        "INSERT INTO units (blend_file, objects, job, subjob, manifest, max_attempts) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [(blend_file, json.dumps(unit["objects"]), unit["job"],
+          unit.get("subjob", ""), manifest, max_attempts) for unit in units])
+    conn.execute("COMMIT")
+
+
+def claim_unit(conn, worker_id):
+    """Atomically claim the next pending unit.
+
+    :returns: Unit dictionary. None, if no unit is ready.
+    """
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute(
+            "SELECT * FROM units WHERE status = 'PENDING' AND not_before <= ? "
+            "ORDER BY id LIMIT 1", (time.time(),)).fetchone()
+        if row is None:
+            conn.execute("COMMIT")
+            return None
+        conn.execute(
+            "UPDATE units SET status = 'RUNNING', worker = ?, started = ?, "
+            "attempts = attempts + 1 WHERE id = ?",
+            (worker_id, time.time(), row[0]))
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+    unit = to_unit(row)
+    unit["attempts"] += 1
+    return unit
+
+
+def finish_unit(conn, unit_id, result):
+    conn.execute(
+        "UPDATE units SET status = 'DONE', finished = ?, result = ?, error = NULL "
+        "WHERE id = ?", (time.time(), json.dumps(result), unit_id))
+
+
+def fail_unit(conn, unit_id, error):
+    """Retry unit with backoff or mark it as failed after max_attempts."""
+
+    conn.execute("BEGIN IMMEDIATE")
+    attempts, max_attempts = conn.execute(
+        "SELECT attempts, max_attempts FROM units WHERE id = ?", (unit_id,)).fetchone()
+    if attempts < max_attempts:
+        conn.execute(
+            "UPDATE units SET status = 'PENDING', worker = NULL, error = ?, not_before = ? "
+            "WHERE id = ?",
+            (error, time.time() + RETRY_BACKOFF * 2 ** (attempts - 1), unit_id))
+    else:
+        conn.execute(
+            "UPDATE units SET status = 'FAILED', finished = ?, error = ? WHERE id = ?",
+            (time.time(), error, unit_id))
+    conn.execute("COMMIT")
+
+
+def release_units(conn, worker_id=None, error="Worker crashed"):
+    """Fail running units of a crashed worker (of all workers without worker_id)."""
+
+    if worker_id is None:
+        rows = conn.execute("SELECT id FROM units WHERE status = 'RUNNING'").fetchall()
+    else:
+        rows = conn.execute("SELECT id FROM units WHERE status = 'RUNNING' AND worker = ?",
+                            (worker_id,)).fetchall()
+    for (unit_id,) in rows:
+        fail_unit(conn, unit_id, error)
+
+
+def get_wait_time(conn):
+    """:returns: Seconds to wait for the next unit. None, if queue is drained."""
+
+    pending = conn.execute(
+        "SELECT MIN(not_before) FROM units WHERE status = 'PENDING'").fetchone()[0]
+    if pending is not None:
+        return min(max(0, pending - time.time()), POLL_INTERVAL)
+
+    # running units may fail and come back
+    running = conn.execute(
+        "SELECT COUNT(*) FROM units WHERE status = 'RUNNING'").fetchone()[0]
+    return POLL_INTERVAL if running else None
+
+
+def get_units(conn, status=None) -> list:
+    if status is None:
+        rows = conn.execute("SELECT * FROM units ORDER BY id").fetchall()
+    else:
+        rows = conn.execute("SELECT * FROM units WHERE status = ? ORDER BY id",
+                            (status,)).fetchall()
+    return [to_unit(row) for row in rows]
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from ..worker.spawn import run_workers
+
+INDEX_FILE_NAME = ".pbaker_library_index.json"
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def find_blend_files(directory) -> list:
+    """:returns: Sorted paths of all blend files in directory tree.
+    Hidden files (eg. worker copies) are skipped.
+    """
+
+    return sorted(str(p) for p in Path(directory).rglob("*.blend")
+                  if not p.name.startswith("."))
+
+
+def get_file_hash(path, manifest) -> str:
+    """:returns: Hash of file content and bake manifest."""
+
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    h.update(json.dumps(manifest, sort_keys=True).encode('utf-8'))
+    return h.hexdigest()
+
+
+def read_index(directory) -> dict:
+    path = Path(directory) / INDEX_FILE_NAME
+    if not path.is_file():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_index(directory, index):
+    path = Path(directory) / INDEX_FILE_NAME
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def are_outputs_intact(entry) -> bool:
+    return all(os.path.isfile(path)
+               for images in entry.get("outputs", {}).values()
+               for path in images.values())
+
+
+def bake_library(directory, manifest, worker_count, threads=0, retries=0) -> dict:
+    """Bake all blend files in directory tree with a pool of background workers.
+
+    Objects to bake are found per file by "collections" and/or
+    "object_property" in manifest. Files with unchanged content and
+    intact outputs since the last run are skipped. The index is written
+    after every file, so an interrupted run keeps the files baked so far.
+
+    :returns: Dictionary with lists of "baked", "skipped" and "failed" files
+        and "errors" (worker log tail) by failed file.
+    """
+
+    index = read_index(directory)
+    summary = {"baked": [], "skipped": [], "failed": [], "errors": {}}
+
+    jobs = []
+    hashes = {}
+    for path in find_blend_files(directory):
+        rel_path = os.path.relpath(path, directory)
+        hashes[rel_path] = get_file_hash(path, manifest)
+
+        entry = index.get(rel_path)
+        if entry and entry["hash"] == hashes[rel_path] and are_outputs_intact(entry):
+            summary["skipped"].append(rel_path)
+            continue
+
+        job = dict(manifest)
+        job["blend_file"] = path
+        jobs.append((rel_path, job))
+
+    def add_result(job_index, result):
+        rel_path = jobs[job_index][0]
+        # cancelled bakes (eg. invalid settings) fail with an error
+        if "error" in result:
+            summary["failed"].append(rel_path)
+            summary["errors"][rel_path] = result["error"]
+            index.pop(rel_path, None)
+        else:
+            summary["baked"].append(rel_path)
+            index[rel_path] = {"hash": hashes[rel_path],
+                               "outputs": result["objects"]}
+        write_index(directory, index)
+
+    run_workers(None, [job for _, job in jobs],
+                worker_count=worker_count,
+                threads=threads,
+                retries=retries,
+                on_result=add_result)
+
+    summary["baked"].sort()
+    summary["failed"].sort()
+    return summary
@@ -0,0 +1,214 @@
+import json
+
+import bpy
+
+# additional bake types are switched on by settings, not by the bake list
+ADDITIONAL_BAKE_TYPES = {
+    "Diffuse": "use_Diffuse",
+    "Glossiness": "use_invert_roughness",
+    "Bump": "use_Bump",
+    "Vertex Color": "use_vertex_color",
+    "Material ID": "use_material_id",
+    "Wireframe": "use_wireframe",
+}
+
+ADDITIONAL_BAKE_TYPES_SAMPLES = {
+    "Diffuse": "samples_diffuse",
+    "Bump": "samples_bump",
+    "Vertex Color": "samples_vertex_color",
+    "Material ID": "samples_material_id",
+    "Wireframe": "samples_wireframe",
+}
+
+RESOLUTIONS = {'AUTO', '512', '1024', '2048', '4096'}
+
+CHANNELS = {'R': '0', 'G': '1', 'B': '2', 'A': '3'}
+
+
+def read_manifest(path) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def get_manifest_objects(manifest) -> list:
+    """:returns: Objects by names, collections and custom property in manifest.
+    First one is active. Objects of collections and by custom property must be
+    in the view layer (eg. not in excluded collections), to be selected.
+    """
+
+    objects = [bpy.data.objects[name] for name in manifest.get("objects", [])]
+
+    candidates = []
+    for coll_name in manifest.get("collections", []):
+        if coll_name in bpy.data.collections:
+            candidates.extend(bpy.data.collections[coll_name].all_objects)
+
+    prop = manifest.get("object_property")
+    if prop:
+        candidates.extend(obj for obj in bpy.context.scene.objects
+                          if obj.get(prop))
+
+    view_layer_objects = bpy.context.view_layer.objects
+    for obj in candidates:
+        if obj.type == 'MESH' and obj not in objects and obj.name in view_layer_objects:
+            objects.append(obj)
+    return objects
+
+
+def select_objects(objects):
+    """Select objects and make first one active."""
+
+    view_layer = bpy.context.view_layer
+    for obj in view_layer.objects:
+        obj.select_set(False)
+
+    for obj in objects:
+        obj.select_set(True)
+    view_layer.objects.active = objects[0] if objects else None
+
+
+def get_manifest_from_scene(scene) -> dict:
+    """:returns: Manifest with all Principled Baker settings of scene."""
+
+    settings = scene.principled_baker_settings
+    manifest = {"settings": {}}
+    for prop in settings.bl_rna.properties:
+        if prop.identifier == 'rna_type' or prop.type in {'POINTER', 'COLLECTION'}:
+            continue
+        value = getattr(settings, prop.identifier)
+        if getattr(prop, "is_array", False):
+            value = list(value)
+        manifest["settings"][prop.identifier] = value
+
+    if not settings.use_autodetect:
+        manifest["jobs"] = [jobname for jobname, item in scene.principled_baker_bakelist.items()
+                            if item.do_bake]
+        manifest["jobs"].extend(jobname for jobname, prop in ADDITIONAL_BAKE_TYPES.items()
+                                if getattr(settings, prop))
+        if settings.individual_samples:
+            manifest["samples"] = {jobname: item.samples for jobname, item
+                                   in scene.principled_baker_bakelist.items()}
+
+    manifest["suffixes"] = {jobname: item.suffix for jobname, item
+                            in scene.principled_baker_suffixlist.items()}
+
+    manifest["combine"] = []
+    for item in scene.principled_baker_combinelist:
+        rule = {"name": item.name, "suffix": item.suffix,
+                "do_combine": item.do_combine}
+        for c in "rgba":
+            rule[c] = getattr(item, f"channel_{c}")
+            rule[f"{c}_from"] = getattr(item, f"channel_{c}_from_channel")
+            rule[f"{c}_invert"] = getattr(item, f"channel_{c}_invert")
+        manifest["combine"].append(rule)
+
+    return manifest
+
+
+def apply_jobs(scene, jobs):
+    """Bake exactly the given jobs. Disables Autodetect."""
+
+    settings = scene.principled_baker_settings
+    settings.use_autodetect = False
+    settings.use_shortlist = False
+
+    bakelist = scene.principled_baker_bakelist
+    bakelist.clear()
+    bpy.ops.principled_baker_bakelist.init()
+    for jobname, item in bakelist.items():
+        item.do_bake = jobname in jobs
+
+    for jobname, prop in ADDITIONAL_BAKE_TYPES.items():
+        setattr(settings, prop, jobname in jobs)
+
+
+def apply_samples(scene, samples):
+    """Samples as number or as dictionary by job name."""
+
+    settings = scene.principled_baker_settings
+    if not isinstance(samples, dict):
+        settings.samples = samples
+        settings.individual_samples = False
+        return
+
+    settings.individual_samples = True
+    bakelist = scene.principled_baker_bakelist
+    for jobname, value in samples.items():
+        if jobname in bakelist:
+            bakelist[jobname].samples = value
+        elif jobname in ADDITIONAL_BAKE_TYPES_SAMPLES:
+            setattr(settings, ADDITIONAL_BAKE_TYPES_SAMPLES[jobname], value)
+
+
+def apply_resolution(scene, resolution):
+    settings = scene.principled_baker_settings
+    if str(resolution) in RESOLUTIONS:
+        settings.resolution = str(resolution)
+    else:
+        settings.resolution = 'CUSTOM'
+        settings.custom_resolution = int(resolution)
+
+
+def apply_suffixes(scene, suffixes):
+    if not len(scene.principled_baker_suffixlist):
+        bpy.ops.principled_baker_suffixlist.init()
+
+    suffixlist = scene.principled_baker_suffixlist
+    for jobname, suffix in suffixes.items():
+        if jobname in suffixlist:
+            suffixlist[jobname].suffix = suffix
+        else:
+            item = suffixlist.add()
+            item.name = jobname
+            item.suffix = suffix
+
+
+def apply_combine_rules(scene, rules):
+    """Replace Combine List.
+
+    Rule: {"suffix": "_orm", "r": "Ambient Occlusion", "r_from": "R",
+    "r_invert": false, ...}
+    """
+
+    combinelist = scene.principled_baker_combinelist
+    combinelist.clear()
+    for rule in rules:
+        item = combinelist.add()
+        item.name = rule.get("name", "Combine")
+        item.suffix = rule.get("suffix", item.suffix)
+        item.do_combine = rule.get("do_combine", True)
+        for c in "rgba":
+            setattr(item, f"channel_{c}", rule.get(c, 'None'))
+            from_channel = rule.get(f"{c}_from", c.upper())
+            setattr(item, f"channel_{c}_from_channel",
+                    CHANNELS.get(from_channel, from_channel))
+            setattr(item, f"channel_{c}_invert", rule.get(f"{c}_invert", False))
+
+
+def apply_manifest(scene, manifest):
+    """Fill Principled Baker settings of scene from manifest.
+
+    Keys (all optional): "settings" (any setting by property name),
+    "bake_mode", "jobs", "resolution", "samples", "file_format",
+    "file_path", "suffixes", "combine".
+    """
+
+    settings = scene.principled_baker_settings
+
+    for name, value in manifest.get("settings", {}).items():
+        setattr(settings, name, value)
+
+    for name in ("bake_mode", "file_format", "file_path"):
+        if name in manifest:
+            setattr(settings, name, manifest[name])
+
+    if "jobs" in manifest:
+        apply_jobs(scene, manifest["jobs"])
+    if "samples" in manifest:
+        apply_samples(scene, manifest["samples"])
+    if "resolution" in manifest:
+        apply_resolution(scene, manifest["resolution"])
+    if "suffixes" in manifest:
+        apply_suffixes(scene, manifest["suffixes"])
+    if "combine" in manifest:
+        apply_combine_rules(scene, manifest["combine"])
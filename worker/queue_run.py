@@ -0,0 +1,86 @@
+import json
+import os
+import socket
+import tempfile
+import time
+import traceback
+
+import bpy
+
+from ..worker.job_queue import (claim_unit, connect, fail_unit, finish_unit,
+                                get_wait_time, release_units)
+from ..worker.manifest import apply_manifest, read_manifest, select_objects
+from ..worker.run import get_job_file
+
+
+def bake_unit(unit, tmp_dir) -> dict:
+    """Bake one unit with the Bake operator, restricted by a plan of one unit.
+
+    :returns: Baked image paths. "object name":{"name":path}
+    """
+
+    blend_file = os.path.abspath(unit["blend_file"])
+    if not bpy.data.filepath or not os.path.samefile(bpy.data.filepath, blend_file):
+        bpy.ops.wm.open_mainfile(filepath=blend_file)
+
+    apply_manifest(bpy.context.scene, unit["manifest"])
+    select_objects([bpy.data.objects[name] for name in unit["objects"]])
+
+    plan_file = os.path.join(tmp_dir, f"plan_{unit['id']}.json")
+    result_file = os.path.join(tmp_dir, f"result_{unit['id']}.json")
+    with open(plan_file, 'w') as f:
+        json.dump({"errors": [],
+                   "units": [{"object": unit["objects"][0],
+                              "job": unit["job"],
+                              "subjob": unit["subjob"]}]}, f)
+
+    ret = bpy.ops.object.principled_baker_bake(
+        result_file=result_file, plan_file=plan_file, use_journal=False,
+        draft=unit["manifest"].get("draft", False))
+    if 'FINISHED' not in ret or not os.path.isfile(result_file):
+        raise RuntimeError(f"Baking cancelled: {ret}")
+
+    result = read_manifest(result_file)["objects"]
+    if not result.get(unit["objects"][0]):
+        raise RuntimeError("Nothing baked. See log for reports.")
+    return result
+
+
+def main():
+    """Entry point for queue workers.
+
+    Job file: {"queue": path to queue database, "worker_id": name,
+    "result_file": path}. Claims and bakes units until the queue is drained.
+    """
+
+    job = read_manifest(get_job_file())
+    worker_id = job.get("worker_id") or f"{socket.gethostname()}-{os.getpid()}"
+
+    conn = connect(job["queue"])
+
+    # units of a crashed run of this worker
+    release_units(conn, worker_id)
+
+    with tempfile.TemporaryDirectory(prefix="pbaker_unit_") as tmp_dir:
+        while True:
+            unit = claim_unit(conn, worker_id)
+            if unit is None:
+                wait = get_wait_time(conn)
+                if wait is None:
+                    break
+                time.sleep(wait)
+                continue
+
+            try:
+                result = bake_unit(unit, tmp_dir)
+            except Exception:
+                traceback.print_exc()
+                fail_unit(conn, unit["id"], traceback.format_exc())
+            else:
+                finish_unit(conn, unit["id"], result)
+
+    conn.close()
+
+    if job.get("result_file"):
+        with open(job["result_file"], 'w') as f:
+            json.dump({"objects": {}}, f)
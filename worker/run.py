@@ -0,0 +1,52 @@
+import json
+import os
+import sys
+
+import bpy
+
+from ..worker.manifest import (apply_manifest, get_manifest_objects,
+                               read_manifest, select_objects)
+from ..worker.spawn import remove_worker_file
+
+
+def get_job_file() -> str:
+    """:returns: Path to job file (first argument after '--')."""
+
+    argv = sys.argv
+    if "--" not in argv:
+        return ""
+    args = argv[argv.index("--") + 1:]
+    return args[0] if args else ""
+
+
+def main():
+    """Entry point for background workers.
+
+    Runs inside 'blender -b <file> --python-expr ... -- <job file>'.
+    The job file is a manifest (see apply_manifest()) with a "result_file".
+    A cancelled bake (eg. invalid settings) writes an "error" result.
+    """
+
+    job = read_manifest(get_job_file())
+
+    apply_manifest(bpy.context.scene, job)
+
+    result_file = job["result_file"]
+    objects = get_manifest_objects(job)
+    if objects:
+        select_objects(objects)
+        ret = bpy.ops.object.principled_baker_bake(
+            result_file=result_file, plan_file=job.get("plan_file", ""),
+            use_journal=False, draft=job.get("draft", False))
+        if 'CANCELLED' in ret:
+            with open(result_file, 'w') as f:
+                json.dump({"objects": {}, "error": "Bake cancelled."}, f)
+
+    # nothing baked is no crash
+    if not os.path.isfile(result_file):
+        with open(result_file, 'w') as f:
+            json.dump({"objects": {}}, f)
+
+    # temporary copy (eg. final pass of a draft)
+    if job.get("remove_blend_file"):
+        remove_worker_file(bpy.data.filepath)
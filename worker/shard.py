@@ -0,0 +1,34 @@
+from ..joblist import get_joblist_from_objects
+
+
+def get_object_cost(obj) -> int:
+    """:returns: Estimated bake cost of an object by polycount and job count."""
+
+    job_count = len(get_joblist_from_objects([obj]))
+    return len(obj.data.polygons) * max(job_count, 1)
+
+
+def split_into_shards(objects, shard_count, get_cost=get_object_cost) -> list:
+    """Split objects into shards of about equal cost.
+
+    Heaviest objects are scheduled first, in the heaviest shard first.
+
+    :returns: List of lists of objects.
+    """
+
+    costs = {obj: get_cost(obj) for obj in objects}
+    objects_sorted = sorted(objects, key=lambda obj: costs[obj], reverse=True)
+
+    shard_count = max(1, min(shard_count, len(objects_sorted)))
+    shards = [[] for _ in range(shard_count)]
+    loads = [0] * shard_count
+
+    # greedy: next heaviest object to the lightest shard
+    for obj in objects_sorted:
+        i = loads.index(min(loads))
+        shards[i].append(obj)
+        loads[i] += costs[obj]
+
+    shards = [s for _, s in sorted(zip(loads, shards),
+                                   key=lambda x: x[0], reverse=True)]
+    return [s for s in shards if s]
@@ -0,0 +1,170 @@
+import json
+import os
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import bpy
+
+from ..const import PB_PACKAGE
+
+WORKER_EXPR = ("import addon_utils, importlib; "
+               "addon_utils.enable('{0}'); "
+               "importlib.import_module('{0}.{1}').main()")
+
+POLL_INTERVAL = 0.2
+
+# lines of the worker log in the result of a failed job
+LOG_TAIL_LINES = 20
+
+
+def get_worker_threads(worker_count, threads=0) -> int:
+    """:returns: Render threads per worker. 0 splits all cores between workers."""
+
+    if threads:
+        return threads
+    return max(1, (os.cpu_count() or 1) // max(1, worker_count))
+
+
+def get_worker_command(blend_file, job_file, threads=0, module="worker.run") -> list:
+    """:returns: Command line to run a job file in a background Blender.
+
+    module: Module of this add-on with the main() entry point.
+    """
+
+    cmd = [bpy.app.binary_path, "-b", blend_file]
+    if threads:
+        cmd.extend(["-t", str(threads)])
+    cmd.extend(["--python-exit-code", "1",
+                "--python-expr", WORKER_EXPR.format(PB_PACKAGE, module),
+                "--", job_file])
+    return cmd
+
+
+def save_worker_file(suffix="worker") -> str:
+    """Save a copy of the current blend file for background workers.
+
+    The copy is saved next to the original, so relative paths stay valid.
+    Must be removed afer baking!
+
+    :returns: Path to copy.
+    """
+
+    path = Path(bpy.data.filepath)
+    worker_file = path.with_name(f".{path.stem}_pbaker_{suffix}.blend")
+    bpy.ops.wm.save_as_mainfile(filepath=str(worker_file), copy=True)
+    return str(worker_file)
+
+
+def remove_worker_file(worker_file):
+    for path in (worker_file, worker_file + "1"):  # incl. backup file
+        if os.path.isfile(path):
+            os.remove(path)
+
+
+def get_log_tail(log_file, lines=LOG_TAIL_LINES) -> str:
+    """:returns: Last lines of log file."""
+
+    with open(log_file, errors='replace') as f:
+        return "".join(f.readlines()[-lines:])
+
+
+def start_worker(blend_file, job_file, log_file, threads=0, module="worker.run") -> subprocess.Popen:
+    """Start a background Blender without waiting for it."""
+
+    cmd = get_worker_command(blend_file, job_file, threads, module)
+    with open(log_file, 'w') as log:
+        return subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT)
+
+
+def iter_workers(blend_file, jobs, worker_count, threads=0, retries=0, module="worker.run",
+                 on_result=None):
+    """Generator to run jobs in parallel background Blender processes.
+    Yields seconds to wait before the next poll, so a modal operator can
+    poll between its timer events. Closing the generator kills running workers.
+
+    Every job is a dictionary, written to a job file for the worker.
+    module: Module with the main() entry point of the worker.
+    on_result: Called with (job index, result) for every finished or failed job.
+    A job with a "blend_file" is run on that file instead of 'blend_file'.
+    A crashed worker is restarted up to 'retries' times. Results of
+    finished jobs are kept. Cancelled bakes are not restarted.
+
+    :returns: List of results (dict) in order of jobs, as value of StopIteration.
+        Failed jobs: {"error": last lines of the worker log}
+    """
+
+    results = [None] * len(jobs)
+    attempts = [0] * len(jobs)
+    pending = list(range(len(jobs)))
+    running = {}  # process: (job index, log file)
+
+    threads = get_worker_threads(worker_count, threads)
+
+    with tempfile.TemporaryDirectory(prefix="pbaker_") as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+
+        def start(index):
+            job = dict(jobs[index])
+            job["result_file"] = str(tmp_dir / f"result_{index}.json")
+            job_file = tmp_dir / f"job_{index}.json"
+            with open(job_file, 'w') as f:
+                json.dump(job, f)
+            log = open(tmp_dir / f"log_{index}_{attempts[index]}.txt", 'w')
+            cmd = get_worker_command(job.get("blend_file", blend_file),
+                                     str(job_file), threads, module)
+            proc = subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT)
+            running[proc] = (index, log)
+            attempts[index] += 1
+
+        def finish(proc):
+            index, log = running.pop(proc)
+            log.close()
+            result_file = tmp_dir / f"result_{index}.json"
+            if proc.returncode == 0 and result_file.is_file():
+                with open(result_file) as f:
+                    results[index] = json.load(f)
+                if "error" in results[index]:
+                    # reports of the cancelled bake are in the log
+                    results[index]["error"] += "\n" + get_log_tail(log.name)
+            elif attempts[index] <= retries:
+                pending.append(index)  # retry crashed worker
+            else:
+                results[index] = {"error": get_log_tail(log.name)}
+            if on_result and results[index] is not None:
+                on_result(index, results[index])
+
+        try:
+            while pending or running:
+                while pending and len(running) < worker_count:
+                    start(pending.pop(0))
+
+                yield POLL_INTERVAL
+
+                for proc in [p for p in running if p.poll() is not None]:
+                    finish(proc)
+        finally:
+            # closed generator (eg. cancelled bake)
+            for proc, (_, log) in running.items():
+                proc.kill()
+                proc.wait()
+                log.close()
+
+    return results
+
+
+def run_workers(blend_file, jobs, worker_count, threads=0, retries=0, module="worker.run",
+                on_result=None) -> list:
+    """Run jobs in parallel background Blender processes. Blocks until all jobs are done.
+    See iter_workers()
+
+    :returns: List of results (dict) in order of jobs.
+    """
+
+    steps = iter_workers(blend_file, jobs, worker_count, threads, retries, module, on_result)
+    while True:
+        try:
+            time.sleep(next(steps))
+        except StopIteration as stop:
+            return stop.value